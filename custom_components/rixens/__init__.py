@@ -3,11 +3,18 @@
 from __future__ import annotations
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_HOST, EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import Event, HomeAssistant, callback
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
+from .api import shutdown_parse_executor
+from .const import CONF_PORT, DEFAULT_PORT, DOMAIN
 from .coordinator import RixensCoordinator
+from .handoff import async_pop_validated
+from .services import async_setup_services
+from .store import async_remove_entry_stores
+from .websocket_api import async_setup_websocket_api
 
 PLATFORMS: list[Platform] = [
     Platform.BINARY_SENSOR,
@@ -17,17 +24,58 @@ PLATFORMS: list[Platform] = [
     Platform.SWITCH,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Rixens integration."""
+    async_setup_services(hass)
+    async_setup_websocket_api(hass)
+
+    @callback
+    def _async_shutdown_parse_executor(_event: Event) -> None:
+        """Stop the status parse thread with Home Assistant."""
+        shutdown_parse_executor()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_shutdown_parse_executor)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Rixens from a config entry."""
     coordinator = RixensCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    await coordinator.async_load()
+    if (
+        validated := async_pop_validated(
+            hass, entry.data[CONF_HOST], entry.data.get(CONF_PORT, DEFAULT_PORT)
+        )
+    ) is not None:
+        # The config flow just fetched this snapshot
+        coordinator.async_seed(validated)
+    elif await coordinator.async_restore_snapshot():
+        # Don't block startup on an unreachable heater; connect in the background
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} refresh {entry.entry_id}"
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    coordinator.schedule.async_start()
+    entry.async_on_unload(coordinator.schedule.async_stop)
+
+    async def _async_flush_statistics(_event: Event) -> None:
+        """Import the hour in progress before the recorder shuts down."""
+        await coordinator.statistics.async_flush()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_flush_statistics)
+    )
+
     # Register update listener for options changes
     entry.async_on_unload(entry.add_update_listener(async_update_options))
 
@@ -35,13 +83,27 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 
 async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Handle options update."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Handle options update.
+
+    Options are applied to the running coordinator and entities in place;
+    only a change of connection settings reloads the entry.
+    """
+    coordinator: RixensCoordinator = hass.data[DOMAIN][entry.entry_id]
+    if not coordinator.async_apply_options():
+        await hass.config_entries.async_reload(entry.entry_id)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: RixensCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.statistics.async_flush()
+        if not hass.data[DOMAIN]:
+            shutdown_parse_executor()
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove persisted data when a config entry is deleted."""
+    await async_remove_entry_stores(hass, entry.entry_id)
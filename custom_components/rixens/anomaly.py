@@ -0,0 +1,200 @@
+"""Streaming anomaly detection on Rixens heater telemetry."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+
+from .api import RixensHeaterData
+from .const import (
+    ANOMALIES,
+    ANOMALY_COOLANT_STALL,
+    ANOMALY_FLAME_OUT,
+    ANOMALY_MOTOR_STALL,
+    ANOMALY_VOLTAGE_SAG,
+    HEATER_STATE_RUNNING,
+)
+
+EWMA_ALPHA = 0.1  # weight of the newest sample, ~10 polls to follow a level change
+MIN_SAMPLES = 12  # one minute of polls before anything is flagged
+SIGMA = 4.0  # deviations beyond this many standard deviations are anomalous
+RAISE_POLLS = 2  # consecutive anomalous polls before an anomaly is raised
+CLEAR_POLLS = 3  # consecutive normal polls before it is cleared
+
+
+class RunningStats:
+    """Constant-memory statistics of one telemetry field.
+
+    The EWMA follows the level of the field. Welford's algorithm tracks the
+    mean and variance of the residual (sample minus the EWMA before it), an
+    online estimate of the noise around that level.
+    """
+
+    __slots__ = ("count", "ewma", "m2", "mean")
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all samples."""
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.ewma: float | None = None
+
+    @property
+    def std(self) -> float:
+        """Return the standard deviation of the residuals."""
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def residual(self, value: float) -> float:
+        """Return how far a sample is from the current level."""
+        return 0.0 if self.ewma is None else value - self.ewma
+
+    def add(self, value: float, learn: bool = True) -> None:
+        """Add a sample.
+
+        With learn False the level still follows the sample, but the
+        noise estimate is left alone so an anomaly does not widen its own
+        threshold.
+        """
+        if self.ewma is None:
+            self.ewma = value
+        else:
+            if learn:
+                residual = value - self.ewma
+                self.count += 1
+                delta = residual - self.mean
+                self.mean += delta / self.count
+                self.m2 += delta * (residual - self.mean)
+            self.ewma += EWMA_ALPHA * (value - self.ewma)
+
+
+@dataclass(slots=True)
+class AnomalyState:
+    """Debounced state of one anomaly."""
+
+    active: bool = False
+    streak: int = 0  # consecutive polls disagreeing with `active`
+    value: float | None = None
+    expected: float | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class AnomalyTransition:
+    """An anomaly that was raised or cleared by the latest sample."""
+
+    anomaly: str
+    active: bool
+    value: float
+    expected: float | None
+
+
+@dataclass(frozen=True, slots=True)
+class _Rule:
+    """Deviation that counts as anomalous for one field."""
+
+    anomaly: str
+    direction: int  # -1 for drops, 1 for rises
+    min_deviation: float  # floor for the threshold, in the field's unit
+
+
+# A flame-out is a flame temperature drop while the burner is running, a
+# coolant-loop stall shows as the outlet-inlet difference rising while the
+# burner runs, and a sag as the battery voltage dropping. A motor stall is
+# the burner motor slowing down sharply while the heater is in its running
+# state; the floor is well above the lag of the level behind the gradual
+# speed changes of power modulation.
+FLAME_OUT = _Rule(ANOMALY_FLAME_OUT, -1, 25.0)
+COOLANT_STALL = _Rule(ANOMALY_COOLANT_STALL, 1, 8.0)
+VOLTAGE_SAG = _Rule(ANOMALY_VOLTAGE_SAG, -1, 0.7)
+MOTOR_STALL = _Rule(ANOMALY_MOTOR_STALL, -1, 1500.0)
+
+
+class RixensAnomalyDetector:
+    """Flag flame-out, coolant-loop stall, voltage sag and motor stall on every poll.
+
+    Each poll does a fixed amount of arithmetic on four running statistics;
+    no history or recorder data is consulted. Flame and temperature
+    difference statistics only learn while the burner is running and start
+    over on each ignition, since their levels while off or warming up say
+    nothing about a running burner. Burner motor statistics learn while the
+    heater is in its running state, so a motor that stops is still checked,
+    and start over each time the heater enters it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the detector."""
+        self.flame = RunningStats()
+        self.temperature_delta = RunningStats()
+        self.battery = RunningStats()
+        self.motor = RunningStats()
+        self.states: dict[str, AnomalyState] = {name: AnomalyState() for name in ANOMALIES}
+        self._running = False
+        self._burning = False
+
+    @property
+    def active(self) -> tuple[str, ...]:
+        """Return the names of the active anomalies."""
+        return tuple(name for name, state in self.states.items() if state.active)
+
+    def update(self, heater: RixensHeaterData) -> list[AnomalyTransition]:
+        """Process the heater data of a fresh snapshot.
+
+        Returns:
+            The anomalies raised or cleared by this sample
+        """
+        transitions: list[AnomalyTransition] = []
+        burning = heater.heater_state == HEATER_STATE_RUNNING
+        running = burning and heater.burner_motor > 0
+        if running and not self._running:
+            self.flame.reset()
+            self.temperature_delta.reset()
+        if burning and not self._burning:
+            self.motor.reset()
+        self._running = running
+        self._burning = burning
+
+        self._check(transitions, VOLTAGE_SAG, self.battery, heater.battery_voltage, True)
+        self._check(transitions, FLAME_OUT, self.flame, heater.flame_temp, running)
+        self._check(
+            transitions,
+            COOLANT_STALL,
+            self.temperature_delta,
+            heater.outlet_temp - heater.inlet_temp,
+            running,
+        )
+        self._check(transitions, MOTOR_STALL, self.motor, heater.burner_motor, burning)
+        return transitions
+
+    def _check(
+        self,
+        transitions: list[AnomalyTransition],
+        rule: _Rule,
+        stats: RunningStats,
+        value: float,
+        enabled: bool,
+    ) -> None:
+        """Evaluate one rule against a sample and then learn from it."""
+        state = self.states[rule.anomaly]
+        anomalous = False
+        if enabled and stats.count >= MIN_SAMPLES:
+            threshold = max(rule.min_deviation, SIGMA * stats.std)
+            anomalous = rule.direction * stats.residual(value) > threshold
+
+        expected = stats.ewma
+        if enabled:
+            stats.add(value, learn=not anomalous and not state.active)
+
+        if anomalous == state.active:
+            state.streak = 0
+        else:
+            state.streak += 1
+            if state.streak >= (CLEAR_POLLS if state.active else RAISE_POLLS):
+                state.active = anomalous
+                state.streak = 0
+                transitions.append(AnomalyTransition(rule.anomaly, anomalous, value, expected))
+        if anomalous or state.active:
+            state.value = value
+            state.expected = expected
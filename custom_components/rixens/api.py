@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import logging
 from dataclasses import dataclass
-from typing import Any
+import sys
+import time
+from typing import Any, Final
 from xml.etree import ElementTree
 
 import aiohttp
@@ -16,10 +19,48 @@ DEFAULT_TIMEOUT = 10
 MAX_RETRIES = 3
 RETRY_DELAY = 1  # seconds
 
+# Status payloads are parsed in an executor instead of on the event loop when
+# they are larger than this, or when parses have recently taken longer
+PARSE_OFFLOAD_BYTES = 32_768
+PARSE_OFFLOAD_SECONDS = 0.005
+PARSE_AVERAGE_WEIGHT = 0.2  # weight of the latest parse in the moving average
+PARSE_WARN_SECONDS = 0.05  # parses longer than this are reported
 
-@dataclass
+# One parse thread shared by all devices: parallel parses would only contend
+# with each other and the event loop for the GIL
+_PARSE_EXECUTOR: ThreadPoolExecutor | None = None
+
+
+def _parse_executor() -> ThreadPoolExecutor:
+    """Return the shared parse thread, starting it on first use."""
+    global _PARSE_EXECUTOR  # noqa: PLW0603
+    if _PARSE_EXECUTOR is None:
+        _PARSE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rixens_parse")
+    return _PARSE_EXECUTOR
+
+
+def shutdown_parse_executor() -> None:
+    """Stop the shared parse thread; it is started again on next use."""
+    global _PARSE_EXECUTOR  # noqa: PLW0603
+    if _PARSE_EXECUTOR is not None:
+        _PARSE_EXECUTOR.shutdown(wait=False)
+        _PARSE_EXECUTOR = None
+
+
+# Fault codes reported in <heater1-faults>, in the order values are stored
+FAULT_NAMES: Final = ("AF", "F1", "F2", "F3", "F4", "F5")
+_FAULT_INDEX: Final = {name: index for index, name in enumerate(FAULT_NAMES)}
+# Shared instance for the common all-clear case
+NO_FAULTS: Final = (0,) * len(FAULT_NAMES)
+
+
+@dataclass(frozen=True, slots=True)
 class RixensHeaterData:
-    """Heater-specific data from the Rixens device."""
+    """Heater-specific data from the Rixens device.
+
+    Fault values are stored as a tuple aligned with FAULT_NAMES rather than
+    a per-snapshot dict, since the set of fault codes never changes.
+    """
 
     heat_on: bool
     battery_voltage: float
@@ -34,10 +75,21 @@ class RixensHeaterData:
     heater_state: int
     glow_pin: int
     preheat: int
-    faults: dict[str, int]
+    faults: tuple[int, ...] = NO_FAULTS
 
+    @property
+    def active_faults(self) -> tuple[str, ...]:
+        """Return the codes of all faults with a non-zero value."""
+        if self.faults is NO_FAULTS:
+            return ()
+        return tuple(name for name, value in zip(FAULT_NAMES, self.faults) if value)
 
-@dataclass
+    def fault_value(self, name: str) -> int:
+        """Return the value of a single fault code."""
+        return self.faults[_FAULT_INDEX[name]]
+
+
+@dataclass(frozen=True, slots=True)
 class RixensSettings:
     """Settings data from the Rixens device."""
 
@@ -60,11 +112,21 @@ class RixensSettings:
     furnace_src: int  # Furnace heat source
     electric_src: int  # Electric heat source
     engine_src: int  # Engine heat source
+    # Preset stored on the device
+    preset_setpoint: float  # Temperature in Celsius
+    preset_fan_speed: str
+    preset_furnace_src: int
+    preset_electric_src: int
+    preset_engine_src: int
+    preset_constant_heat: bool
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RixensData:
-    """Data from the Rixens device."""
+    """Data from the Rixens device.
+
+    Snapshots are immutable so they can be compared and retained safely.
+    """
 
     version: str
     heat_version: str
@@ -82,6 +144,31 @@ class RixensData:
     settings: RixensSettings
 
 
+@dataclass(slots=True)
+class RixensParseStats:
+    """Running cost of parsing status payloads."""
+
+    parses: int = 0
+    offloaded: int = 0  # parsed in an executor
+    overlong: int = 0  # took longer than PARSE_WARN_SECONDS
+    last: float = 0.0  # seconds
+    average: float = 0.0  # seconds, exponential moving average
+    max: float = 0.0  # seconds
+    last_size: int = 0  # bytes
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics with times in milliseconds."""
+        return {
+            "parses": self.parses,
+            "offloaded": self.offloaded,
+            "overlong": self.overlong,
+            "last_ms": round(self.last * 1000, 3),
+            "average_ms": round(self.average * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+            "last_size": self.last_size,
+        }
+
+
 class RixensApiError(Exception):
     """Exception for Rixens API errors."""
 
@@ -98,12 +185,25 @@ class RixensApi:
         host: str,
         port: int = 80,
         session: aiohttp.ClientSession | None = None,
+        parse_offload: bool = True,
     ) -> None:
-        """Initialize the API client."""
+        """Initialize the API client.
+
+        Args:
+            host: Device host name or address
+            port: HTTP port
+            session: Shared aiohttp session, created on first use if omitted
+            parse_offload: Parse large or slow status payloads in an executor
+        """
         self._host = host
         self._port = port
         self._session = session
         self._base_url = f"http://{host}:{port}" if port != 80 else f"http://{host}"
+        # Last parsed sub-snapshots, reused when unchanged to share memory
+        self._last_heater: RixensHeaterData | None = None
+        self._last_settings: RixensSettings | None = None
+        self._parse_offload = parse_offload
+        self.parse_stats = RixensParseStats()
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create an aiohttp session."""
@@ -111,7 +211,7 @@ class RixensApi:
             self._session = aiohttp.ClientSession()
         return self._session
 
-    async def _request(self, path: str, retry: bool = True) -> str:
+    async def _request(self, path: str, retry: bool = True) -> bytes:
         """Make a request to the device with retry logic.
 
         Args:
@@ -119,7 +219,7 @@ class RixensApi:
             retry: Whether to retry on failure (default: True)
 
         Returns:
-            Response text from the device
+            Response body from the device
 
         Raises:
             RixensConnectionError: If all retries fail
@@ -141,7 +241,7 @@ class RixensApi:
                                 url,
                                 attempt,
                             )
-                        return await response.text()
+                        return await response.read()
             except asyncio.TimeoutError as err:
                 last_error = err
                 error_msg = f"Timeout connecting to {url}"
@@ -184,15 +284,64 @@ class RixensApi:
         except RixensApiError:
             return False
 
-    async def get_status(self) -> RixensData:
+    async def get_status(self, retry: bool = True) -> RixensData:
         """Get the current status from the device."""
-        response = await self._request("/status.xml")
-        return self._parse_status(response)
+        response = await self._request("/status.xml", retry=retry)
+        return await self._async_parse_status(response)
 
-    def _parse_status(self, xml_text: str) -> RixensData:
-        """Parse the status XML response."""
+    async def _async_parse_status(self, body: bytes) -> RixensData:
+        """Parse a status payload, off the event loop if it is large or slow.
+
+        Parsing is CPU-bound and blocks the event loop for its full duration.
+        Payloads above PARSE_OFFLOAD_BYTES, or any payload while the moving
+        average parse time is above PARSE_OFFLOAD_SECONDS, are parsed in the
+        shared parse thread instead. The parse time is always measured where the
+        parse runs, so the average falls again once payloads get cheaper.
+        """
+        stats = self.parse_stats
+        offload = self._parse_offload and (
+            len(body) > PARSE_OFFLOAD_BYTES or stats.average > PARSE_OFFLOAD_SECONDS
+        )
+        if offload:
+            data, elapsed = await asyncio.get_running_loop().run_in_executor(
+                _parse_executor(), self._timed_parse_status, body
+            )
+            stats.offloaded += 1
+        else:
+            data, elapsed = self._timed_parse_status(body)
+
+        stats.parses += 1
+        stats.last = elapsed
+        stats.last_size = len(body)
+        stats.average += (elapsed - stats.average) * PARSE_AVERAGE_WEIGHT
+        stats.max = max(stats.max, elapsed)
+        if elapsed > PARSE_WARN_SECONDS:
+            stats.overlong += 1
+            # Only the first is a warning; the count is kept in parse_stats
+            _LOGGER.log(
+                logging.WARNING if stats.overlong == 1 else logging.DEBUG,
+                "Parsing the %d byte status of %s took %.0f ms %s",
+                len(body),
+                self._host,
+                elapsed * 1000,
+                "in an executor" if offload else "on the event loop",
+            )
+        return data
+
+    def _timed_parse_status(self, body: bytes) -> tuple[RixensData, float]:
+        """Parse the status XML and return the snapshot and the parse time."""
+        start = time.perf_counter()
+        data = self._parse_status(body)
+        return data, time.perf_counter() - start
+
+    def _parse_status(self, body: bytes) -> RixensData:
+        """Parse the status XML response.
+
+        The raw body is parsed, so the XML declaration (UTF-8 by default)
+        decides its encoding.
+        """
         try:
-            root = ElementTree.fromstring(xml_text)
+            root = ElementTree.fromstring(body)
         except ElementTree.ParseError as err:
             raise RixensApiError(f"Failed to parse status XML: {err}") from err
 
@@ -215,6 +364,20 @@ class RixensApi:
         def get_bool(parent: ElementTree.Element, tag: str, default: bool = False) -> bool:
             return get_int(parent, tag, 1 if default else 0) == 1
 
+        # Parse faults into a tuple aligned with FAULT_NAMES
+        faults = NO_FAULTS
+        faults_elem = root.find("heater1-faults")
+        if faults_elem is not None:
+            values = list(NO_FAULTS)
+            for fault in faults_elem.findall("fault"):
+                name = get_text(fault, "name", "")
+                if (index := _FAULT_INDEX.get(name)) is not None:
+                    values[index] = get_int(fault, "value")
+                elif name:
+                    _LOGGER.debug("Ignoring unknown fault code %s", name)
+            if any(values):
+                faults = tuple(values)
+
         # Parse heater1 data
         # Note: Most temperatures from API are in tenths of a degree Celsius
         # Exception: flame_temp is in hundredths of a degree Celsius
@@ -233,17 +396,11 @@ class RixensApi:
             heater_state=get_int(heater1, "heaterstate") if heater1 is not None else 0,
             glow_pin=get_int(heater1, "glowpin") if heater1 is not None else 0,
             preheat=get_int(heater1, "preheat") if heater1 is not None else 0,
-            faults={},
+            faults=faults,
         )
-
-        # Parse faults
-        faults_elem = root.find("heater1-faults")
-        if faults_elem is not None:
-            for fault in faults_elem.findall("fault"):
-                name = get_text(fault, "name", "")
-                value = get_int(fault, "value")
-                if name:
-                    heater_data.faults[name] = value
+        if heater_data == self._last_heater:
+            heater_data = self._last_heater
+        self._last_heater = heater_data
 
         # Parse settings
         # Note: setpoint is also in tenths of a degree Celsius
@@ -252,7 +409,7 @@ class RixensApi:
         raw_setpoint = get_int(settings_elem, "setpoint", 200) if settings_elem is not None else 200
         settings = RixensSettings(
             setpoint=raw_setpoint / 10.0,
-            fan_speed=fan_speed_text,
+            fan_speed=sys.intern(fan_speed_text),
             pump_state=get_bool(settings_elem, "pumpstate") if settings_elem is not None else False,
             fan_state=get_bool(settings_elem, "fanstate") if settings_elem is not None else False,
             floor_enable=get_bool(settings_elem, "floorenable") if settings_elem is not None else False,
@@ -270,11 +427,21 @@ class RixensApi:
             furnace_src=get_int(settings_elem, "furnacesrc") if settings_elem is not None else 0,
             electric_src=get_int(settings_elem, "electricsrc") if settings_elem is not None else 0,
             engine_src=get_int(settings_elem, "enginesrc") if settings_elem is not None else 0,
+            # Parse the on-device preset
+            preset_setpoint=get_int(settings_elem, "presetsetpoint", raw_setpoint) / 10.0 if settings_elem is not None else raw_setpoint / 10.0,
+            preset_fan_speed=sys.intern(get_text(settings_elem, "presetfanspeed", "Auto")) if settings_elem is not None else "Auto",
+            preset_furnace_src=get_int(settings_elem, "presetfurnacesrc") if settings_elem is not None else 0,
+            preset_electric_src=get_int(settings_elem, "presetelectricsrc") if settings_elem is not None else 0,
+            preset_engine_src=get_int(settings_elem, "presetenginesrc") if settings_elem is not None else 0,
+            preset_constant_heat=get_bool(settings_elem, "presetcnstheat") if settings_elem is not None else False,
         )
+        if settings == self._last_settings:
+            settings = self._last_settings
+        self._last_settings = settings
 
         return RixensData(
-            version=get_text(root, "version", "Unknown"),
-            heat_version=get_text(root, "heatversion", "Unknown"),
+            version=sys.intern(get_text(root, "version", "Unknown")),
+            heat_version=sys.intern(get_text(root, "heatversion", "Unknown")),
             mode=get_int(root, "mode"),
             uptime=get_int(root, "uptime"),
             system_heat=get_bool(root, "systemheat"),
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
@@ -13,8 +15,9 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import ANOMALIES, ATTR_STALE, DOMAIN
 from .coordinator import RixensCoordinator
+from .entity import RixensThrottledEntity
 
 
 async def async_setup_entry(
@@ -24,7 +27,12 @@ async def async_setup_entry(
 ) -> None:
     """Set up Rixens binary sensors based on a config entry."""
     coordinator: RixensCoordinator = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities([RixensConnectionSensor(coordinator)])
+    entities: list[BinarySensorEntity] = [
+        RixensConnectionSensor(coordinator),
+        RixensFaultSensor(coordinator),
+    ]
+    entities.extend(RixensAnomalySensor(coordinator, anomaly) for anomaly in ANOMALIES)
+    async_add_entities(entities)
 
 
 class RixensConnectionSensor(CoordinatorEntity[RixensCoordinator], BinarySensorEntity):
@@ -48,7 +56,85 @@ class RixensConnectionSensor(CoordinatorEntity[RixensCoordinator], BinarySensorE
         """Return True if device is connected."""
         return self.coordinator.is_available
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return whether entities show a snapshot restored from a previous run."""
+        return {ATTR_STALE: self.coordinator.stale}
+
     @property
     def available(self) -> bool:
         """Connection sensor is always available to show connection state."""
         return True
+
+
+class RixensFaultSensor(RixensThrottledEntity, BinarySensorEntity):
+    """Binary sensor that is on while any heater fault is active."""
+
+    _attr_has_entity_name = True
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_translation_key = "fault"
+    _throttle_key = "fault"
+
+    def __init__(self, coordinator: RixensCoordinator) -> None:
+        """Initialize the fault sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_fault"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, coordinator.config_entry.entry_id)},
+        )
+
+    def _control_state(self) -> Any:
+        """Return the availability and problem state; only attributes are delayed."""
+        return self.available, self.is_on
+
+    @property
+    def is_on(self) -> bool:
+        """Return True if any heater fault is active."""
+        return bool(self.coordinator.faults.active)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the active fault codes and how often each was raised."""
+        return super().extra_state_attributes | {
+            "active_faults": list(self.coordinator.faults.active),
+            "fault_counts": dict(self.coordinator.faults.counts),
+        }
+
+
+class RixensAnomalySensor(RixensThrottledEntity, BinarySensorEntity):
+    """Binary sensor that is on while the anomaly detector flags an anomaly."""
+
+    _attr_has_entity_name = True
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, coordinator: RixensCoordinator, anomaly: str) -> None:
+        """Initialize the anomaly sensor."""
+        super().__init__(coordinator)
+        self._anomaly = anomaly
+        self._attr_translation_key = anomaly
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{anomaly}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, coordinator.config_entry.entry_id)},
+        )
+
+    @property
+    def _throttle_key(self) -> str:
+        """Return the anomaly name as the key of the minimum interval."""
+        return self._anomaly
+
+    def _control_state(self) -> Any:
+        """Return the availability and problem state; only attributes are delayed."""
+        return self.available, self.is_on
+
+    @property
+    def is_on(self) -> bool:
+        """Return True if the anomaly is active."""
+        return self.coordinator.anomalies.states[self._anomaly].active
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the last anomalous value and the level it was compared with."""
+        state = self.coordinator.anomalies.states[self._anomaly]
+        return super().extra_state_attributes | {"value": state.value, "expected": state.expected}
@@ -0,0 +1,130 @@
+"""On-demand high-rate capture of Rixens status snapshots."""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import logging
+import math
+import time
+from typing import Any
+
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .api import RixensApi, RixensApiError
+from .const import CONF_PORT, DEFAULT_PORT, DOMAIN
+from .coordinator import RixensCoordinator
+from .history import RixensHistory
+
+_LOGGER = logging.getLogger(__name__)
+
+SUMMARY_PERCENTILES = (50, 95)
+
+# Config entries with a capture in progress
+_ACTIVE: set[str] = set()
+
+
+async def async_burst_capture(
+    hass: HomeAssistant,
+    coordinator: RixensCoordinator,
+    fields: list[str],
+    rate: float,
+    duration: float,
+    write_file: bool,
+    include_samples: bool,
+) -> dict[str, Any]:
+    """Poll one device at `rate` Hz for `duration` seconds into a private buffer.
+
+    Samples never reach the coordinator, so entities, the recorder and the
+    regular 5 second polling are unaffected. The capture has its own API
+    client on the shared HTTP session, so its polls don't count in the
+    coordinator's parse statistics or replace the sub-snapshots it reuses
+    between polls. Polls run on a fixed schedule
+    without retries; a poll that overruns its slot skips the slots it
+    missed instead of queueing behind itself.
+
+    Returns:
+        The sample and error counts, poll latency, per-field aggregates and,
+        when written, the CSV file path
+    """
+    entry = coordinator.config_entry
+    entry_id = entry.entry_id
+    if entry_id in _ACTIVE:
+        raise HomeAssistantError("A burst capture is already running for this device")
+
+    api = RixensApi(
+        host=entry.data[CONF_HOST],
+        port=entry.data.get(CONF_PORT, DEFAULT_PORT),
+        session=async_get_clientsession(hass),
+    )
+    period = 1 / rate
+    slots = math.floor(duration * rate)
+    buffer = RixensHistory(slots + 1)
+    latencies: list[float] = []
+    errors = 0
+
+    _ACTIVE.add(entry_id)
+    try:
+        loop = hass.loop
+        started = time.time()
+        origin = loop.time()
+        slot = 0
+        while slot <= slots:
+            if (delay := origin + slot * period - loop.time()) > 0:
+                await asyncio.sleep(delay)
+            poll_started = loop.time()
+            try:
+                data = await api.get_status(retry=False)
+            except RixensApiError as err:
+                errors += 1
+                _LOGGER.debug("Burst capture poll of %s failed: %s", entry_id, err)
+            else:
+                buffer.append(time.time(), data)
+                latencies.append(loop.time() - poll_started)
+            slot = math.floor((loop.time() - origin) / period) + 1
+        elapsed = time.time() - started
+    finally:
+        _ACTIVE.discard(entry_id)
+
+    result: dict[str, Any] = {
+        "samples": len(buffer),
+        "errors": errors,
+        "seconds": round(elapsed, 3),
+        "rate": round(len(buffer) / elapsed, 2) if elapsed else 0.0,
+    }
+    if latencies:
+        latencies.sort()
+        result["latency"] = {
+            "min": round(latencies[0], 4),
+            "max": round(latencies[-1], 4),
+            "mean": round(sum(latencies) / len(latencies), 4),
+        }
+    result.update(
+        buffer.query(fields, percentiles=SUMMARY_PERCENTILES, include_samples=include_samples)
+    )
+
+    if write_file:
+        path = hass.config.path(f"{DOMAIN}_burst_{entry_id}_{int(started)}.csv")
+        await hass.async_add_executor_job(_write_csv, path, fields, buffer.query(fields))
+        result["path"] = path
+
+    _LOGGER.info(
+        "Rixens burst capture of %s: %d samples, %d errors in %.1fs",
+        entry_id,
+        len(buffer),
+        errors,
+        elapsed,
+    )
+    return result
+
+
+def _write_csv(path: str, fields: list[str], samples: dict[str, Any]) -> None:
+    """Write captured samples as CSV, one row per snapshot."""
+    columns = [samples["fields"][name]["values"] for name in fields]
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(["timestamp", *fields])
+        writer.writerows(zip(samples["timestamps"], *columns))
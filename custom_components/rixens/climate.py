@@ -5,9 +5,6 @@ from __future__ import annotations
 from typing import Any
 
 from homeassistant.components.climate import (
-    PRESET_AWAY,
-    PRESET_HOME,
-    PRESET_SLEEP,
     ClimateEntity,
     ClimateEntityFeature,
     HVACAction,
@@ -15,30 +12,40 @@ from homeassistant.components.climate import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
     FAN_SPEED_AUTO,
     FAN_SPEED_MAX,
     FAN_SPEED_MIN,
+    SIGNAL_OPTIONS_UPDATED,
     TEMP_MAX,
     TEMP_MIN,
 )
+from .controls import (
+    CONTROL_ELECTRIC_HEAT,
+    CONTROL_FAN_SPEED,
+    CONTROL_FURNACE,
+    CONTROL_SETPOINT,
+)
 from .coordinator import RixensCoordinator
+from .derived import SOURCE_OFF
+from .entity import RixensThrottledEntity
+from .presets import (
+    PRESET_DEVICE,
+    USER_PRESETS,
+    RixensPreset,
+    current_preset,
+    device_preset,
+    load_presets,
+)
 
 FAN_MODES = ["auto", "10", "20", "30", "40", "50", "60", "70", "80", "90", "100"]
 
-# Default preset temperatures (can be customized via integration options)
-DEFAULT_PRESET_TEMPS = {
-    PRESET_AWAY: 10.0,  # Freeze protection
-    PRESET_HOME: 20.0,  # Comfortable living
-    PRESET_SLEEP: 18.0,  # Night time
-}
-
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -50,18 +57,20 @@ async def async_setup_entry(
     async_add_entities([RixensClimate(coordinator)])
 
 
-class RixensClimate(CoordinatorEntity[RixensCoordinator], ClimateEntity):
+class RixensClimate(RixensThrottledEntity, ClimateEntity):
     """Representation of a Rixens climate device."""
 
     _attr_has_entity_name = True
     _attr_name = None
+    _attr_translation_key = "heater"
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
     _attr_hvac_modes = [HVACMode.OFF, HVACMode.HEAT]
     _attr_fan_modes = FAN_MODES
-    _attr_preset_modes = [PRESET_AWAY, PRESET_HOME, PRESET_SLEEP]
+    _attr_preset_modes = [*USER_PRESETS, PRESET_DEVICE]
     _attr_min_temp = TEMP_MIN
     _attr_max_temp = TEMP_MAX
     _attr_target_temperature_step = 0.5
+    _throttle_key = "climate"
     _attr_supported_features = (
         ClimateEntityFeature.TARGET_TEMPERATURE
         | ClimateEntityFeature.FAN_MODE
@@ -83,19 +92,37 @@ class RixensClimate(CoordinatorEntity[RixensCoordinator], ClimateEntity):
         )
         # Track last heat source configuration for state preservation
         self._last_heat_sources: dict[str, bool] | None = None
-        # Track current preset mode
-        self._preset_mode: str | None = None
-        # Load preset temperatures from options or use defaults
-        self._load_preset_temps()
-
-    def _load_preset_temps(self) -> None:
-        """Load preset temperatures from config entry options."""
-        options = self.coordinator.config_entry.options
-        self._preset_temps = {
-            PRESET_AWAY: options.get("preset_away_temp", DEFAULT_PRESET_TEMPS[PRESET_AWAY]),
-            PRESET_HOME: options.get("preset_home_temp", DEFAULT_PRESET_TEMPS[PRESET_HOME]),
-            PRESET_SLEEP: options.get("preset_sleep_temp", DEFAULT_PRESET_TEMPS[PRESET_SLEEP]),
-        }
+        # Load presets from options or use defaults
+        self._presets: dict[str, RixensPreset] = load_presets(
+            coordinator.config_entry.options
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to options changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_OPTIONS_UPDATED.format(self.coordinator.config_entry.entry_id),
+                self._async_options_updated,
+            )
+        )
+
+    @callback
+    def _async_options_updated(self) -> None:
+        """Reload presets after an options change."""
+        self._presets = load_presets(self.coordinator.config_entry.options)
+        self.async_write_ha_state()
+
+    def _control_state(self) -> Any:
+        """Return the availability and user-set modes, written without delay."""
+        return (
+            self.available,
+            self.target_temperature,
+            self.hvac_mode,
+            self.fan_mode,
+            self.preset_mode,
+        )
 
     @property
     def current_temperature(self) -> float | None:
@@ -118,19 +145,11 @@ class RixensClimate(CoordinatorEntity[RixensCoordinator], ClimateEntity):
         Mode is based on whether heat sources are enabled, not whether
         heat is currently being called for (system_heat).
         """
-        if not self.coordinator.data:
+        if (derived := self.coordinator.derived) is None:
             return HVACMode.OFF
 
         # HVAC mode is HEAT if any heat source is enabled (!= 0)
-        # Only furnace_src, electric_src, and engine_src are actual heat sources
-        if (
-            self.coordinator.data.settings.furnace_src != 0
-            or self.coordinator.data.settings.electric_src != 0
-            or self.coordinator.data.settings.engine_src != 0
-        ):
-            return HVACMode.HEAT
-
-        return HVACMode.OFF
+        return HVACMode.HEAT if derived.heat_enabled else HVACMode.OFF
 
     @property
     def hvac_action(self) -> HVACAction | None:
@@ -141,74 +160,54 @@ class RixensClimate(CoordinatorEntity[RixensCoordinator], ClimateEntity):
         - IDLE: Heat sources enabled but not calling for heat (systemheat == 0)
         - HEATING: Calling for heat AND at least one source actively heating (*src == 2)
         """
-        if not self.coordinator.data:
+        if (derived := self.coordinator.derived) is None:
             return None
-
-        # Check if all heat sources are disabled
-        all_disabled = (
-            self.coordinator.data.settings.furnace_src == 0
-            and self.coordinator.data.settings.electric_src == 0
-            and self.coordinator.data.settings.engine_src == 0
-        )
-        if all_disabled:
-            return HVACAction.OFF
-
-        # system_heat indicates thermostat is calling for heat (temp < setpoint)
-        if self.coordinator.data.system_heat:
-            # Check if any heat source is actively heating (== 2)
-            any_heating = (
-                self.coordinator.data.settings.furnace_src == 2
-                or self.coordinator.data.settings.electric_src == 2
-                or self.coordinator.data.settings.engine_src == 2
-            )
-            if any_heating:
-                return HVACAction.HEATING
-            # Calling for heat but not heating yet (startup delay, etc.)
-            return HVACAction.IDLE
-
-        # Heat sources enabled but not calling for heat (temp >= setpoint)
-        return HVACAction.IDLE
+        return HVACAction(derived.hvac_action)
 
     @property
     def fan_mode(self) -> str | None:
         """Return the current fan mode."""
-        if not self.coordinator.data:
+        if (derived := self.coordinator.derived) is None:
             return None
-
-        fan_speed = self.coordinator.data.settings.fan_speed
-        if fan_speed == "Auto" or fan_speed == str(FAN_SPEED_AUTO):
-            return "auto"
-        return fan_speed
+        return derived.fan_mode
 
     @property
     def preset_mode(self) -> str | None:
-        """Return the current preset mode."""
-        return self._preset_mode
+        """Return the preset matching the live state, if any.
+
+        User presets take precedence over the device's own preset when
+        several match.
+        """
+        if (derived := self.coordinator.derived) is None:
+            return None
+        return current_preset(self._presets, self.coordinator.data, derived)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        if not self.coordinator.data:
-            return {}
-
-        return {
-            "furnace_enabled": self.coordinator.data.settings.furnace_src != 0,
-            "furnace_active": self.coordinator.data.settings.furnace_src == 2,
-            "electric_heat_enabled": self.coordinator.data.settings.electric_src != 0,
-            "electric_heat_active": self.coordinator.data.settings.electric_src == 2,
-            "engine_heat_enabled": self.coordinator.data.settings.engine_src != 0,
-            "engine_heat_active": self.coordinator.data.settings.engine_src == 2,
+        if (derived := self.coordinator.derived) is None:
+            return super().extra_state_attributes
+
+        settings = self.coordinator.data.settings
+        return super().extra_state_attributes | {
+            "furnace_enabled": derived.furnace_enabled,
+            "furnace_active": derived.furnace_active,
+            "electric_heat_enabled": derived.electric_enabled,
+            "electric_heat_active": derived.electric_active,
+            "engine_heat_enabled": derived.engine_enabled,
+            "engine_heat_active": derived.engine_active,
             "system_calling_for_heat": self.coordinator.data.system_heat,
             "current_humidity": self.coordinator.data.current_humidity,
+            # Parts of the device preset that selecting it can't apply
+            "device_preset_fan_speed": settings.preset_fan_speed,
+            "device_preset_engine_heat": settings.preset_engine_src != SOURCE_OFF,
+            "device_preset_constant_heat": settings.preset_constant_heat,
         }
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         if (temperature := kwargs.get(ATTR_TEMPERATURE)) is not None:
-            await self.coordinator.api.set_temperature(float(temperature))
-            # Clear preset mode when manually setting temperature
-            self._preset_mode = None
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.intents.async_set({CONTROL_SETPOINT: float(temperature)})
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new HVAC mode.
@@ -217,48 +216,52 @@ class RixensClimate(CoordinatorEntity[RixensCoordinator], ClimateEntity):
         When turning on, restores previously enabled sources (or defaults to furnace).
         When turning off, remembers which sources were enabled.
         """
+        target: dict[str, bool] = {}
         if hvac_mode == HVACMode.HEAT:
             # Restore previous configuration or default to furnace only
             if self._last_heat_sources:
                 if self._last_heat_sources.get("furnace"):
-                    await self.coordinator.api.set_furnace(True)
+                    target[CONTROL_FURNACE] = True
                 if self._last_heat_sources.get("electric"):
-                    await self.coordinator.api.set_electric_heat(True)
+                    target[CONTROL_ELECTRIC_HEAT] = True
                 # Note: engine heat cannot be controlled via API
             else:
                 # Default: enable furnace only
-                await self.coordinator.api.set_furnace(True)
+                target[CONTROL_FURNACE] = True
         elif hvac_mode == HVACMode.OFF:
             # Save current heat source state before turning off
-            if self.coordinator.data:
+            if (derived := self.coordinator.derived) is not None:
                 self._last_heat_sources = {
-                    "furnace": self.coordinator.data.settings.furnace_src != 0,
-                    "electric": self.coordinator.data.settings.electric_src != 0,
+                    "furnace": derived.furnace_enabled,
+                    "electric": derived.electric_enabled,
                     # Engine heat state is tracked but cannot be controlled via API
                 }
-            await self.coordinator.api.set_furnace(False)
-            await self.coordinator.api.set_electric_heat(False)
-        await self.coordinator.async_request_refresh()
+            target = {CONTROL_FURNACE: False, CONTROL_ELECTRIC_HEAT: False}
+        if target:
+            await self.coordinator.intents.async_set(target)
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set new fan mode."""
         if fan_mode == "auto":
-            await self.coordinator.api.set_fan_speed(FAN_SPEED_AUTO)
+            await self.coordinator.intents.async_set({CONTROL_FAN_SPEED: FAN_SPEED_AUTO})
         else:
             speed = int(fan_mode)
             if FAN_SPEED_MIN <= speed <= FAN_SPEED_MAX:
-                await self.coordinator.api.set_fan_speed(speed)
-        await self.coordinator.async_request_refresh()
+                await self.coordinator.intents.async_set({CONTROL_FAN_SPEED: speed})
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new preset mode.
 
-        Sets temperature to user-configured values for common RV heating scenarios.
+        Applies every field of the preset as one write set, sending only the
+        fields that differ from the current device state.
         """
-        if preset_mode in self._preset_temps:
-            await self.coordinator.api.set_temperature(self._preset_temps[preset_mode])
-            self._preset_mode = preset_mode
-            await self.coordinator.async_request_refresh()
+        if preset_mode == PRESET_DEVICE:
+            if self.coordinator.data is None:
+                return
+            preset = device_preset(self.coordinator.data)
+        elif (preset := self._presets.get(preset_mode)) is None:
+            return
+        await self.coordinator.intents.async_set(dict(preset.values), skip_matching=True)
 
     async def async_turn_on(self) -> None:
         """Turn the heating system on.
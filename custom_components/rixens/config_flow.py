@@ -2,28 +2,66 @@
 
 from __future__ import annotations
 
+from ipaddress import IPv4Address, IPv4Network
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
 
+from homeassistant.components import network
 from homeassistant.config_entries import ConfigFlow, ConfigFlowResult, OptionsFlow
 from homeassistant.const import CONF_HOST
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.importlib import async_import_module
+from homeassistant.helpers.selector import ObjectSelector
 
 from .api import RixensApi, RixensConnectionError
 from .const import (
+    CONF_DEADBAND,
+    CONF_DEADBAND_RELATIVE,
     CONF_FUEL_DOSE,
+    CONF_MAX_SILENT_INTERVAL,
+    CONF_MIN_INTERVALS,
+    CONF_NETWORK,
     CONF_PORT,
+    CONF_PRECISION,
+    CONF_RUNTIME_BUCKET,
+    CONF_SCHEDULE,
     DEFAULT_FUEL_DOSE,
+    DEFAULT_MAX_SILENT_INTERVAL,
+    DEFAULT_RUNTIME_BUCKET,
     DEFAULT_PORT,
     DOMAIN,
+    MAX_MIN_INTERVAL,
+    THROTTLED_ENTITY_KEYS,
 )
+from .controls import CONTROL_ELECTRIC_HEAT, CONTROL_FAN_SPEED, CONTROL_FURNACE
+from .handoff import async_store_validated
+from .presets import (
+    PRESET_FAN_OPTIONS,
+    PRESET_SOURCE_OPTIONS,
+    UNCHANGED,
+    USER_PRESETS,
+    preset_option,
+)
+
+# Home Assistant loads this module with the integration, so the discovery,
+# sensor and schedule modules are imported by the steps that use them
+if TYPE_CHECKING:
+    from .discovery import DiscoveredDevice
 
 _LOGGER = logging.getLogger(__name__)
 
+MIN_INTERVALS_SCHEMA = vol.Schema(
+    {
+        vol.In(THROTTLED_ENTITY_KEYS): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=MAX_MIN_INTERVAL)
+        )
+    }
+)
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_HOST): str,
@@ -61,6 +99,9 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
         status.version,
     )
 
+    # Let the coordinator start from this snapshot instead of fetching it again
+    async_store_validated(hass, data[CONF_HOST], data.get(CONF_PORT, DEFAULT_PORT), status)
+
     # Return info that you want to store in the config entry
     return {"title": f"Rixens ({data[CONF_HOST]})", "version": status.version}
 
@@ -75,10 +116,20 @@ class RixensConfigFlow(ConfigFlow, domain=DOMAIN):
         """Get the options flow for this handler."""
         return RixensOptionsFlowHandler()
 
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        self._discovered: dict[str, DiscoveredDevice] = {}
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Handle the initial step."""
+        return self.async_show_menu(step_id="user", menu_options=["discover", "manual"])
+
+    async def async_step_manual(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle manual entry of the device address."""
         errors: dict[str, str] = {}
 
         if user_input is not None:
@@ -96,21 +147,121 @@ class RixensConfigFlow(ConfigFlow, domain=DOMAIN):
                 return self.async_create_entry(title=info["title"], data=user_input)
 
         return self.async_show_form(
-            step_id="user",
+            step_id="manual",
             data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
         )
 
+    async def async_step_discover(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Scan one or more networks for Rixens controllers."""
+        errors: dict[str, str] = {}
+        discovery = await async_import_module(self.hass, f"{__package__}.discovery")
+
+        if user_input is not None:
+            try:
+                networks = [
+                    discovery.parse_network(part)
+                    for part in user_input[CONF_NETWORK].split(",")
+                    if part.strip()
+                ]
+            except ValueError:
+                errors[CONF_NETWORK] = "invalid_network"
+            else:
+                devices = await discovery.async_discover(
+                    async_get_clientsession(self.hass), networks, port=user_input[CONF_PORT]
+                )
+                configured = {entry.data[CONF_HOST] for entry in self._async_current_entries()}
+                self._discovered = {
+                    device.host: device for device in devices if device.host not in configured
+                }
+                if self._discovered:
+                    return await self.async_step_pick()
+                errors["base"] = "no_devices_found"
+            default_network = user_input[CONF_NETWORK]
+        else:
+            default_network = ", ".join(str(net) for net in await self._async_local_networks())
+
+        return self.async_show_form(
+            step_id="discover",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_NETWORK, default=default_network): str,
+                    vol.Optional(CONF_PORT, default=DEFAULT_PORT): int,
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_pick(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Let the user pick one of the discovered controllers."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            device = self._discovered[user_input[CONF_HOST]]
+            data = {CONF_HOST: device.host, CONF_PORT: device.port}
+            self._async_abort_entries_match({CONF_HOST: device.host})
+
+            try:
+                info = await validate_input(self.hass, data)
+            except CannotConnect:
+                errors["base"] = "cannot_connect"
+            except Exception:
+                _LOGGER.exception("Unexpected exception")
+                errors["base"] = "unknown"
+            else:
+                return self.async_create_entry(title=info["title"], data=data)
+
+        return self.async_show_form(
+            step_id="pick",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_HOST): vol.In(
+                        {
+                            host: f"{host} ({device.version}, heater {device.heat_version})"
+                            for host, device in self._discovered.items()
+                        }
+                    )
+                }
+            ),
+            errors=errors,
+        )
+
+    async def _async_local_networks(self) -> list[IPv4Network]:
+        """Return the networks of the enabled local IPv4 interfaces."""
+        if "network" not in self.hass.config.components:
+            return []
+        discovery = await async_import_module(self.hass, f"{__package__}.discovery")
+        adapters = await network.async_get_adapters(self.hass)
+        return sorted(
+            {
+                discovery.local_network(ip_info["address"], ip_info["network_prefix"])
+                for adapter in adapters
+                if adapter["enabled"]
+                for ip_info in adapter["ipv4"]
+                if not IPv4Address(ip_info["address"]).is_loopback
+            },
+            key=str,
+        )
+
 
 class RixensOptionsFlowHandler(OptionsFlow):
     """Handle options flow for Rixens integration."""
 
+    def __init__(self) -> None:
+        """Initialize the options flow."""
+        self._options: dict[str, Any] = {}
+
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Manage preset temperature options."""
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            self._options.update(user_input)
+            return await self.async_step_presets()
 
         # Get current values from options or use defaults
         current_options = self.config_entry.options
@@ -135,10 +286,135 @@ class RixensOptionsFlowHandler(OptionsFlow):
                         CONF_FUEL_DOSE,
                         default=current_options.get(CONF_FUEL_DOSE, DEFAULT_FUEL_DOSE),
                     ): vol.All(vol.Coerce(float), vol.Range(min=0.001, max=1.0)),
+                    vol.Optional(
+                        CONF_RUNTIME_BUCKET,
+                        default=current_options.get(CONF_RUNTIME_BUCKET, DEFAULT_RUNTIME_BUCKET),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=1440)),
                 }
             ),
         )
 
+    async def async_step_presets(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the fan speed and heat sources each preset sets."""
+        if user_input is not None:
+            self._options.update(user_input)
+            return await self.async_step_deadband()
+
+        current_options = self.config_entry.options
+        schema: dict[Any, Any] = {}
+        for name in USER_PRESETS:
+            key = preset_option(name, CONTROL_FAN_SPEED)
+            schema[vol.Optional(key, default=current_options.get(key, UNCHANGED))] = vol.In(
+                PRESET_FAN_OPTIONS
+            )
+            for control in (CONTROL_FURNACE, CONTROL_ELECTRIC_HEAT):
+                key = preset_option(name, control)
+                schema[vol.Optional(key, default=current_options.get(key, UNCHANGED))] = vol.In(
+                    PRESET_SOURCE_OPTIONS
+                )
+
+        return self.async_show_form(step_id="presets", data_schema=vol.Schema(schema))
+
+    async def async_step_deadband(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage deadband and precision options for noisy sensors."""
+        if user_input is not None:
+            self._options.update(user_input)
+            return await self.async_step_update_intervals()
+
+        sensor = await async_import_module(self.hass, f"{__package__}.sensor")
+        current_options = self.config_entry.options
+        schema: dict[Any, Any] = {}
+        for description in sensor.SENSOR_DESCRIPTIONS:
+            if description.deadband is None:
+                continue
+            key = description.key
+            schema[
+                vol.Optional(
+                    f"{key}_{CONF_DEADBAND}",
+                    default=current_options.get(f"{key}_{CONF_DEADBAND}", description.deadband),
+                )
+            ] = vol.All(vol.Coerce(float), vol.Range(min=0))
+            schema[
+                vol.Optional(
+                    f"{key}_{CONF_DEADBAND_RELATIVE}",
+                    default=current_options.get(
+                        f"{key}_{CONF_DEADBAND_RELATIVE}", description.deadband_relative
+                    ),
+                )
+            ] = vol.All(vol.Coerce(float), vol.Range(min=0, max=100))
+            schema[
+                vol.Optional(
+                    f"{key}_{CONF_PRECISION}",
+                    default=current_options.get(
+                        f"{key}_{CONF_PRECISION}", description.suggested_display_precision
+                    ),
+                )
+            ] = vol.All(vol.Coerce(int), vol.Range(min=0, max=3))
+        schema[
+            vol.Optional(
+                CONF_MAX_SILENT_INTERVAL,
+                default=current_options.get(CONF_MAX_SILENT_INTERVAL, DEFAULT_MAX_SILENT_INTERVAL),
+            )
+        ] = vol.All(vol.Coerce(int), vol.Range(min=5, max=3600))
+
+        return self.async_show_form(step_id="deadband", data_schema=vol.Schema(schema))
+
+    async def async_step_update_intervals(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the minimum interval between state writes per entity."""
+        errors: dict[str, str] = {}
+        intervals = self.config_entry.options.get(CONF_MIN_INTERVALS, {})
+        if user_input is not None:
+            intervals = user_input.get(CONF_MIN_INTERVALS) or {}
+            try:
+                intervals = MIN_INTERVALS_SCHEMA(intervals)
+            except vol.Invalid as err:
+                _LOGGER.debug("Invalid update intervals: %s", err)
+                errors["base"] = "invalid_update_intervals"
+            else:
+                self._options[CONF_MIN_INTERVALS] = intervals
+                return await self.async_step_schedule()
+
+        return self.async_show_form(
+            step_id="update_intervals",
+            data_schema=vol.Schema(
+                {vol.Optional(CONF_MIN_INTERVALS, default=intervals): ObjectSelector()}
+            ),
+            errors=errors,
+        )
+
+    async def async_step_schedule(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the weekday schedule of setpoint, fan and heat source changes."""
+        errors: dict[str, str] = {}
+        schedule = self.config_entry.options.get(CONF_SCHEDULE, [])
+        if user_input is not None:
+            schedule = user_input.get(CONF_SCHEDULE) or []
+            scheduler = await async_import_module(self.hass, f"{__package__}.schedule")
+            try:
+                scheduler.SCHEDULE_SCHEMA(schedule)
+            except vol.Invalid as err:
+                _LOGGER.debug("Invalid schedule: %s", err)
+                errors["base"] = "invalid_schedule"
+            else:
+                # Stored as entered; the scheduler validates it again on load
+                self._options[CONF_SCHEDULE] = schedule
+                return self.async_create_entry(title="", data=self._options)
+
+        return self.async_show_form(
+            step_id="schedule",
+            data_schema=vol.Schema(
+                {vol.Optional(CONF_SCHEDULE, default=schedule): ObjectSelector()}
+            ),
+            errors=errors,
+        )
+
 
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
@@ -5,6 +5,7 @@ DOMAIN = "rixens"
 # Configuration keys
 CONF_HOST = "host"
 CONF_PORT = "port"
+CONF_NETWORK = "network"
 
 # Defaults
 DEFAULT_PORT = 80
@@ -27,3 +28,131 @@ HEATER_STATE_RUNNING = 20
 # Fuel consumption constants
 CONF_FUEL_DOSE = "fuel_dose"
 DEFAULT_FUEL_DOSE = 0.0297979798  # ml per dose (improved accuracy)
+
+# Heater runtime is published in buckets of this many minutes
+CONF_RUNTIME_BUCKET = "runtime_bucket"
+DEFAULT_RUNTIME_BUCKET = 60
+
+# Weekday schedule of setpoint, fan and heat source changes
+CONF_SCHEDULE = "schedule"
+
+# Sensor deadband options, stored per sensor as "<sensor key>_<suffix>"
+CONF_DEADBAND = "deadband"
+CONF_DEADBAND_RELATIVE = "deadband_relative"
+CONF_PRECISION = "precision"
+CONF_MAX_SILENT_INTERVAL = "max_silent_interval"
+DEFAULT_MAX_SILENT_INTERVAL = 300  # seconds
+
+# Minimum seconds between state writes, by entity key
+CONF_MIN_INTERVALS = "min_update_intervals"
+MAX_MIN_INTERVAL = 3600  # seconds
+
+# Anomaly names
+ANOMALY_FLAME_OUT = "flame_out"
+ANOMALY_COOLANT_STALL = "coolant_stall"
+ANOMALY_VOLTAGE_SAG = "voltage_sag"
+ANOMALY_MOTOR_STALL = "motor_stall"
+ANOMALIES = (
+    ANOMALY_FLAME_OUT,
+    ANOMALY_COOLANT_STALL,
+    ANOMALY_VOLTAGE_SAG,
+    ANOMALY_MOTOR_STALL,
+)
+
+# Entity keys a minimum update interval can be set for. Listed here rather
+# than collected from the entity descriptions so the config flow doesn't
+# import the platforms. Switches only show state the user controls, and the
+# connection and pending commands sensors are not limited.
+THROTTLED_ENTITY_KEYS = (
+    "climate",
+    "fan_speed",
+    # Sensors
+    "current_temperature",
+    "current_humidity",
+    "battery_voltage",
+    "flame_temperature",
+    "inlet_temperature",
+    "outlet_temperature",
+    "atmospheric_pressure",
+    "heater_runtime",
+    "system_uptime",
+    "pid_speed",
+    "burner_motor",
+    "dosing_pump",
+    "fuel_consumption",
+    "heater_state",
+    "firmware_version",
+    "heat_firmware_version",
+    "last_boot",
+    "fuel_used",
+    "warm_up_time",
+    # Burner cycle sensors
+    "heater_cycles",
+    "failed_ignitions",
+    "short_cycles",
+    "average_run_time",
+    "average_ignition_time",
+    # Problem sensors
+    "fault",
+    *ANOMALIES,
+)
+
+# Dispatcher signal sent with the config entry id when options change
+SIGNAL_OPTIONS_UPDATED = f"{DOMAIN}_options_updated_{{}}"
+SIGNAL_INTENTS_UPDATED = f"{DOMAIN}_intents_updated_{{}}"
+
+# Events
+EVENT_CONTROLLER_REBOOT = f"{DOMAIN}_controller_reboot"
+EVENT_FAULT = f"{DOMAIN}_fault"
+EVENT_ANOMALY = f"{DOMAIN}_anomaly"
+
+# Services
+SERVICE_PROFILE = "profile"
+SERVICE_GET_HISTORY = "get_history"
+SERVICE_GET_CYCLES = "get_cycles"
+SERVICE_START_BURST_CAPTURE = "start_burst_capture"
+SERVICE_PREHEAT = "preheat"
+SERVICE_CANCEL_PREHEAT = "cancel_preheat"
+
+# Service attributes
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_STALE = "stale"
+ATTR_CYCLES = "cycles"
+ATTR_SECONDS = "seconds"
+ATTR_TOP = "top"
+ATTR_FIELDS = "fields"
+ATTR_MINUTES = "minutes"
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_PERCENTILES = "percentiles"
+ATTR_INCLUDE_SAMPLES = "include_samples"
+ATTR_INTERVAL = "interval"
+ATTR_RATE = "rate"
+ATTR_DURATION = "duration"
+ATTR_WRITE_FILE = "write_file"
+ATTR_TEMPERATURE = "temperature"
+ATTR_TIME = "time"
+
+# Profiling defaults
+DEFAULT_PROFILE_CYCLES = 5
+DEFAULT_PROFILE_SECONDS = 60
+DEFAULT_PROFILE_TOP = 25
+
+# In-memory history
+HISTORY_CAPACITY = 2160  # 3 hours at the 5s poll interval
+DEFAULT_HISTORY_MINUTES = 30
+DEFAULT_HISTORY_PERCENTILES = [50, 95]
+
+# Burst capture defaults and limits
+DEFAULT_BURST_RATE = 2  # Hz
+MAX_BURST_RATE = 10  # Hz
+DEFAULT_BURST_DURATION = 60  # seconds
+MAX_BURST_DURATION = 600  # seconds
+DEFAULT_BURST_FIELDS = [
+    "heater_state",
+    "heater.flame_temp",
+    "heater.burner_motor",
+    "heater.dosing_pump",
+    "heater.glow_pin",
+    "heater.battery_voltage",
+]
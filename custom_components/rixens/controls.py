@@ -0,0 +1,78 @@
+"""Writable controls of a Rixens device."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from .api import RixensApi, RixensData
+from .const import FAN_SPEED_AUTO
+from .derived import RixensDerivedState
+
+# Control keys, in the order they are written when several change at once
+CONTROL_SETPOINT = "setpoint"
+CONTROL_FAN_SPEED = "fan_speed"  # 10-100, or FAN_SPEED_AUTO
+CONTROL_FURNACE = "furnace"
+CONTROL_ELECTRIC_HEAT = "electric_heat"
+CONTROL_FLOOR_HEAT = "floor_heat"
+CONTROL_FAN = "fan"
+
+
+@dataclass(frozen=True, slots=True)
+class RixensControl:
+    """A device setting that can be read from a snapshot and written."""
+
+    key: str
+    current_fn: Callable[[RixensData, RixensDerivedState], Any]
+    write_fn: Callable[[RixensApi, Any], Awaitable[None]]
+
+
+CONTROLS: dict[str, RixensControl] = {
+    control.key: control
+    for control in (
+        RixensControl(
+            key=CONTROL_SETPOINT,
+            current_fn=lambda data, _: data.settings.setpoint,
+            write_fn=lambda api, value: api.set_temperature(value),
+        ),
+        RixensControl(
+            key=CONTROL_FAN_SPEED,
+            current_fn=lambda _, derived: (
+                FAN_SPEED_AUTO if derived.fan_auto else derived.fan_configured_speed
+            ),
+            write_fn=lambda api, value: api.set_fan_speed(value),
+        ),
+        RixensControl(
+            key=CONTROL_FURNACE,
+            current_fn=lambda _, derived: derived.furnace_enabled,
+            write_fn=lambda api, value: api.set_furnace(value),
+        ),
+        RixensControl(
+            key=CONTROL_ELECTRIC_HEAT,
+            current_fn=lambda _, derived: derived.electric_enabled,
+            write_fn=lambda api, value: api.set_electric_heat(value),
+        ),
+        RixensControl(
+            key=CONTROL_FLOOR_HEAT,
+            current_fn=lambda data, _: data.settings.floor_src != 0,
+            write_fn=lambda api, value: api.set_floor_heat(value),
+        ),
+        RixensControl(
+            key=CONTROL_FAN,
+            current_fn=lambda data, _: data.settings.fan_state,
+            write_fn=lambda api, value: api.set_fan(value),
+        ),
+    )
+}
+
+
+def diff_controls(
+    target: dict[str, Any], data: RixensData, derived: RixensDerivedState
+) -> list[tuple[RixensControl, Any]]:
+    """Return the controls whose target differs from a snapshot, in write order."""
+    return [
+        (control, target[key])
+        for key, control in CONTROLS.items()
+        if key in target and control.current_fn(data, derived) != target[key]
+    ]
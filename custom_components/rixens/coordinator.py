@@ -4,20 +4,44 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta
 import logging
+import time
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
+from .anomaly import RixensAnomalyDetector
 from .api import RixensApi, RixensApiError, RixensData
-from .const import CONF_PORT, DEFAULT_PORT, DOMAIN
+from .const import (
+    CONF_FUEL_DOSE,
+    CONF_PORT,
+    DEFAULT_FUEL_DOSE,
+    DEFAULT_PORT,
+    DOMAIN,
+    EVENT_ANOMALY,
+    EVENT_CONTROLLER_REBOOT,
+    HISTORY_CAPACITY,
+    SIGNAL_OPTIONS_UPDATED,
+)
+from .cycles import RixensCycleTracker
+from .derived import RixensDerivedState, build_derived_state
+from .faults import RixensFaultTracker
+from .history import RixensHistory
+from .intent import RixensIntents
+from .schedule import RixensScheduler
+from .statistics import RixensStatistics
+from .store import RixensSnapshotStore
+from .thermal import RixensThermal
 
 _LOGGER = logging.getLogger(__name__)
 
 SCAN_INTERVAL = timedelta(seconds=5)
 MAX_FAILED_UPDATES_BEFORE_UNAVAILABLE = 10  # Keep last data for ~50s (10 * 5s)
+BOOT_TIME_TOLERANCE = 60  # seconds of poll latency/clock drift before boot time moves
 
 
 class RixensCoordinator(DataUpdateCoordinator[RixensData]):
@@ -34,28 +58,48 @@ class RixensCoordinator(DataUpdateCoordinator[RixensData]):
             update_interval=SCAN_INTERVAL,
         )
         self.config_entry = entry
+        self._connection = (entry.data[CONF_HOST], entry.data.get(CONF_PORT, DEFAULT_PORT))
         self.api = RixensApi(
-            host=entry.data[CONF_HOST],
-            port=entry.data.get(CONF_PORT, DEFAULT_PORT),
+            host=self._connection[0],
+            port=self._connection[1],
             session=async_get_clientsession(hass),
         )
         self._failed_update_count = 0
         self._last_successful_update: datetime | None = None
         self._is_available = True
+        # True while data is a persisted snapshot from a previous run
+        self.stale = False
+        self.snapshot_store = RixensSnapshotStore(hass, entry.entry_id)
+        self.history = RixensHistory(HISTORY_CAPACITY)
+        self.statistics = RixensStatistics(hass, entry)
+        self.faults = RixensFaultTracker(hass, entry)
+        self.cycles = RixensCycleTracker(hass, entry)
+        self.anomalies = RixensAnomalyDetector()
+        self.schedule = RixensScheduler(hass, entry, self)
+        self.intents = RixensIntents(hass, entry, self)
+        self.thermal = RixensThermal(hass, entry, self)
+        self.boot_time: datetime | None = None
+        self._last_uptime: int | None = None
+        # Cumulative fuel burned in ml, integrated from dosing pump frequency
+        self.fuel_used = 0.0
+        self._last_fuel_rate: float | None = None
+        # Derived state of the snapshot in self.data, built once per update
+        self._derived: RixensDerivedState | None = None
+        self._derived_source: RixensData | None = None
+
+    async def async_load(self) -> None:
+        """Load persisted tracking state before the first update."""
+        await self.faults.async_load()
+        await self.cycles.async_load()
+        await self.schedule.async_load()
+        await self.intents.async_load()
+        await self.thermal.async_load()
 
     async def _async_update_data(self) -> RixensData:
         """Fetch data from API with graceful degradation."""
         try:
             data = await self.api.get_status()
-            # Successful update - reset counters
-            if self._failed_update_count > 0:
-                _LOGGER.info(
-                    "Successfully reconnected to Rixens device after %d failed attempts",
-                    self._failed_update_count,
-                )
-            self._failed_update_count = 0
-            self._last_successful_update = datetime.now()
-            self._is_available = True
+            self._async_process_fresh_data(data)
             return data
         except RixensApiError as err:
             self._failed_update_count += 1
@@ -83,6 +127,159 @@ class RixensCoordinator(DataUpdateCoordinator[RixensData]):
 
             raise UpdateFailed(f"Error communicating with Rixens device: {err}") from err
 
+    @callback
+    def _async_process_fresh_data(self, data: RixensData) -> None:
+        """Record a snapshot freshly fetched from the device."""
+        # Successful update - reset counters
+        if self._failed_update_count > 0:
+            _LOGGER.info(
+                "Successfully reconnected to Rixens device after %d failed attempts",
+                self._failed_update_count,
+            )
+        self._failed_update_count = 0
+        self._last_successful_update = datetime.now()
+        self._is_available = True
+        self.stale = False
+        self.snapshot_store.async_save(data)
+        now = time.time()
+        self.history.append(now, data)
+        self.statistics.async_add(now, data)
+        previous_uptime = self._last_uptime
+        self._track_uptime(data)
+        self._integrate_fuel(data, previous_uptime)
+        self.faults.async_update(data.heater.faults)
+        self.cycles.async_update(now, data.heater.heater_state, self.fuel_used)
+        self._detect_anomalies(data)
+        self.thermal.async_update(now, data)
+        self.intents.async_reconcile()
+
+    @callback
+    def async_seed(self, data: RixensData) -> None:
+        """Use a snapshot fetched moments ago elsewhere as the initial data."""
+        self._async_process_fresh_data(data)
+        self.async_set_updated_data(data)
+
+    @callback
+    def async_apply_options(self) -> bool:
+        """Apply updated config entry options to the running integration.
+
+        Returns:
+            False if the connection settings changed and a reload is needed
+        """
+        entry = self.config_entry
+        if (entry.data[CONF_HOST], entry.data.get(CONF_PORT, DEFAULT_PORT)) != self._connection:
+            return False
+        self.statistics.fuel_dose = entry.options.get(CONF_FUEL_DOSE, DEFAULT_FUEL_DOSE)
+        self._derived = None
+        self.schedule.async_reload()
+        async_dispatcher_send(self.hass, SIGNAL_OPTIONS_UPDATED.format(entry.entry_id))
+        return True
+
+    async def async_restore_snapshot(self) -> bool:
+        """Start from the persisted snapshot of a previous run, if any.
+
+        The restored data is marked as stale and the device as not connected
+        until the first successful poll.
+        """
+        if (data := await self.snapshot_store.async_load()) is None:
+            return False
+        self.stale = True
+        self._is_available = False
+        self.async_set_updated_data(data)
+        return True
+
+    def _track_uptime(self, data: RixensData) -> None:
+        """Derive a stable boot timestamp from uptime and detect reboots.
+
+        A reboot shows up as uptime going backwards and is fired as an event.
+        """
+        rebooted = self._last_uptime is not None and data.uptime < self._last_uptime
+        if rebooted:
+            _LOGGER.warning(
+                "Rixens controller rebooted (uptime went from %ds to %ds)",
+                self._last_uptime,
+                data.uptime,
+            )
+            self.hass.bus.async_fire(
+                EVENT_CONTROLLER_REBOOT,
+                {
+                    "entry_id": self.config_entry.entry_id,
+                    "previous_uptime": self._last_uptime,
+                    "uptime": data.uptime,
+                },
+            )
+        self._last_uptime = data.uptime
+
+        boot_time = (dt_util.utcnow() - timedelta(seconds=data.uptime)).replace(microsecond=0)
+        if (
+            rebooted
+            or self.boot_time is None
+            or abs((boot_time - self.boot_time).total_seconds()) > BOOT_TIME_TOLERANCE
+        ):
+            self.boot_time = boot_time
+
+    def _detect_anomalies(self, data: RixensData) -> None:
+        """Run the anomaly detector and fire an event for each transition."""
+        for transition in self.anomalies.update(data.heater):
+            if transition.active:
+                _LOGGER.warning(
+                    "Rixens anomaly %s detected (value %s, expected %s)",
+                    transition.anomaly,
+                    transition.value,
+                    transition.expected,
+                )
+            else:
+                _LOGGER.info("Rixens anomaly %s cleared", transition.anomaly)
+            self.hass.bus.async_fire(
+                EVENT_ANOMALY,
+                {
+                    "entry_id": self.config_entry.entry_id,
+                    "anomaly": transition.anomaly,
+                    "state": "raised" if transition.active else "cleared",
+                    "value": transition.value,
+                    "expected": transition.expected,
+                },
+            )
+
+    def _integrate_fuel(self, data: RixensData, previous_uptime: int | None) -> None:
+        """Add the fuel burned since the previous poll to the running total.
+
+        Uses the controller's uptime delta as the time base, so poll jitter
+        and missed polls do not skew the result. The interval spanning a
+        controller reboot is skipped since its start is unknown.
+        """
+        fuel_dose = self.config_entry.options.get(CONF_FUEL_DOSE, DEFAULT_FUEL_DOSE)
+        rate = data.heater.dosing_pump * fuel_dose  # ml per second
+        if (
+            self._last_fuel_rate is not None
+            and previous_uptime is not None
+            and (elapsed := data.uptime - previous_uptime) > 0
+        ):
+            # Trapezoidal rule between the two samples
+            self.fuel_used += (self._last_fuel_rate + rate) / 2 * elapsed
+        self._last_fuel_rate = rate
+
+    @callback
+    def async_restore_fuel_used(self, fuel_used: float) -> None:
+        """Add a restored total (ml) to the fuel burned since startup."""
+        self.fuel_used += fuel_used
+
+    @property
+    def derived(self) -> RixensDerivedState | None:
+        """Return the derived state for the current data.
+
+        Built on first access after each update and shared by all entities.
+        """
+        data = self.data
+        if data is None:
+            return None
+        if self._derived is None or self._derived_source is not data:
+            self._derived = build_derived_state(
+                data, self.config_entry.options.get(CONF_FUEL_DOSE, DEFAULT_FUEL_DOSE)
+            )
+            self._derived_source = data
+        return self._derived
+
     @property
     def is_available(self) -> bool:
         """Return if the device is available."""
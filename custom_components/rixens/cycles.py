@@ -0,0 +1,197 @@
+"""Burner cycle analytics from heater state transitions."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import asdict, dataclass
+import logging
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, HEATER_STATE_OFF, HEATER_STATE_RUNNING
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 60  # seconds
+RECENT_CYCLES = 50
+SHORT_CYCLE_SECONDS = 600  # burner runs shorter than this count as short cycles
+
+# Cycle phases derived from heater_state
+PHASE_OFF = "off"
+PHASE_STARTING = "starting"
+PHASE_RUNNING = "running"
+PHASE_STOPPING = "stopping"
+
+
+@dataclass(frozen=True, slots=True)
+class HeaterCycle:
+    """A completed burner cycle, from leaving off until back to off."""
+
+    started: float  # epoch seconds
+    ignition_time: float | None  # seconds until running, None if ignition failed
+    run_time: float  # seconds in the running state
+    shutdown_time: float | None  # seconds from leaving running until off
+    fuel_used: float  # ml
+
+    @property
+    def failed(self) -> bool:
+        """Return True if the burner never reached the running state."""
+        return self.ignition_time is None
+
+
+@dataclass(frozen=True, slots=True)
+class RixensCycleStats:
+    """Totals and rolling averages over the most recent cycles."""
+
+    cycles: int = 0
+    failed_ignitions: int = 0
+    short_cycles: int = 0
+    last_run_time: float | None = None
+    average_run_time: float | None = None
+    average_ignition_time: float | None = None
+    average_fuel_used: float | None = None
+
+
+def _mean(values: list[float]) -> float | None:
+    """Return the mean of values rounded for display, or None if empty."""
+    return round(sum(values) / len(values), 1) if values else None
+
+
+class RixensCycleTracker:
+    """Track burner cycles incrementally from each snapshot's heater state.
+
+    Each poll costs one comparison unless the phase changes; statistics are
+    only recomputed, over a bounded window of recent cycles, when a cycle
+    completes.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize the tracker."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.cycles"
+        )
+        self.recent: deque[HeaterCycle] = deque(maxlen=RECENT_CYCLES)
+        self.stats = RixensCycleStats()
+        self.phase: str | None = None
+        self._started: float | None = None
+        self._ignited: float | None = None
+        self._stopping: float | None = None
+        self._fuel_at_start = 0.0
+
+    async def async_load(self) -> None:
+        """Load persisted totals and recent cycles, dropping them if unreadable."""
+        if (stored := await self._store.async_load()) is None:
+            return
+        try:
+            recent = [HeaterCycle(**cycle) for cycle in stored.get("recent", [])]
+            stats = RixensCycleStats(**stored.get("stats", {}))
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.debug("Discarding incompatible stored cycles: %s", err)
+            return
+        self.recent.extend(recent)
+        self.stats = self._compute_stats(stats)
+
+    @callback
+    def async_update(self, timestamp: float, heater_state: int, fuel_used: float) -> bool:
+        """Process the heater state of a fresh snapshot.
+
+        Returns:
+            True if a cycle completed and the statistics changed
+        """
+        previous = self.phase
+        if heater_state == HEATER_STATE_OFF:
+            phase = PHASE_OFF
+        elif heater_state == HEATER_STATE_RUNNING:
+            phase = PHASE_RUNNING
+        elif previous in (PHASE_RUNNING, PHASE_STOPPING):
+            phase = PHASE_STOPPING
+        else:
+            phase = PHASE_STARTING
+
+        if phase == previous:
+            return False
+        self.phase = phase
+
+        if previous is None:
+            # First observation; a cycle already in progress has no known start
+            return False
+        if previous == PHASE_OFF:
+            self._started = timestamp
+            self._ignited = None
+            self._stopping = None
+            self._fuel_at_start = fuel_used
+        if phase == PHASE_RUNNING:
+            if self._ignited is None:
+                # Not on a return from stopping; ignition time is to first running
+                self._ignited = timestamp
+        elif phase == PHASE_STOPPING:
+            self._stopping = timestamp
+        elif phase == PHASE_OFF and self._started is not None:
+            self._finish_cycle(timestamp, fuel_used)
+            return True
+        return False
+
+    def _finish_cycle(self, timestamp: float, fuel_used: float) -> None:
+        """Record the cycle that just ended."""
+        started, ignited = self._started, self._ignited
+        stopped = self._stopping if self._stopping is not None else timestamp
+        cycle = HeaterCycle(
+            started=started,
+            ignition_time=None if ignited is None else ignited - started,
+            run_time=0.0 if ignited is None else stopped - ignited,
+            shutdown_time=None if ignited is None else timestamp - stopped,
+            fuel_used=round(fuel_used - self._fuel_at_start, 2),
+        )
+        self._started = None
+        self.recent.append(cycle)
+
+        stats = self.stats
+        self.stats = self._compute_stats(
+            RixensCycleStats(
+                cycles=stats.cycles + 1,
+                failed_ignitions=stats.failed_ignitions + cycle.failed,
+                short_cycles=stats.short_cycles
+                + (not cycle.failed and cycle.run_time < SHORT_CYCLE_SECONDS),
+            )
+        )
+        if cycle.failed:
+            _LOGGER.warning("Rixens heater ignition failed after %.0fs", timestamp - started)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _compute_stats(self, totals: RixensCycleStats) -> RixensCycleStats:
+        """Return totals combined with averages over the recent cycles."""
+        ignited = [cycle for cycle in self.recent if not cycle.failed]
+        return RixensCycleStats(
+            cycles=totals.cycles,
+            failed_ignitions=totals.failed_ignitions,
+            short_cycles=totals.short_cycles,
+            last_run_time=ignited[-1].run_time if ignited else None,
+            average_run_time=_mean([cycle.run_time for cycle in ignited]),
+            average_ignition_time=_mean([cycle.ignition_time for cycle in ignited]),
+            average_fuel_used=_mean([cycle.fuel_used for cycle in ignited]),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics and recent cycles."""
+        return {
+            "phase": self.phase,
+            "stats": asdict(self.stats),
+            "recent": [asdict(cycle) for cycle in self.recent],
+        }
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to write to storage."""
+        stats = self.stats
+        return {
+            "stats": {
+                "cycles": stats.cycles,
+                "failed_ignitions": stats.failed_ignitions,
+                "short_cycles": stats.short_cycles,
+            },
+            "recent": [asdict(cycle) for cycle in self.recent],
+        }
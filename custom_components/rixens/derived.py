@@ -0,0 +1,97 @@
+"""Derived state computed once per Rixens update."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .api import RixensData
+from .const import FAN_SPEED_AUTO, FAN_SPEED_MAX, FAN_SPEED_MIN
+
+# Heat source selection values
+SOURCE_OFF = 0
+SOURCE_ACTIVE = 2
+
+# HVAC actions, matching homeassistant.components.climate.HVACAction values
+ACTION_OFF = "off"
+ACTION_IDLE = "idle"
+ACTION_HEATING = "heating"
+
+
+@dataclass(frozen=True, slots=True)
+class RixensDerivedState:
+    """Normalized values shared by all entities for one snapshot."""
+
+    fan_auto: bool
+    fan_mode: str  # "auto" or the configured speed as reported
+    fan_configured_speed: int | None  # manual speed, None in auto mode
+    fan_speed: int | None  # speed shown by the fan speed entity
+    furnace_enabled: bool
+    furnace_active: bool
+    electric_enabled: bool
+    electric_active: bool
+    engine_enabled: bool
+    engine_active: bool
+    heat_enabled: bool  # any of furnace, electric or engine enabled
+    hvac_action: str
+    fuel_rate: float  # ml/h
+
+
+def is_heating(data: RixensData) -> bool:
+    """Return True if the system calls for heat and a source is actively heating."""
+    settings = data.settings
+    return data.system_heat and SOURCE_ACTIVE in (
+        settings.furnace_src,
+        settings.electric_src,
+        settings.engine_src,
+    )
+
+
+def build_derived_state(data: RixensData, fuel_dose: float) -> RixensDerivedState:
+    """Compute the derived state for a snapshot."""
+    settings = data.settings
+
+    fan_auto = settings.fan_speed in ("Auto", str(FAN_SPEED_AUTO))
+    configured_speed: int | None = None
+    if not fan_auto:
+        try:
+            configured_speed = int(settings.fan_speed)
+        except ValueError:
+            configured_speed = None
+
+    if fan_auto:
+        # In auto mode show the actual PID-controlled speed, 0 when the heater is off
+        pid_speed = data.heater.pid_speed
+        fan_speed = 0 if pid_speed == 0 else max(FAN_SPEED_MIN, min(FAN_SPEED_MAX, pid_speed))
+    elif configured_speed is not None:
+        fan_speed = max(FAN_SPEED_MIN, min(FAN_SPEED_MAX, configured_speed))
+    else:
+        fan_speed = None
+
+    # Only furnace, electric and engine are actual heat sources
+    furnace, electric, engine = settings.furnace_src, settings.electric_src, settings.engine_src
+    heat_enabled = furnace != SOURCE_OFF or electric != SOURCE_OFF or engine != SOURCE_OFF
+    if not heat_enabled:
+        hvac_action = ACTION_OFF
+    elif is_heating(data):
+        # Calling for heat and at least one source actively heating
+        hvac_action = ACTION_HEATING
+    else:
+        # Not calling for heat, or calling but not heating yet (startup delay, etc.)
+        hvac_action = ACTION_IDLE
+
+    return RixensDerivedState(
+        fan_auto=fan_auto,
+        fan_mode="auto" if fan_auto else settings.fan_speed,
+        fan_configured_speed=configured_speed,
+        fan_speed=fan_speed,
+        furnace_enabled=furnace != SOURCE_OFF,
+        furnace_active=furnace == SOURCE_ACTIVE,
+        electric_enabled=electric != SOURCE_OFF,
+        electric_active=electric == SOURCE_ACTIVE,
+        engine_enabled=engine != SOURCE_OFF,
+        engine_active=engine == SOURCE_ACTIVE,
+        heat_enabled=heat_enabled,
+        hvac_action=hvac_action,
+        # Convert Hz to ml/h: dosing_pump (Hz) * fuel_dose (ml/dose) * 3600 (sec/hr)
+        fuel_rate=round(data.heater.dosing_pump * fuel_dose * 3600, 2),
+    )
@@ -0,0 +1,158 @@
+"""Network discovery of Rixens controllers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from dataclasses import dataclass
+from ipaddress import IPv4Address, IPv4Network
+import logging
+from xml.etree import ElementTree
+
+import aiohttp
+
+_LOGGER = logging.getLogger(__name__)
+
+PROBE_TIMEOUT = 1.0  # seconds per host
+PROBE_CONCURRENCY = 128
+MAX_RESPONSE_BYTES = 65536  # read from a host before giving up on a signature
+MIN_PREFIX_LENGTH = 20  # largest sweep is 4094 hosts
+
+
+@dataclass(frozen=True, slots=True)
+class DiscoveredDevice:
+    """A controller that answered a discovery probe."""
+
+    host: str
+    port: int
+    version: str
+    heat_version: str
+
+
+def parse_network(value: str) -> IPv4Network:
+    """Parse a CIDR (or a single address) to probe.
+
+    Raises:
+        ValueError: If the value is not an IPv4 network or is too large
+    """
+    network = IPv4Network(value.strip(), strict=False)
+    if network.prefixlen < MIN_PREFIX_LENGTH:
+        raise ValueError(f"{network} is larger than /{MIN_PREFIX_LENGTH}")
+    return network
+
+
+def local_network(address: str, prefix_length: int) -> IPv4Network:
+    """Return the network to sweep around a local interface address.
+
+    Networks larger than a /24 are narrowed to the /24 holding the address.
+    """
+    return IPv4Network(f"{address}/{max(prefix_length, 24)}", strict=False)
+
+
+def _hosts(network: IPv4Network) -> Iterator[IPv4Address]:
+    """Return the addresses to probe in a network."""
+    if network.num_addresses == 1:
+        return iter((network.network_address,))
+    return network.hosts()
+
+
+class SignatureReader:
+    """Incremental reader of the signature at the start of a status document.
+
+    Chunks are fed to a pull parser, and reading stops as soon as the
+    `<version>` and `<heatversion>` elements of the `<response>` root have
+    been seen. The rest of the document, such as a long
+    `<wifi_scan_results>` list, is never parsed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the reader."""
+        self._parser = ElementTree.XMLPullParser(events=("start", "end"))
+        self._depth = 0
+        self._fields: dict[str, str] = {}
+        self.done = False
+        self.signature: tuple[str, str] | None = None
+
+    def feed(self, data: bytes) -> None:
+        """Parse another chunk; sets `done` once the outcome is known."""
+        try:
+            self._parser.feed(data)
+            events = list(self._parser.read_events())
+        except ElementTree.ParseError:
+            self.done = True
+            return
+        for event, element in events:
+            if event == "start":
+                self._depth += 1
+                if self._depth == 1 and element.tag != "response":
+                    self.done = True
+                    return
+                continue
+            if self._depth == 2 and element.tag in ("version", "heatversion"):
+                self._fields[element.tag] = (element.text or "").strip()
+            self._depth -= 1
+            if self._depth == 0:
+                # Root closed without a signature
+                self.done = True
+                return
+            if self._fields.get("version") and "heatversion" in self._fields:
+                self.signature = (self._fields["version"], self._fields["heatversion"])
+                self.done = True
+                return
+
+
+async def async_probe(
+    session: aiohttp.ClientSession,
+    host: str,
+    port: int = 80,
+    timeout: float = PROBE_TIMEOUT,
+) -> DiscoveredDevice | None:
+    """Probe a single host for a Rixens status document.
+
+    Only as much of the response is read as needed to find the signature,
+    and at most MAX_RESPONSE_BYTES from hosts that aren't controllers.
+    """
+    url = f"http://{host}:{port}/status.xml" if port != 80 else f"http://{host}/status.xml"
+    reader = SignatureReader()
+    try:
+        async with asyncio.timeout(timeout):
+            async with session.get(url, allow_redirects=False) as response:
+                if response.status != 200:
+                    return None
+                received = 0
+                async for chunk in response.content.iter_any():
+                    reader.feed(chunk)
+                    received += len(chunk)
+                    if reader.done or received >= MAX_RESPONSE_BYTES:
+                        break
+    except (TimeoutError, aiohttp.ClientError, OSError):
+        return None
+
+    if (signature := reader.signature) is None:
+        return None
+    return DiscoveredDevice(host=host, port=port, version=signature[0], heat_version=signature[1])
+
+
+async def async_discover(
+    session: aiohttp.ClientSession,
+    networks: list[IPv4Network],
+    port: int = 80,
+    timeout: float = PROBE_TIMEOUT,
+    concurrency: int = PROBE_CONCURRENCY,
+) -> list[DiscoveredDevice]:
+    """Probe every host in the given networks with bounded concurrency.
+
+    A fixed pool of workers pulls addresses from a shared iterator, so a
+    sweep holds at most `concurrency` connections and tasks at a time.
+    """
+    addresses = (address for network in networks for address in _hosts(network))
+    found: list[DiscoveredDevice] = []
+
+    async def _worker() -> None:
+        for address in addresses:
+            if (device := await async_probe(session, str(address), port, timeout)) is not None:
+                _LOGGER.debug("Found Rixens controller at %s (%s)", device.host, device.version)
+                found.append(device)
+
+    await asyncio.gather(*(_worker() for _ in range(concurrency)))
+    return sorted(found, key=lambda device: IPv4Address(device.host))
@@ -0,0 +1,113 @@
+"""Base entities for Rixens."""
+
+from __future__ import annotations
+
+from datetime import datetime
+import math
+import time
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import ATTR_STALE, CONF_MIN_INTERVALS, SIGNAL_OPTIONS_UPDATED
+from .coordinator import RixensCoordinator
+
+
+class RixensEntity(CoordinatorEntity[RixensCoordinator]):
+    """Coordinator entity showing data of the device.
+
+    Until the first successful poll after startup the data is a snapshot
+    restored from a previous run. Entities keep showing it, flagged by a
+    `stale` attribute, so they are not mistaken for live values.
+    """
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the stale flag while the data is a restored snapshot."""
+        return {ATTR_STALE: True} if self.coordinator.stale else {}
+
+
+class RixensThrottledEntity(RixensEntity):
+    """Coordinator entity with a configurable minimum interval between writes.
+
+    The interval is set per entity key in the options. Updates arriving
+    within the interval are coalesced into a single write scheduled for
+    when it has passed, which publishes whatever the state is by then.
+    Changes of availability, of the stale flag or of a value the user
+    controls are always written at once, so commands show up in the UI
+    without delay.
+    """
+
+    def __init__(self, coordinator: RixensCoordinator) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._min_interval = 0.0
+        self._written_at = -math.inf
+        self._written_control: Any = None
+        self._unsub_write: CALLBACK_TYPE | None = None
+
+    @property
+    def _throttle_key(self) -> str:
+        """Return the key the minimum interval is configured under."""
+        return self.entity_description.key
+
+    def _control_state(self) -> Any:
+        """Return the values whose change is written without delay."""
+        return self.available
+
+    async def async_added_to_hass(self) -> None:
+        """Load the minimum interval and subscribe to options changes."""
+        self._load_min_interval()
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_OPTIONS_UPDATED.format(self.coordinator.config_entry.entry_id),
+                self._load_min_interval,
+            )
+        )
+        self.async_on_remove(self._async_cancel_write)
+
+    @callback
+    def _load_min_interval(self) -> None:
+        """Load the minimum interval of this entity from the options."""
+        intervals = self.coordinator.config_entry.options.get(CONF_MIN_INTERVALS, {})
+        self._min_interval = float(intervals.get(self._throttle_key, 0))
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state, or schedule one coalesced write if within the interval."""
+        control = self.coordinator.stale, self._control_state()
+        if control != self._written_control:
+            self._async_write_now(control)
+        elif self._unsub_write is not None:
+            # The scheduled write will publish this update too
+            return
+        elif (remaining := self._written_at + self._min_interval - time.monotonic()) <= 0:
+            self._async_write_now(control)
+        else:
+            self._unsub_write = async_call_later(self.hass, remaining, self._async_write_scheduled)
+
+    @callback
+    def _async_write_scheduled(self, _now: datetime) -> None:
+        """Publish the latest state once the interval has passed."""
+        self._unsub_write = None
+        self._async_write_now((self.coordinator.stale, self._control_state()))
+
+    @callback
+    def _async_write_now(self, control: Any) -> None:
+        """Write the state and start a new interval."""
+        self._async_cancel_write()
+        self._written_at = time.monotonic()
+        self._written_control = control
+        self.async_write_ha_state()
+
+    @callback
+    def _async_cancel_write(self) -> None:
+        """Cancel a scheduled write."""
+        if self._unsub_write is not None:
+            self._unsub_write()
+            self._unsub_write = None
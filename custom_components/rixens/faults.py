@@ -0,0 +1,107 @@
+"""Heater fault transition tracking for Rixens devices."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .api import FAULT_NAMES, NO_FAULTS
+from .const import DOMAIN, EVENT_FAULT
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 10  # seconds; faults are rare, so save soon after a change
+
+
+class RixensFaultTracker:
+    """Diff heater faults between snapshots and fire transition events.
+
+    Snapshots share the fault tuple while nothing changes, so the common
+    case is a single identity check. Otherwise only differing entries are
+    visited. Raise counts and the last seen values are persisted so
+    restarts neither lose counts nor re-report faults that were already
+    active.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize the tracker."""
+        self.hass = hass
+        self._entry = entry
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.faults"
+        )
+        self._values: tuple[int, ...] = NO_FAULTS
+        self.counts: dict[str, int] = dict.fromkeys(FAULT_NAMES, 0)
+
+    @property
+    def active(self) -> tuple[str, ...]:
+        """Return the codes of the currently active faults."""
+        if self._values is NO_FAULTS:
+            return ()
+        return tuple(name for name, value in zip(FAULT_NAMES, self._values) if value)
+
+    def value(self, name: str) -> int:
+        """Return the current value of a fault code."""
+        return self._values[FAULT_NAMES.index(name)]
+
+    async def async_load(self) -> None:
+        """Load persisted counts and last seen values."""
+        if (stored := await self._store.async_load()) is None:
+            return
+        for name, count in stored.get("counts", {}).items():
+            if name in self.counts:
+                self.counts[name] = count
+        values = tuple(stored.get("values", NO_FAULTS))
+        if len(values) == len(FAULT_NAMES) and any(values):
+            self._values = values
+
+    @callback
+    def async_update(self, faults: tuple[int, ...]) -> bool:
+        """Process the faults of a fresh snapshot.
+
+        Returns:
+            True if any fault changed
+        """
+        previous = self._values
+        if faults is previous or faults == previous:
+            return False
+
+        entry_id = self._entry.entry_id
+        for index, (old, new) in enumerate(zip(previous, faults)):
+            if old == new:
+                continue
+            name = FAULT_NAMES[index]
+            if not old:
+                state = "raised"
+                self.counts[name] += 1
+                _LOGGER.warning("Rixens heater fault %s raised (value %d)", name, new)
+            elif not new:
+                state = "cleared"
+                _LOGGER.info("Rixens heater fault %s cleared", name)
+            else:
+                state = "changed"
+            self.hass.bus.async_fire(
+                EVENT_FAULT,
+                {
+                    "entry_id": entry_id,
+                    "code": name,
+                    "state": state,
+                    "value": new,
+                    "previous_value": old,
+                    "count": self.counts[name],
+                },
+            )
+
+        self._values = NO_FAULTS if not any(faults) else faults
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        return True
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to write to storage."""
+        return {"counts": self.counts, "values": list(self._values)}
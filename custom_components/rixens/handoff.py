@@ -0,0 +1,37 @@
+"""Short-lived handoff of config flow snapshots to new coordinators."""
+
+from __future__ import annotations
+
+import time
+
+from homeassistant.core import HomeAssistant, callback
+
+from .api import RixensData
+from .const import DOMAIN
+
+DATA_HANDOFF = f"{DOMAIN}_handoff"
+HANDOFF_MAX_AGE = 30  # seconds
+
+
+@callback
+def async_store_validated(hass: HomeAssistant, host: str, port: int, data: RixensData) -> None:
+    """Keep the snapshot fetched while validating a host for the coming setup."""
+    handoff: dict[tuple[str, int], tuple[float, RixensData]] = hass.data.setdefault(
+        DATA_HANDOFF, {}
+    )
+    handoff[(host, port)] = (time.monotonic(), data)
+
+
+@callback
+def async_pop_validated(hass: HomeAssistant, host: str, port: int) -> RixensData | None:
+    """Return the validated snapshot for a host if it is still fresh.
+
+    The snapshot is removed either way, so it is used at most once.
+    """
+    handoff: dict[tuple[str, int], tuple[float, RixensData]] = hass.data.get(DATA_HANDOFF, {})
+    if (entry := handoff.pop((host, port), None)) is None:
+        return None
+    stored_at, data = entry
+    if time.monotonic() - stored_at > HANDOFF_MAX_AGE:
+        return None
+    return data
@@ -0,0 +1,147 @@
+"""In-memory telemetry history for Rixens devices."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable
+from dataclasses import fields
+from operator import attrgetter
+from typing import Any
+
+from .api import RixensData, RixensHeaterData, RixensSettings
+
+# array typecodes for the annotated field types that are stored
+_TYPECODES = {"float": "d", "int": "q", "bool": "b"}
+
+
+def _numeric_columns() -> tuple[tuple[str, str, Callable[[RixensData], Any]], ...]:
+    """Return (name, typecode, getter) for every numeric snapshot field.
+
+    Nested fields use dotted names matching attribute access, such as
+    "heater.outlet_temp" or "settings.setpoint".
+    """
+    columns: list[tuple[str, str, Callable[[RixensData], Any]]] = []
+    for prefix, cls in (("", RixensData), ("heater.", RixensHeaterData), ("settings.", RixensSettings)):
+        for field in fields(cls):
+            if (typecode := _TYPECODES.get(str(field.type))) is not None:
+                name = f"{prefix}{field.name}"
+                columns.append((name, typecode, attrgetter(name)))
+    return tuple(columns)
+
+
+HISTORY_FIELDS: tuple[str, ...] = tuple(name for name, _, _ in _numeric_columns())
+
+
+class RixensHistory:
+    """Fixed-capacity, column-oriented ring buffer of status snapshots.
+
+    Each numeric field is stored in its own typed array, so a device costs
+    a fixed amount of memory regardless of how long it has been polled and
+    windowed queries never touch unrelated fields.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize the buffer with room for `capacity` snapshots."""
+        self._capacity = capacity
+        self._columns = _numeric_columns()
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._values: dict[str, array] = {
+            name: array(typecode, bytes(array(typecode).itemsize * capacity))
+            for name, typecode, _ in self._columns
+        }
+        self._next = 0
+        self._size = 0
+
+    @property
+    def capacity(self) -> int:
+        """Return the maximum number of snapshots retained."""
+        return self._capacity
+
+    def __len__(self) -> int:
+        """Return the number of snapshots currently retained."""
+        return self._size
+
+    def append(self, timestamp: float, data: RixensData) -> None:
+        """Store a snapshot, overwriting the oldest one when full."""
+        index = self._next
+        self._timestamps[index] = timestamp
+        values = self._values
+        for name, _, getter in self._columns:
+            values[name][index] = getter(data)
+        self._next = (index + 1) % self._capacity
+        if self._size < self._capacity:
+            self._size += 1
+
+    def clear(self) -> None:
+        """Drop all retained snapshots."""
+        self._next = 0
+        self._size = 0
+
+    def _physical(self, position: int) -> int:
+        """Map a chronological position to an array index."""
+        return (self._next - self._size + position) % self._capacity
+
+    def _timestamp_at(self, position: int) -> float:
+        """Return the timestamp at a chronological position."""
+        return self._timestamps[self._physical(position)]
+
+    def _window(self, start: float | None, end: float | None) -> range:
+        """Return the chronological positions with start <= timestamp <= end."""
+        positions = range(self._size)
+        key = self._timestamp_at
+        first = 0 if start is None else bisect_left(positions, start, key=key)
+        last = self._size if end is None else bisect_right(positions, end, key=key)
+        return range(first, max(first, last))
+
+    def query(
+        self,
+        names: Iterable[str],
+        start: float | None = None,
+        end: float | None = None,
+        percentiles: Iterable[float] = (),
+        include_samples: bool = True,
+    ) -> dict[str, Any]:
+        """Return samples and aggregates for the given fields within a window.
+
+        Raises:
+            KeyError: If a field name is not recorded
+        """
+        names = list(names)
+        for name in names:
+            if name not in self._values:
+                raise KeyError(name)
+        percentiles = sorted(percentiles)
+        window = self._window(start, end)
+        indexes = [self._physical(position) for position in window]
+
+        result: dict[str, Any] = {"count": len(indexes), "fields": {}}
+        if include_samples:
+            result["timestamps"] = [self._timestamps[index] for index in indexes]
+
+        for name in names:
+            column = self._values[name]
+            samples = [column[index] for index in indexes]
+            entry: dict[str, Any] = {}
+            if include_samples:
+                entry["values"] = samples
+            if samples:
+                ordered = sorted(samples)
+                entry["min"] = ordered[0]
+                entry["max"] = ordered[-1]
+                entry["mean"] = sum(ordered) / len(ordered)
+                if percentiles:
+                    entry["percentiles"] = {
+                        f"p{q:g}": _percentile(ordered, q) for q in percentiles
+                    }
+            result["fields"][name] = entry
+
+        return result
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    """Return the q-th percentile of sorted values using linear interpolation."""
+    rank = (len(ordered) - 1) * q / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
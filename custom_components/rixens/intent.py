@@ -0,0 +1,163 @@
+"""Desired state of Rixens controls, reconciled with the device."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
+
+from .api import RixensApiError
+from .const import DOMAIN, SIGNAL_INTENTS_UPDATED
+from .controls import CONTROLS, RixensControl, diff_controls
+
+if TYPE_CHECKING:
+    from .coordinator import RixensCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 1  # seconds; pending intents must survive a restart soon after a command
+
+
+class RixensIntents:
+    """Latest requested value per control, kept until it reaches the device.
+
+    Entity commands record their intent here before writing. A write that
+    fails because the device is unreachable leaves the intent pending
+    instead of raising, and a newer command for the same control replaces
+    it. Pending intents are persisted and reconciled against the next
+    fresh snapshot, so a write that failed while polling still worked is
+    retried at the next poll rather than after the next outage. Intents
+    the device already matches are dropped and only the differing
+    controls are written, once each, in a fixed order.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, coordinator: RixensCoordinator) -> None:
+        """Initialize the intent store."""
+        self.hass = hass
+        self._entry = entry
+        self._coordinator = coordinator
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.intents"
+        )
+        self.pending: dict[str, Any] = {}
+        self._write_lock = asyncio.Lock()
+        self._reconcile_task: asyncio.Task[None] | None = None
+
+    async def async_load(self) -> None:
+        """Load persisted pending intents."""
+        if (stored := await self._store.async_load()) is None:
+            return
+        self.pending = {
+            key: value for key, value in stored.get("pending", {}).items() if key in CONTROLS
+        }
+
+    async def async_set(self, target: dict[str, Any], skip_matching: bool = False) -> None:
+        """Record intents for one or more controls and try to write them.
+
+        The controls are written in the order of CONTROLS. Anything that
+        can't be written stays pending for the next fresh snapshot.
+
+        Args:
+            target: Control keys mapped to their requested values
+            skip_matching: Only write controls that differ from the live state
+        """
+        coordinator = self._coordinator
+        if not coordinator.is_available or coordinator.stale:
+            self.pending.update(target)
+            self._changed()
+            _LOGGER.info("Rixens device unavailable, queued %s", target)
+            return
+        if skip_matching and coordinator.derived is not None:
+            writes = diff_controls(target, coordinator.data, coordinator.derived)
+            for key in target.keys() - {control.key for control, _ in writes}:
+                # Drop older intents the new target already matches
+                self.pending.pop(key, None)
+        else:
+            writes = [(CONTROLS[key], target[key]) for key in CONTROLS if key in target]
+        self.pending.update({control.key: value for control, value in writes})
+        self._changed()
+        written = await self._async_write(writes)
+        if written:
+            await coordinator.async_request_refresh()
+
+    @callback
+    def async_reconcile(self) -> None:
+        """Reconcile pending intents once the fresh snapshot being processed is stored.
+
+        Called for every fresh snapshot. Does nothing while a write or an
+        earlier reconcile is still in flight; that write already covers
+        the pending intents.
+        """
+        if not self.pending or self._write_lock.locked():
+            return
+        if self._reconcile_task is not None and not self._reconcile_task.done():
+            return
+        self._reconcile_task = self._entry.async_create_background_task(
+            self.hass, self._async_reconcile(), f"{DOMAIN} reconcile {self._entry.entry_id}"
+        )
+
+    async def _async_reconcile(self) -> None:
+        """Write only the pending controls that differ from the device."""
+        coordinator = self._coordinator
+        if (derived := coordinator.derived) is None:
+            return
+        writes = diff_controls(self.pending, coordinator.data, derived)
+        differing = {control.key for control, _ in writes}
+        for key in [key for key in self.pending if key not in differing]:
+            # The device already matches; nothing to send
+            del self.pending[key]
+        self._changed()
+        if not writes:
+            return
+        _LOGGER.info(
+            "Reconciling Rixens device with pending %s",
+            {control.key: value for control, value in writes},
+        )
+        if await self._async_write(writes):
+            await coordinator.async_request_refresh()
+
+    async def _async_write(self, writes: list[tuple[RixensControl, Any]]) -> bool:
+        """Write controls, clearing each intent once it has been sent.
+
+        Stops at the first connection failure and leaves the rest pending.
+
+        Returns:
+            True if anything was written
+        """
+        written = False
+        async with self._write_lock:
+            for control, value in writes:
+                if self.pending.get(control.key, value) != value:
+                    # Superseded by a newer command while waiting for the lock
+                    continue
+                try:
+                    await control.write_fn(self._coordinator.api, value)
+                except RixensApiError as err:
+                    _LOGGER.warning(
+                        "Failed to set Rixens %s, keeping it pending for the next poll: %s",
+                        control.key,
+                        err,
+                    )
+                    break
+                written = True
+                if self.pending.get(control.key) == value:
+                    del self.pending[control.key]
+        self._changed()
+        return written
+
+    @callback
+    def _changed(self) -> None:
+        """Persist the pending intents and update the entity showing them."""
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        async_dispatcher_send(self.hass, SIGNAL_INTENTS_UPDATED.format(self._entry.entry_id))
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to write to storage."""
+        return {"pending": self.pending}
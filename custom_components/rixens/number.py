@@ -10,10 +10,11 @@ from homeassistant.const import PERCENTAGE
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, FAN_SPEED_AUTO, FAN_SPEED_MAX, FAN_SPEED_MIN, FAN_SPEED_STEP
+from .const import DOMAIN, FAN_SPEED_MAX, FAN_SPEED_MIN, FAN_SPEED_STEP
+from .controls import CONTROL_FAN_SPEED
 from .coordinator import RixensCoordinator
+from .entity import RixensThrottledEntity
 
 
 async def async_setup_entry(
@@ -26,7 +27,7 @@ async def async_setup_entry(
     async_add_entities([RixensFanSpeed(coordinator)])
 
 
-class RixensFanSpeed(CoordinatorEntity[RixensCoordinator], NumberEntity):
+class RixensFanSpeed(RixensThrottledEntity, NumberEntity):
     """Representation of Rixens fan speed control."""
 
     _attr_has_entity_name = True
@@ -36,6 +37,7 @@ class RixensFanSpeed(CoordinatorEntity[RixensCoordinator], NumberEntity):
     _attr_native_step = FAN_SPEED_STEP
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_mode = NumberMode.SLIDER
+    _throttle_key = "fan_speed"
 
     def __init__(self, coordinator: RixensCoordinator) -> None:
         """Initialize the number entity."""
@@ -45,12 +47,14 @@ class RixensFanSpeed(CoordinatorEntity[RixensCoordinator], NumberEntity):
             identifiers={(DOMAIN, coordinator.config_entry.entry_id)},
         )
 
-    def _is_auto_mode(self) -> bool:
-        """Check if fan is in auto mode."""
-        if not self.coordinator.data:
-            return False
-        fan_speed = self.coordinator.data.settings.fan_speed
-        return fan_speed == "Auto" or fan_speed == str(FAN_SPEED_AUTO)
+    def _control_state(self) -> Any:
+        """Return the availability and configured fan mode, written without delay.
+
+        The actual speed shown in auto mode is a measurement and is capped.
+        """
+        if (derived := self.coordinator.derived) is None:
+            return self.available, None, None
+        return self.available, derived.fan_auto, derived.fan_configured_speed
 
     @property
     def native_value(self) -> float | None:
@@ -59,43 +63,24 @@ class RixensFanSpeed(CoordinatorEntity[RixensCoordinator], NumberEntity):
         In auto mode, returns the actual PID-controlled speed.
         In manual mode, returns the configured setpoint.
         """
-        if not self.coordinator.data:
-            return None
-
-        # In auto mode, display actual PID-controlled speed
-        if self._is_auto_mode():
-            pid_speed = self.coordinator.data.heater.pid_speed
-            # Return 0 if heater is off, otherwise clamp to valid range
-            if pid_speed == 0:
-                return 0
-            return max(FAN_SPEED_MIN, min(FAN_SPEED_MAX, pid_speed))
-
-        # In manual mode, display configured setpoint
-        fan_speed = self.coordinator.data.settings.fan_speed
-        try:
-            speed = int(fan_speed)
-            return max(FAN_SPEED_MIN, min(FAN_SPEED_MAX, speed))
-        except ValueError:
+        if (derived := self.coordinator.derived) is None:
             return None
+        return derived.fan_speed
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        if not self.coordinator.data:
-            return {}
+        if (derived := self.coordinator.derived) is None:
+            return super().extra_state_attributes
 
-        is_auto = self._is_auto_mode()
-        attributes = {
-            "mode": "auto" if is_auto else "manual",
+        attributes = super().extra_state_attributes | {
+            "mode": "auto" if derived.fan_auto else "manual",
             "actual_speed": self.coordinator.data.heater.pid_speed,
         }
 
         # Add configured speed when in manual mode
-        if not is_auto:
-            try:
-                attributes["configured_speed"] = int(self.coordinator.data.settings.fan_speed)
-            except ValueError:
-                pass
+        if derived.fan_configured_speed is not None:
+            attributes["configured_speed"] = derived.fan_configured_speed
 
         return attributes
 
@@ -105,5 +90,4 @@ class RixensFanSpeed(CoordinatorEntity[RixensCoordinator], NumberEntity):
         If currently in auto mode, this will switch to manual mode
         with the specified speed.
         """
-        await self.coordinator.api.set_fan_speed(int(value))
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.intents.async_set({CONTROL_FAN_SPEED: int(value)})
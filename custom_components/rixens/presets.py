@@ -0,0 +1,106 @@
+"""Multi-field comfort presets for Rixens devices."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from .api import RixensData
+from .const import FAN_SPEED_AUTO
+from .controls import (
+    CONTROL_ELECTRIC_HEAT,
+    CONTROL_FAN_SPEED,
+    CONTROL_FURNACE,
+    CONTROL_SETPOINT,
+    CONTROLS,
+    diff_controls,
+)
+from .derived import SOURCE_OFF, RixensDerivedState
+
+# The preset stored on the controller itself
+PRESET_DEVICE = "device"
+
+# User preset names, in the order they are matched against the live state
+USER_PRESETS = ("away", "home", "sleep")
+
+# Default preset temperatures (can be customized via integration options)
+DEFAULT_PRESET_TEMPS = {
+    "away": 10.0,  # Freeze protection
+    "home": 20.0,  # Comfortable living
+    "sleep": 18.0,  # Night time
+}
+
+# Option values for preset fields that are left as they are
+UNCHANGED = "unchanged"
+PRESET_FAN_OPTIONS = [UNCHANGED, "auto", *(str(speed) for speed in range(10, 101, 10))]
+PRESET_SOURCE_OPTIONS = [UNCHANGED, "on", "off"]
+
+
+def preset_option(name: str, control: str) -> str:
+    """Return the options key of a preset field."""
+    if control == CONTROL_SETPOINT:
+        return f"preset_{name}_temp"
+    return f"preset_{name}_{control}"
+
+
+@dataclass(frozen=True, slots=True)
+class RixensPreset:
+    """Target values of the controls a preset sets, in write order."""
+
+    name: str
+    values: Mapping[str, Any]
+
+    def matches(self, data: RixensData, derived: RixensDerivedState) -> bool:
+        """Return True if the live state has every value of the preset."""
+        return not diff_controls(dict(self.values), data, derived)
+
+
+def load_presets(options: Mapping[str, Any]) -> dict[str, RixensPreset]:
+    """Build the user presets from the config entry options."""
+    presets: dict[str, RixensPreset] = {}
+    for name in USER_PRESETS:
+        values: dict[str, Any] = {
+            CONTROL_SETPOINT: options.get(
+                preset_option(name, CONTROL_SETPOINT), DEFAULT_PRESET_TEMPS[name]
+            )
+        }
+        fan = options.get(preset_option(name, CONTROL_FAN_SPEED), UNCHANGED)
+        if fan != UNCHANGED:
+            values[CONTROL_FAN_SPEED] = FAN_SPEED_AUTO if fan == "auto" else int(fan)
+        for control in (CONTROL_FURNACE, CONTROL_ELECTRIC_HEAT):
+            source = options.get(preset_option(name, control), UNCHANGED)
+            if source != UNCHANGED:
+                values[control] = source == "on"
+        presets[name] = RixensPreset(
+            name, {key: values[key] for key in CONTROLS if key in values}
+        )
+    return presets
+
+
+def device_preset(data: RixensData) -> RixensPreset:
+    """Return the preset stored on the controller as writable control values.
+
+    The engine source and constant heat of the device preset can't be set
+    through the API and are not part of it, nor is an unrecognized fan speed.
+    """
+    settings = data.settings
+    values: dict[str, Any] = {CONTROL_SETPOINT: settings.preset_setpoint}
+    fan = settings.preset_fan_speed
+    if fan in ("Auto", str(FAN_SPEED_AUTO)):
+        values[CONTROL_FAN_SPEED] = FAN_SPEED_AUTO
+    elif fan.isdigit():
+        values[CONTROL_FAN_SPEED] = int(fan)
+    values[CONTROL_FURNACE] = settings.preset_furnace_src != SOURCE_OFF
+    values[CONTROL_ELECTRIC_HEAT] = settings.preset_electric_src != SOURCE_OFF
+    return RixensPreset(PRESET_DEVICE, values)
+
+
+def current_preset(
+    presets: Mapping[str, RixensPreset], data: RixensData, derived: RixensDerivedState
+) -> str | None:
+    """Return the first preset the live state matches, or None."""
+    for preset in (*presets.values(), device_preset(data)):
+        if preset.matches(data, derived):
+            return preset.name
+    return None
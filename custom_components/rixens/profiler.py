@@ -0,0 +1,105 @@
+"""On-demand profiling of live Rixens poll cycles."""
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import io
+import logging
+import pstats
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import DOMAIN
+from .coordinator import RixensCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Only one profiler can be attached to the event loop thread at a time
+_PROFILE_LOCK = asyncio.Lock()
+
+
+async def async_profile_cycles(
+    hass: HomeAssistant,
+    coordinator: RixensCoordinator,
+    cycles: int,
+    seconds: float,
+    top: int,
+) -> dict[str, Any]:
+    """Profile the next coordinator cycles and write the results to disk.
+
+    The profiler runs on the event loop thread, so it captures the request,
+    the XML parse (unless it was moved to an executor), the listener fan-out
+    and every entity state write of each cycle. It is switched off after
+    `cycles` updates or `seconds` elapsed, whichever comes first.
+
+    Returns:
+        The profile file path, the number of cycles captured, the elapsed
+        time, a top-N cumulative summary and the status parse statistics
+    """
+    if _PROFILE_LOCK.locked():
+        raise HomeAssistantError("A Rixens profile is already running")
+
+    async with _PROFILE_LOCK:
+        profiler = cProfile.Profile()
+        finished = asyncio.Event()
+        captured = 0
+
+        @callback
+        def _async_cycle_done() -> None:
+            """Count a completed coordinator cycle."""
+            nonlocal captured
+            captured += 1
+            if captured >= cycles:
+                # Let the rest of this cycle's fan-out and state writes run first
+                hass.loop.call_soon(finished.set)
+
+        remove_listener = coordinator.async_add_listener(_async_cycle_done)
+        started = time.monotonic()
+        try:
+            profiler.enable()
+        except ValueError as err:
+            remove_listener()
+            raise HomeAssistantError(f"Unable to start profiler: {err}") from err
+
+        try:
+            async with asyncio.timeout(seconds):
+                await finished.wait()
+        except TimeoutError:
+            pass
+        finally:
+            profiler.disable()
+            remove_listener()
+
+        elapsed = time.monotonic() - started
+        path = hass.config.path(
+            f"{DOMAIN}_profile_{coordinator.config_entry.entry_id}_{int(time.time())}.prof"
+        )
+        await hass.async_add_executor_job(profiler.dump_stats, path)
+
+    summary = _summarize(profiler, top)
+    _LOGGER.warning(
+        "Rixens profile of %d cycle(s) over %.1fs written to %s\n%s",
+        captured,
+        elapsed,
+        path,
+        summary,
+    )
+    return {
+        "path": path,
+        "cycles": captured,
+        "seconds": round(elapsed, 3),
+        "summary": summary,
+        "parse": coordinator.api.parse_stats.as_dict(),
+    }
+
+
+def _summarize(profiler: cProfile.Profile, top: int) -> str:
+    """Render the top entries of a profile sorted by cumulative time."""
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    return stream.getvalue()
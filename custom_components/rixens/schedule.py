@@ -0,0 +1,248 @@
+"""Local weekday schedule of setpoint, fan and heat source changes."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+import logging
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_SCHEDULE,
+    DOMAIN,
+    FAN_SPEED_AUTO,
+    FAN_SPEED_MAX,
+    FAN_SPEED_MIN,
+    TEMP_MAX,
+    TEMP_MIN,
+)
+from .controls import (
+    CONTROL_ELECTRIC_HEAT,
+    CONTROL_FAN_SPEED,
+    CONTROL_FLOOR_HEAT,
+    CONTROL_FURNACE,
+    CONTROL_SETPOINT,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import RixensCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 10  # seconds
+MAX_CATCH_UP = timedelta(days=7)  # a full week covers every transition once
+
+WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+# Controls a schedule entry can set
+SCHEDULE_FIELDS = (
+    CONTROL_SETPOINT,
+    CONTROL_FAN_SPEED,
+    CONTROL_FURNACE,
+    CONTROL_ELECTRIC_HEAT,
+    CONTROL_FLOOR_HEAT,
+)
+
+
+def _fan_speed(value: Any) -> int:
+    """Validate a fan speed, mapping "auto" to the device's auto value."""
+    if isinstance(value, str) and value.lower() == "auto":
+        return FAN_SPEED_AUTO
+    return vol.All(vol.Coerce(int), vol.Range(min=FAN_SPEED_MIN, max=FAN_SPEED_MAX))(value)
+
+
+SCHEDULE_ENTRY_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional("days", default=list(WEEKDAYS)): vol.All(
+                cv.ensure_list, vol.Length(min=1), [vol.All(vol.Lower, vol.In(WEEKDAYS))]
+            ),
+            vol.Required("time"): cv.time,
+            vol.Optional(CONTROL_SETPOINT): vol.All(
+                vol.Coerce(float), vol.Range(min=TEMP_MIN, max=TEMP_MAX)
+            ),
+            vol.Optional(CONTROL_FAN_SPEED): _fan_speed,
+            vol.Optional(CONTROL_FURNACE): cv.boolean,
+            vol.Optional(CONTROL_ELECTRIC_HEAT): cv.boolean,
+            vol.Optional(CONTROL_FLOOR_HEAT): cv.boolean,
+        }
+    ),
+    cv.has_at_least_one_key(*SCHEDULE_FIELDS),
+)
+SCHEDULE_SCHEMA = vol.All(cv.ensure_list, [SCHEDULE_ENTRY_SCHEMA])
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduleTransition:
+    """Fields to set at a time of day on one weekday."""
+
+    weekday: int  # 0 = Monday
+    at: time
+    values: tuple[tuple[str, Any], ...]  # (field, value) in SCHEDULE_FIELDS order
+
+
+def parse_schedule(raw: list[dict[str, Any]]) -> tuple[tuple[ScheduleTransition, ...], ...]:
+    """Validate a stored schedule and group its transitions by weekday.
+
+    Raises:
+        vol.Invalid: If the schedule is malformed
+    """
+    by_weekday: list[list[ScheduleTransition]] = [[] for _ in WEEKDAYS]
+    for entry in SCHEDULE_SCHEMA(raw):
+        values = tuple((key, entry[key]) for key in SCHEDULE_FIELDS if key in entry)
+        for day in entry["days"]:
+            weekday = WEEKDAYS.index(day)
+            by_weekday[weekday].append(ScheduleTransition(weekday, entry["time"], values))
+    return tuple(tuple(sorted(day, key=lambda item: item.at)) for day in by_weekday)
+
+
+def occurrences(
+    schedule: tuple[tuple[ScheduleTransition, ...], ...],
+    start: datetime,
+    end: datetime,
+) -> Iterator[tuple[datetime, ScheduleTransition]]:
+    """Yield transitions with start < time <= end in chronological order.
+
+    Times are built per calendar date in the timezone of `start`, so
+    transitions keep their wall-clock time across DST changes.
+    """
+    tzinfo = start.tzinfo
+    date = start.date()
+    while date <= end.date():
+        for transition in schedule[date.weekday()]:
+            when = datetime.combine(date, transition.at, tzinfo)
+            if start < when <= end:
+                yield when, transition
+        date += timedelta(days=1)
+
+
+def next_occurrence(
+    schedule: tuple[tuple[ScheduleTransition, ...], ...], after: datetime
+) -> datetime | None:
+    """Return the first transition time after `after`, if any."""
+    for when, _ in occurrences(schedule, after, after + MAX_CATCH_UP):
+        return when
+    return None
+
+
+class RixensScheduler:
+    """Apply a weekday schedule from a single timer.
+
+    Only the timer for the next transition is ever armed. Each run applies
+    every transition since the previous run, collapsed so the latest value
+    of each field wins, and hands the result to the command intents with
+    matching fields skipped, so only fields that differ from the current
+    device state are written. A transition the device can't take stays
+    pending there until the next fresh snapshot. The time of the last run
+    is persisted, so transitions missed while Home Assistant was down are
+    caught up at startup.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, coordinator: RixensCoordinator) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._entry = entry
+        self._coordinator = coordinator
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.schedule"
+        )
+        self._raw: list[dict[str, Any]] = []
+        self._schedule: tuple[tuple[ScheduleTransition, ...], ...] = ((),) * len(WEEKDAYS)
+        self._last_run: datetime | None = None
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self.next_transition: datetime | None = None
+
+    async def async_load(self) -> None:
+        """Load the schedule from the options and the time of the last run."""
+        self._load_schedule()
+        if (stored := await self._store.async_load()) is not None and (
+            last_run := dt_util.parse_datetime(stored.get("last_run") or "")
+        ) is not None:
+            self._last_run = last_run
+
+    def _load_schedule(self) -> None:
+        """Parse the schedule stored in the entry options."""
+        self._raw = self._entry.options.get(CONF_SCHEDULE, [])
+        try:
+            self._schedule = parse_schedule(self._raw)
+        except vol.Invalid as err:
+            _LOGGER.error("Ignoring invalid Rixens schedule: %s", err)
+            self._schedule = ((),) * len(WEEKDAYS)
+
+    @callback
+    def async_start(self) -> None:
+        """Catch up on missed transitions and arm the timer for the next one."""
+        if self._last_run is None:
+            # Nothing to catch up on before the first run
+            self._set_last_run(dt_util.now())
+        self._entry.async_create_background_task(
+            self.hass, self._async_run(), f"{DOMAIN} schedule {self._entry.entry_id}"
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the timer."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    @callback
+    def async_reload(self) -> None:
+        """Apply an updated schedule from the options.
+
+        Transitions earlier than now that were added by the change are not
+        applied retroactively; the schedule takes effect from now on.
+        """
+        if self._entry.options.get(CONF_SCHEDULE, []) == self._raw:
+            return
+        self._load_schedule()
+        self._set_last_run(dt_util.now())
+        self._arm_timer(dt_util.now())
+
+    @callback
+    def _arm_timer(self, now: datetime) -> None:
+        """Arm the single timer for the next transition."""
+        self.async_stop()
+        when = self.next_transition = next_occurrence(self._schedule, now)
+        if when is not None:
+            self._unsub_timer = async_track_point_in_time(self.hass, self._async_timer_fired, when)
+
+    async def _async_timer_fired(self, _now: datetime) -> None:
+        """Handle the timer."""
+        self._unsub_timer = None
+        await self._async_run()
+
+    async def _async_run(self) -> None:
+        """Apply the transitions due since the last run."""
+        now = dt_util.now()
+        start = max(self._last_run, now - MAX_CATCH_UP)
+        target: dict[str, Any] = {}
+        for _, transition in occurrences(self._schedule, dt_util.as_local(start), now):
+            target.update(transition.values)
+
+        if target:
+            _LOGGER.debug("Rixens schedule transition to %s", target)
+            await self._coordinator.intents.async_set(target, skip_matching=True)
+        self._set_last_run(now)
+        self._arm_timer(now)
+
+    def _set_last_run(self, when: datetime) -> None:
+        """Record the time of the last run."""
+        self._last_run = when
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to write to storage."""
+        return {"last_run": self._last_run.isoformat() if self._last_run else None}
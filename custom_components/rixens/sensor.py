@@ -4,8 +4,12 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from datetime import datetime
+import time
+from typing import Any
 
 from homeassistant.components.sensor import (
+    RestoreSensor,
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
@@ -21,14 +25,29 @@ from homeassistant.const import (
     UnitOfTime,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
 from .api import RixensData
-from .const import CONF_FUEL_DOSE, DEFAULT_FUEL_DOSE, DOMAIN
+from .const import (
+    CONF_DEADBAND,
+    CONF_DEADBAND_RELATIVE,
+    CONF_MAX_SILENT_INTERVAL,
+    CONF_PRECISION,
+    CONF_RUNTIME_BUCKET,
+    DEFAULT_MAX_SILENT_INTERVAL,
+    DEFAULT_RUNTIME_BUCKET,
+    DOMAIN,
+    SIGNAL_INTENTS_UPDATED,
+    SIGNAL_OPTIONS_UPDATED,
+)
 from .coordinator import RixensCoordinator
+from .cycles import RixensCycleStats
+from .entity import RixensThrottledEntity
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -36,6 +55,12 @@ class RixensSensorEntityDescription(SensorEntityDescription):
     """Describes a Rixens sensor entity."""
 
     value_fn: Callable[[RixensData], float | int | str | None]
+    # Noise filtering: a new state is only published when the value moves by
+    # at least the larger of the absolute deadband and the relative deadband
+    # (in percent of the last published value), or when the max silent
+    # interval expires. Values are rounded to suggested_display_precision first.
+    deadband: float | None = None
+    deadband_relative: float = 0.0
 
 
 SENSOR_DESCRIPTIONS: tuple[RixensSensorEntityDescription, ...] = (
@@ -71,7 +96,10 @@ SENSOR_DESCRIPTIONS: tuple[RixensSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
+        suggested_display_precision=1,
         value_fn=lambda data: data.heater.flame_temp,
+        deadband=2.0,
+        deadband_relative=1.0,
     ),
     RixensSensorEntityDescription(
         key="inlet_temperature",
@@ -106,7 +134,7 @@ SENSOR_DESCRIPTIONS: tuple[RixensSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.DURATION,
         state_class=SensorStateClass.TOTAL_INCREASING,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.heater.runtime,
+        value_fn=lambda data: data.heater.runtime,  # Rounded to buckets in native_value
     ),
     RixensSensorEntityDescription(
         key="system_uptime",
@@ -115,6 +143,8 @@ SENSOR_DESCRIPTIONS: tuple[RixensSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.DURATION,
         state_class=SensorStateClass.TOTAL_INCREASING,
         entity_category=EntityCategory.DIAGNOSTIC,
+        # Changes on every poll; superseded by the last boot sensor
+        entity_registry_enabled_default=False,
         value_fn=lambda data: data.uptime,
     ),
     RixensSensorEntityDescription(
@@ -123,7 +153,9 @@ SENSOR_DESCRIPTIONS: tuple[RixensSensorEntityDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
+        suggested_display_precision=0,
         value_fn=lambda data: data.heater.pid_speed,
+        deadband=2.0,
     ),
     RixensSensorEntityDescription(
         key="burner_motor",
@@ -131,7 +163,10 @@ SENSOR_DESCRIPTIONS: tuple[RixensSensorEntityDescription, ...] = (
         native_unit_of_measurement="RPM",
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
+        suggested_display_precision=0,
         value_fn=lambda data: data.heater.burner_motor,
+        deadband=50.0,
+        deadband_relative=2.0,
     ),
     RixensSensorEntityDescription(
         key="dosing_pump",
@@ -171,6 +206,57 @@ SENSOR_DESCRIPTIONS: tuple[RixensSensorEntityDescription, ...] = (
 )
 
 
+@dataclass(frozen=True, kw_only=True)
+class RixensCycleSensorEntityDescription(SensorEntityDescription):
+    """Describes a Rixens burner cycle statistics sensor."""
+
+    value_fn: Callable[[RixensCycleStats], float | int | None]
+
+
+CYCLE_SENSOR_DESCRIPTIONS: tuple[RixensCycleSensorEntityDescription, ...] = (
+    RixensCycleSensorEntityDescription(
+        key="heater_cycles",
+        translation_key="heater_cycles",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda stats: stats.cycles,
+    ),
+    RixensCycleSensorEntityDescription(
+        key="failed_ignitions",
+        translation_key="failed_ignitions",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda stats: stats.failed_ignitions,
+    ),
+    RixensCycleSensorEntityDescription(
+        key="short_cycles",
+        translation_key="short_cycles",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda stats: stats.short_cycles,
+    ),
+    RixensCycleSensorEntityDescription(
+        key="average_run_time",
+        translation_key="average_run_time",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_unit_of_measurement=UnitOfTime.MINUTES,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda stats: stats.average_run_time,
+    ),
+    RixensCycleSensorEntityDescription(
+        key="average_ignition_time",
+        translation_key="average_ignition_time",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda stats: stats.average_ignition_time,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -178,12 +264,20 @@ async def async_setup_entry(
 ) -> None:
     """Set up Rixens sensors based on a config entry."""
     coordinator: RixensCoordinator = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities(
+    entities: list[SensorEntity] = [
         RixensSensor(coordinator, description) for description in SENSOR_DESCRIPTIONS
+    ]
+    entities.append(RixensLastBootSensor(coordinator))
+    entities.append(RixensFuelUsedSensor(coordinator))
+    entities.append(RixensPendingCommandsSensor(coordinator))
+    entities.append(RixensWarmUpSensor(coordinator))
+    entities.extend(
+        RixensCycleSensor(coordinator, description) for description in CYCLE_SENSOR_DESCRIPTIONS
     )
+    async_add_entities(entities)
 
 
-class RixensSensor(CoordinatorEntity[RixensCoordinator], SensorEntity):
+class RixensSensor(RixensThrottledEntity, SensorEntity):
     """Representation of a Rixens sensor."""
 
     _attr_has_entity_name = True
@@ -202,19 +296,328 @@ class RixensSensor(CoordinatorEntity[RixensCoordinator], SensorEntity):
             identifiers={(DOMAIN, coordinator.config_entry.entry_id)},
         )
 
+        self._deadband: float | None = None
+        self._deadband_relative = 0.0
+        self._precision: int | None = None
+        self._max_silent_interval = 0.0
+        self._load_options()
+        self._published_value = self._current_value()
+        self._published_available = self.available, self.coordinator.stale
+        self._published_at = time.monotonic()
+
+    def _load_options(self) -> None:
+        """Load deadband filtering options, configurable per sensor."""
+        description = self.entity_description
+        if description.deadband is None:
+            return
+        options = self.coordinator.config_entry.options
+        key = description.key
+        self._deadband = options.get(f"{key}_{CONF_DEADBAND}", description.deadband)
+        self._deadband_relative = (
+            options.get(f"{key}_{CONF_DEADBAND_RELATIVE}", description.deadband_relative) / 100
+        )
+        self._precision = options.get(
+            f"{key}_{CONF_PRECISION}", description.suggested_display_precision
+        )
+        self._attr_suggested_display_precision = self._precision
+        self._max_silent_interval = options.get(
+            CONF_MAX_SILENT_INTERVAL, DEFAULT_MAX_SILENT_INTERVAL
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to options changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_OPTIONS_UPDATED.format(self.coordinator.config_entry.entry_id),
+                self._async_options_updated,
+            )
+        )
+
+    @callback
+    def _async_options_updated(self) -> None:
+        """Apply changed options and publish the value they produce."""
+        self._load_options()
+        self._published_value = self._current_value()
+        self._published_available = self.available, self.coordinator.stale
+        self._published_at = time.monotonic()
+        self.async_write_ha_state()
+
     @property
     def native_value(self) -> float | int | str | None:
         """Return the state of the sensor."""
+        if self._deadband is not None:
+            return self._published_value
+        return self._current_value()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when a deadbanded value has moved meaningfully."""
+        if self._deadband is not None and not self._should_publish():
+            return
+        super()._handle_coordinator_update()
+
+    def _should_publish(self) -> bool:
+        """Return True and remember the value if a new state should be written."""
+        value = self._current_value()
+        published = self._published_value
+        available = self.available, self.coordinator.stale
+        now = time.monotonic()
+        if (
+            value is None
+            or published is None
+            or available != self._published_available
+            or now - self._published_at >= self._max_silent_interval
+            or abs(value - published)
+            >= max(self._deadband, abs(published) * self._deadband_relative)
+        ):
+            self._published_value = value
+            self._published_available = available
+            self._published_at = now
+            return True
+        return False
+
+    def _current_value(self) -> float | int | str | None:
+        """Return the latest value from the coordinator data."""
         if self.coordinator.data:
             value = self.entity_description.value_fn(self.coordinator.data)
 
-            # Special handling for fuel consumption - apply configurable dose
+            # Fuel consumption applies the configurable dose, see derived state
             if self.entity_description.key == "fuel_consumption" and value:
-                fuel_dose = self.coordinator.config_entry.options.get(
-                    CONF_FUEL_DOSE, DEFAULT_FUEL_DOSE
+                return self.coordinator.derived.fuel_rate
+
+            # Round runtime down to whole buckets so it rarely changes
+            if self.entity_description.key == "heater_runtime":
+                bucket = 60 * self.coordinator.config_entry.options.get(
+                    CONF_RUNTIME_BUCKET, DEFAULT_RUNTIME_BUCKET
                 )
-                # Convert Hz to ml/h: dosing_pump (Hz) * fuel_dose (ml/dose) * 3600 (sec/hr)
-                return round(value * fuel_dose * 3600, 2)
+                return value - value % bucket
 
+            if self._precision is not None and isinstance(value, float):
+                return round(value, self._precision) if self._precision else round(value)
             return value
         return None
+
+
+class RixensLastBootSensor(RixensThrottledEntity, SensorEntity):
+    """Timestamp of the last controller boot, derived from its uptime.
+
+    Unlike the raw uptime counter this only changes when the controller
+    reboots, so it does not produce a recorder row on every poll.
+    """
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "last_boot"
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _throttle_key = "last_boot"
+
+    def __init__(self, coordinator: RixensCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_last_boot"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, coordinator.config_entry.entry_id)},
+        )
+
+    @property
+    def native_value(self) -> datetime | None:
+        """Return the time the controller last booted."""
+        return self.coordinator.boot_time
+
+
+class RixensFuelUsedSensor(RixensThrottledEntity, RestoreSensor):
+    """Cumulative fuel burned, integrated by the coordinator.
+
+    The total is restored on startup, so it keeps increasing across Home
+    Assistant restarts and controller reboots and can be used in the
+    Energy dashboard.
+    """
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "fuel_used"
+    _attr_device_class = SensorDeviceClass.VOLUME
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = UnitOfVolume.LITERS
+    _attr_suggested_display_precision = 3
+    _throttle_key = "fuel_used"
+
+    def __init__(self, coordinator: RixensCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_fuel_used"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, coordinator.config_entry.entry_id)},
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the previous total."""
+        await super().async_added_to_hass()
+        if (last_data := await self.async_get_last_sensor_data()) is None:
+            return
+        try:
+            restored = float(last_data.native_value)
+        except (TypeError, ValueError):
+            return
+        self.coordinator.async_restore_fuel_used(restored * 1000)
+
+    @property
+    def native_value(self) -> float:
+        """Return the fuel burned in liters."""
+        return round(self.coordinator.fuel_used / 1000, 4)
+
+
+class RixensPendingCommandsSensor(CoordinatorEntity[RixensCoordinator], SensorEntity):
+    """Number of commands waiting for the device to become reachable.
+
+    Available even while the device is offline, since that is when
+    commands are queued.
+    """
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "pending_commands"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, coordinator: RixensCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_pending_commands"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, coordinator.config_entry.entry_id)},
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to changes of the pending commands."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_INTENTS_UPDATED.format(self.coordinator.config_entry.entry_id),
+                self.async_write_ha_state,
+            )
+        )
+
+    @property
+    def available(self) -> bool:
+        """Pending commands are known regardless of the connection."""
+        return True
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of pending commands."""
+        return len(self.coordinator.intents.pending)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the pending value of each control."""
+        return {"pending": dict(self.coordinator.intents.pending)}
+
+
+class RixensWarmUpSensor(RixensThrottledEntity, SensorEntity):
+    """Predicted heating time from the current temperature to the setpoint.
+
+    Predicted by the learned thermal model and rounded to whole minutes, so
+    the state is only written when the prediction moves by a minute.
+    """
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "warm_up_time"
+    _attr_native_unit_of_measurement = UnitOfTime.MINUTES
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _throttle_key = "warm_up_time"
+
+    def __init__(self, coordinator: RixensCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_warm_up_time"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, coordinator.config_entry.entry_id)},
+        )
+        self._published: tuple[Any, ...] | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the prediction, plan or availability changed."""
+        thermal = self.coordinator.thermal
+        published = (
+            self.native_value,
+            thermal.plan,
+            thermal.model.trained,
+            self.available,
+            self.coordinator.stale,
+        )
+        if published == self._published:
+            return
+        self._published = published
+        super()._handle_coordinator_update()
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the predicted warm-up time in minutes."""
+        if (data := self.coordinator.data) is None:
+            return None
+        seconds = self.coordinator.thermal.model.warm_up_time(
+            data.current_temp, data.settings.setpoint
+        )
+        return None if seconds is None else round(seconds / 60)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the fitted model and the pending pre-heat."""
+        thermal = self.coordinator.thermal
+        attributes: dict[str, Any] = {
+            **super().extra_state_attributes,
+            **thermal.model.as_dict(),
+            "preheat_target": None,
+        }
+        if (plan := thermal.plan) is not None and (data := self.coordinator.data) is not None:
+            attributes["preheat_target"] = plan.target
+            attributes["preheat_deadline"] = dt_util.utc_from_timestamp(plan.deadline)
+            attributes["preheat_start"] = dt_util.utc_from_timestamp(
+                thermal.planned_start(data.current_temp)
+            )
+        return attributes
+
+
+class RixensCycleSensor(RixensThrottledEntity, SensorEntity):
+    """Burner cycle statistics kept by the coordinator's cycle tracker.
+
+    The statistics only change when a cycle completes, so the state is
+    only written then instead of on every poll.
+    """
+
+    _attr_has_entity_name = True
+    entity_description: RixensCycleSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: RixensCoordinator,
+        description: RixensCycleSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, coordinator.config_entry.entry_id)},
+        )
+        self._stats: RixensCycleStats | None = None
+        self._available: tuple[bool, bool] | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the statistics or availability changed."""
+        stats = self.coordinator.cycles.stats
+        available = self.available, self.coordinator.stale
+        if stats is self._stats and available == self._available:
+            return
+        self._stats = stats
+        self._available = available
+        super()._handle_coordinator_update()
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the statistic."""
+        return self.entity_description.value_fn(self.coordinator.cycles.stats)
@@ -0,0 +1,258 @@
+"""Services for the Rixens integration."""
+
+from __future__ import annotations
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.importlib import async_import_module
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_CYCLES,
+    ATTR_DURATION,
+    ATTR_END,
+    ATTR_FIELDS,
+    ATTR_INCLUDE_SAMPLES,
+    ATTR_MINUTES,
+    ATTR_PERCENTILES,
+    ATTR_RATE,
+    ATTR_SECONDS,
+    ATTR_START,
+    ATTR_TEMPERATURE,
+    ATTR_TIME,
+    ATTR_TOP,
+    ATTR_WRITE_FILE,
+    DEFAULT_BURST_DURATION,
+    DEFAULT_BURST_FIELDS,
+    DEFAULT_BURST_RATE,
+    DEFAULT_HISTORY_MINUTES,
+    DEFAULT_HISTORY_PERCENTILES,
+    DEFAULT_PROFILE_CYCLES,
+    DEFAULT_PROFILE_SECONDS,
+    DEFAULT_PROFILE_TOP,
+    DOMAIN,
+    MAX_BURST_DURATION,
+    MAX_BURST_RATE,
+    SERVICE_CANCEL_PREHEAT,
+    SERVICE_GET_CYCLES,
+    SERVICE_GET_HISTORY,
+    SERVICE_PREHEAT,
+    SERVICE_PROFILE,
+    SERVICE_START_BURST_CAPTURE,
+    TEMP_MAX,
+    TEMP_MIN,
+)
+from .coordinator import RixensCoordinator
+from .history import HISTORY_FIELDS
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_CYCLES, default=DEFAULT_PROFILE_CYCLES): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=100)
+        ),
+        vol.Optional(ATTR_SECONDS, default=DEFAULT_PROFILE_SECONDS): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=600)
+        ),
+        vol.Optional(ATTR_TOP, default=DEFAULT_PROFILE_TOP): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=200)
+        ),
+    }
+)
+
+GET_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_FIELDS): vol.All(cv.ensure_list, [vol.In(HISTORY_FIELDS)]),
+        vol.Optional(ATTR_MINUTES, default=DEFAULT_HISTORY_MINUTES): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_PERCENTILES, default=DEFAULT_HISTORY_PERCENTILES): vol.All(
+            cv.ensure_list, [vol.All(vol.Coerce(float), vol.Range(min=0, max=100))]
+        ),
+        vol.Optional(ATTR_INCLUDE_SAMPLES, default=True): cv.boolean,
+    }
+)
+
+
+GET_CYCLES_SCHEMA = vol.Schema({vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string})
+
+START_BURST_CAPTURE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_FIELDS, default=DEFAULT_BURST_FIELDS): vol.All(
+            cv.ensure_list, vol.Length(min=1), [vol.In(HISTORY_FIELDS)]
+        ),
+        vol.Optional(ATTR_RATE, default=DEFAULT_BURST_RATE): vol.All(
+            vol.Coerce(float), vol.Range(min=0.2, max=MAX_BURST_RATE)
+        ),
+        vol.Optional(ATTR_DURATION, default=DEFAULT_BURST_DURATION): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=MAX_BURST_DURATION)
+        ),
+        vol.Optional(ATTR_WRITE_FILE, default=False): cv.boolean,
+        vol.Optional(ATTR_INCLUDE_SAMPLES, default=False): cv.boolean,
+    }
+)
+
+PREHEAT_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_TEMPERATURE): vol.All(
+            vol.Coerce(float), vol.Range(min=TEMP_MIN, max=TEMP_MAX)
+        ),
+        vol.Required(ATTR_TIME): cv.datetime,
+    }
+)
+
+CANCEL_PREHEAT_SCHEMA = vol.Schema({vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string})
+
+
+def get_coordinator(hass: HomeAssistant, entry_id: str | None) -> RixensCoordinator:
+    """Return the coordinator of a loaded config entry.
+
+    The config entry may be omitted when exactly one Rixens device is loaded.
+    """
+    coordinators: dict[str, RixensCoordinator] = hass.data.get(DOMAIN, {})
+
+    if entry_id is None:
+        if len(coordinators) != 1:
+            raise ServiceValidationError(
+                f"{ATTR_CONFIG_ENTRY_ID} is required when {len(coordinators)} Rixens devices are loaded"
+            )
+        return next(iter(coordinators.values()))
+
+    if (coordinator := coordinators.get(entry_id)) is None:
+        raise ServiceValidationError(f"No loaded Rixens device for config entry {entry_id}")
+    return coordinator
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Rixens services."""
+
+    async def async_profile(call: ServiceCall) -> ServiceResponse:
+        """Profile the next poll cycles of a device."""
+        coordinator = get_coordinator(hass, call.data.get(ATTR_CONFIG_ENTRY_ID))
+        # cProfile/pstats are only needed here, so load them on first use
+        profiler = await async_import_module(hass, f"{__package__}.profiler")
+        return await profiler.async_profile_cycles(
+            hass,
+            coordinator,
+            cycles=call.data[ATTR_CYCLES],
+            seconds=call.data[ATTR_SECONDS],
+            top=call.data[ATTR_TOP],
+        )
+
+    async def async_get_history(call: ServiceCall) -> ServiceResponse:
+        """Return windowed samples and aggregates from the in-memory history.
+
+        The window ends at `end` (default: now) and starts at `start`, or
+        `minutes` before the end when no start is given.
+        """
+        coordinator = get_coordinator(hass, call.data.get(ATTR_CONFIG_ENTRY_ID))
+        # Times without a timezone are local time
+        end = dt_util.as_local(call.data.get(ATTR_END, dt_util.utcnow())).timestamp()
+        if ATTR_START in call.data:
+            start = dt_util.as_local(call.data[ATTR_START]).timestamp()
+        else:
+            start = end - call.data[ATTR_MINUTES] * 60
+        if start > end:
+            raise ServiceValidationError(f"{ATTR_START} must be before {ATTR_END}")
+
+        result = coordinator.history.query(
+            call.data[ATTR_FIELDS],
+            start=start,
+            end=end,
+            percentiles=call.data[ATTR_PERCENTILES],
+            include_samples=call.data[ATTR_INCLUDE_SAMPLES],
+        )
+        return {"start": start, "end": end, **result}
+
+    async def async_get_cycles(call: ServiceCall) -> ServiceResponse:
+        """Return burner cycle statistics and the most recent cycles."""
+        return get_coordinator(hass, call.data.get(ATTR_CONFIG_ENTRY_ID)).cycles.as_dict()
+
+    async def async_start_burst_capture(call: ServiceCall) -> ServiceResponse:
+        """Capture high-rate samples of a device and return a summary."""
+        coordinator = get_coordinator(hass, call.data.get(ATTR_CONFIG_ENTRY_ID))
+        burst = await async_import_module(hass, f"{__package__}.burst")
+        return await burst.async_burst_capture(
+            hass,
+            coordinator,
+            fields=call.data[ATTR_FIELDS],
+            rate=call.data[ATTR_RATE],
+            duration=call.data[ATTR_DURATION],
+            write_file=call.data[ATTR_WRITE_FILE],
+            include_samples=call.data[ATTR_INCLUDE_SAMPLES],
+        )
+
+    async def async_preheat(call: ServiceCall) -> ServiceResponse:
+        """Reach a temperature by a time, starting the heater just in time."""
+        coordinator = get_coordinator(hass, call.data.get(ATTR_CONFIG_ENTRY_ID))
+        # A time without a timezone is local time
+        deadline = dt_util.as_local(call.data[ATTR_TIME]).timestamp()
+        if deadline <= dt_util.utcnow().timestamp():
+            raise ServiceValidationError(f"{ATTR_TIME} must be in the future")
+        result = coordinator.thermal.async_set_plan(call.data[ATTR_TEMPERATURE], deadline)
+        coordinator.async_update_listeners()
+        return result
+
+    async def async_cancel_preheat(call: ServiceCall) -> None:
+        """Cancel a pending pre-heat."""
+        coordinator = get_coordinator(hass, call.data.get(ATTR_CONFIG_ENTRY_ID))
+        coordinator.thermal.async_cancel_plan()
+        coordinator.async_update_listeners()
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        async_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_HISTORY,
+        async_get_history,
+        schema=GET_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_CYCLES,
+        async_get_cycles,
+        schema=GET_CYCLES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_START_BURST_CAPTURE,
+        async_start_burst_capture,
+        schema=START_BURST_CAPTURE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PREHEAT,
+        async_preheat,
+        schema=PREHEAT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CANCEL_PREHEAT,
+        async_cancel_preheat,
+        schema=CANCEL_PREHEAT_SCHEMA,
+    )
@@ -0,0 +1,247 @@
+"""Long-term statistics aggregated in memory for Rixens devices."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+import logging
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfElectricPotential, UnitOfTemperature, UnitOfVolume
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util, slugify
+
+from .api import RixensData
+from .const import CONF_FUEL_DOSE, DEFAULT_FUEL_DOSE, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+LONG_TERM_PERIOD = 3600  # seconds
+MAX_INTEGRATION_GAP = 60  # seconds; longer gaps between polls are not integrated
+
+
+@dataclass(frozen=True, slots=True)
+class RixensStatisticDescription:
+    """Describes a statistic aggregated from status snapshots."""
+
+    key: str
+    name: str
+    unit: str
+    value_fn: Callable[[RixensData, float], float]  # (data, fuel dose) -> value
+    # Import the time integral (value per hour) as a sum instead of mean/min/max
+    integrate: bool = False
+
+
+def _fuel_rate(data: RixensData, fuel_dose: float) -> float:
+    """Return fuel consumption in ml/h."""
+    return data.heater.dosing_pump * fuel_dose * 3600
+
+
+STATISTIC_DESCRIPTIONS: tuple[RixensStatisticDescription, ...] = (
+    RixensStatisticDescription(
+        key="outlet_temperature",
+        name="Outlet temperature",
+        unit=UnitOfTemperature.CELSIUS,
+        value_fn=lambda data, _: data.heater.outlet_temp,
+    ),
+    RixensStatisticDescription(
+        key="battery_voltage",
+        name="Battery voltage",
+        unit=UnitOfElectricPotential.VOLT,
+        value_fn=lambda data, _: data.heater.battery_voltage,
+    ),
+    RixensStatisticDescription(
+        key="fuel_consumption",
+        name="Fuel consumption",
+        unit=f"{UnitOfVolume.MILLILITERS}/h",
+        value_fn=_fuel_rate,
+    ),
+    RixensStatisticDescription(
+        key="fuel_used",
+        name="Fuel used",
+        unit=UnitOfVolume.MILLILITERS,
+        value_fn=_fuel_rate,
+        integrate=True,
+    ),
+)
+
+
+class StatisticBucket:
+    """Running aggregate of one statistic over one period."""
+
+    __slots__ = ("count", "integral", "maximum", "minimum", "total")
+
+    def __init__(self) -> None:
+        """Initialize an empty bucket."""
+        self.count = 0
+        self.total = 0.0
+        self.minimum = float("inf")
+        self.maximum = float("-inf")
+        self.integral = 0.0
+
+    @property
+    def mean(self) -> float:
+        """Return the mean of the samples in the bucket."""
+        return self.total / self.count
+
+    def add(self, value: float, hours: float) -> None:
+        """Add a sample that lasted `hours` since the previous one."""
+        self.count += 1
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        self.integral += value * hours
+
+
+class RixensStatistics:
+    """Aggregate high-rate fields into hourly buckets.
+
+    Hourly buckets are imported as external long-term statistics, so the
+    statistics stay complete even when the per-poll sensors are excluded
+    from the recorder. The hour in progress is imported as well when the
+    entry is unloaded or Home Assistant stops.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize the aggregator."""
+        self.hass = hass
+        self._entry = entry
+        self.fuel_dose: float = entry.options.get(CONF_FUEL_DOSE, DEFAULT_FUEL_DOSE)
+        self._hour_start: float | None = None
+        self._hour: dict[str, StatisticBucket] = {}
+        self._last_timestamp: float | None = None
+        self._sums: dict[str, float] | None = None
+        self._import_lock = asyncio.Lock()
+
+    def statistic_id(self, key: str) -> str:
+        """Return the external statistic id for a statistic key."""
+        return f"{DOMAIN}:{slugify(self._entry.entry_id)}_{key}"
+
+    @callback
+    def async_add(self, timestamp: float, data: RixensData) -> None:
+        """Aggregate a fresh snapshot taken at `timestamp`."""
+        hour_start = timestamp - timestamp % LONG_TERM_PERIOD
+        if self._hour_start is not None and hour_start != self._hour_start:
+            self._close_hour()
+        self._hour_start = hour_start
+
+        hours = 0.0
+        if self._last_timestamp is not None:
+            gap = timestamp - self._last_timestamp
+            # Nothing is known about an outage, so none of it is integrated
+            if gap <= MAX_INTEGRATION_GAP:
+                hours = gap / 3600
+        self._last_timestamp = timestamp
+
+        for description in STATISTIC_DESCRIPTIONS:
+            if (bucket := self._hour.get(description.key)) is None:
+                bucket = self._hour[description.key] = StatisticBucket()
+            bucket.add(description.value_fn(data, self.fuel_dose), hours)
+
+    def _close_hour(self) -> None:
+        """Import the finished hour as long-term statistics."""
+        if not self._hour:
+            return
+        start, buckets = self._hour_start, self._hour
+        self._hour = {}
+        if "recorder" not in self.hass.config.components:
+            return
+        self._entry.async_create_background_task(
+            self.hass,
+            self._async_import(start, buckets),
+            f"{DOMAIN} statistics import {self._entry.entry_id}",
+        )
+
+    async def async_flush(self) -> None:
+        """Import the hour in progress so it isn't lost on unload or shutdown.
+
+        Polls after a restart within the same hour start a new bucket, whose
+        import replaces this partial row; the fuel total carries over since
+        sums continue from the last imported row.
+        """
+        if not self._hour:
+            return
+        start, buckets = self._hour_start, self._hour
+        self._hour = {}
+        self._last_timestamp = None
+        if "recorder" in self.hass.config.components:
+            await self._async_import(start, buckets)
+
+    async def _async_import(self, start: float, buckets: dict[str, StatisticBucket]) -> None:
+        """Import one hour of aggregates."""
+        # Imported here since the recorder is optional; it is already loaded
+        # whenever this runs
+        from homeassistant.components.recorder.models import (
+            StatisticData,
+            StatisticMetaData,
+        )
+        from homeassistant.components.recorder.statistics import (
+            async_add_external_statistics,
+        )
+
+        try:
+            from homeassistant.components.recorder.models import StatisticMeanType
+        except ImportError:
+            # Recorder from before mean types; it takes has_mean instead
+            StatisticMeanType = None
+        has_unit_class = "unit_class" in StatisticMetaData.__annotations__
+
+        async with self._import_lock:
+            if self._sums is None:
+                self._sums = await self._async_load_sums()
+
+            start_time = dt_util.utc_from_timestamp(start)
+            for description in STATISTIC_DESCRIPTIONS:
+                if (bucket := buckets.get(description.key)) is None or not bucket.count:
+                    continue
+                metadata = StatisticMetaData(
+                    has_sum=description.integrate,
+                    name=f"{self._entry.title} {description.name}",
+                    source=DOMAIN,
+                    statistic_id=self.statistic_id(description.key),
+                    unit_of_measurement=description.unit,
+                )
+                if StatisticMeanType is None:
+                    metadata["has_mean"] = not description.integrate
+                else:
+                    metadata["mean_type"] = (
+                        StatisticMeanType.NONE
+                        if description.integrate
+                        else StatisticMeanType.ARITHMETIC
+                    )
+                if has_unit_class:
+                    metadata["unit_class"] = None
+                if description.integrate:
+                    total = self._sums[description.key] = (
+                        self._sums.get(description.key, 0.0) + bucket.integral
+                    )
+                    statistic = StatisticData(start=start_time, state=total, sum=total)
+                else:
+                    statistic = StatisticData(
+                        start=start_time,
+                        mean=bucket.mean,
+                        min=bucket.minimum,
+                        max=bucket.maximum,
+                    )
+                async_add_external_statistics(self.hass, metadata, [statistic])
+
+    async def _async_load_sums(self) -> dict[str, float]:
+        """Load the last imported running totals so sums continue across restarts."""
+        from homeassistant.components.recorder import get_instance
+        from homeassistant.components.recorder.statistics import (
+            get_last_statistics,
+        )
+
+        sums: dict[str, float] = {}
+        for description in STATISTIC_DESCRIPTIONS:
+            if not description.integrate:
+                continue
+            statistic_id = self.statistic_id(description.key)
+            last = await get_instance(self.hass).async_add_executor_job(
+                get_last_statistics, self.hass, 1, statistic_id, True, {"sum"}
+            )
+            if rows := last.get(statistic_id):
+                sums[description.key] = rows[0].get("sum") or 0.0
+        _LOGGER.debug("Loaded statistic totals for %s: %s", self._entry.entry_id, sums)
+        return sums
@@ -0,0 +1,107 @@
+"""Persisted last-known snapshot for Rixens devices."""
+
+from __future__ import annotations
+
+from dataclasses import fields, is_dataclass
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .api import NO_FAULTS, RixensData, RixensHeaterData, RixensSettings
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 300  # seconds; limits flash writes to one per 5 minutes
+
+# Stores kept per config entry, as `rixens.<entry_id>.<key>`
+ENTRY_STORAGE_KEYS = ("snapshot", "faults", "cycles", "schedule", "intents", "thermal")
+
+_NESTED: dict[str, type] = {"heater": RixensHeaterData, "settings": RixensSettings}
+
+
+async def async_remove_entry_stores(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove all persisted data of a config entry."""
+    for key in ENTRY_STORAGE_KEYS:
+        await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.{key}").async_remove()
+
+
+def snapshot_to_compact(data: Any) -> list[Any]:
+    """Serialize a snapshot to positional lists in dataclass field order."""
+    values: list[Any] = []
+    for field in fields(data):
+        value = getattr(data, field.name)
+        if is_dataclass(value):
+            value = snapshot_to_compact(value)
+        elif isinstance(value, tuple):
+            value = list(value)
+        values.append(value)
+    return values
+
+
+def snapshot_from_compact(values: list[Any], cls: type = RixensData) -> Any:
+    """Rebuild a snapshot serialized by snapshot_to_compact.
+
+    Raises:
+        ValueError: If the stored layout does not match the dataclass
+    """
+    kwargs: dict[str, Any] = {}
+    for field, value in zip(fields(cls), values, strict=True):
+        if (nested := _NESTED.get(field.name)) is not None:
+            value = snapshot_from_compact(value, nested)
+        elif isinstance(value, list):
+            value = tuple(value)
+            if value == NO_FAULTS:
+                value = NO_FAULTS
+        kwargs[field.name] = value
+    return cls(**kwargs)
+
+
+class RixensSnapshotStore:
+    """Keep the last good snapshot of a device in storage."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.snapshot"
+        )
+        self._data: RixensData | None = None
+        self._save_scheduled = False
+
+    async def async_load(self) -> RixensData | None:
+        """Return the persisted snapshot, or None if missing or unreadable."""
+        if (stored := await self._store.async_load()) is None:
+            return None
+        try:
+            data = snapshot_from_compact(stored["data"])
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.debug("Discarding incompatible stored snapshot: %s", err)
+            return None
+        _LOGGER.debug("Restored Rixens snapshot saved at %s", stored.get("saved"))
+        return data
+
+    @callback
+    def async_save(self, data: RixensData) -> None:
+        """Keep the latest snapshot and schedule a delayed save of it.
+
+        Only one save is scheduled at a time: scheduling again on every poll
+        would keep pushing the write back, so it would only happen at
+        shutdown. The snapshot saved is the latest one when the delay ends.
+        """
+        self._data = data
+        if not self._save_scheduled:
+            self._save_scheduled = True
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to write to storage."""
+        self._save_scheduled = False
+        return {
+            "saved": dt_util.utcnow().isoformat(),
+            "data": snapshot_to_compact(self._data),
+        }
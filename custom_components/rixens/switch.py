@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
@@ -11,11 +11,12 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .api import RixensApi, RixensData
+from .api import RixensData
 from .const import DOMAIN
+from .controls import CONTROL_ELECTRIC_HEAT, CONTROL_FAN, CONTROL_FLOOR_HEAT, CONTROL_FURNACE
 from .coordinator import RixensCoordinator
+from .entity import RixensEntity
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -23,8 +24,7 @@ class RixensSwitchEntityDescription(SwitchEntityDescription):
     """Describes a Rixens switch entity."""
 
     value_fn: Callable[[RixensData], bool]
-    turn_on_fn: Callable[[RixensApi], Awaitable[None]]
-    turn_off_fn: Callable[[RixensApi], Awaitable[None]]
+    control: str  # key in CONTROLS written by turning the switch on or off
 
 
 SWITCH_DESCRIPTIONS: tuple[RixensSwitchEntityDescription, ...] = (
@@ -32,29 +32,25 @@ SWITCH_DESCRIPTIONS: tuple[RixensSwitchEntityDescription, ...] = (
         key="furnace",
         translation_key="furnace",
         value_fn=lambda data: data.settings.furnace_src != 0,  # 0 = disabled, 1 = enabled, 2 = active
-        turn_on_fn=lambda api: api.set_furnace(True),
-        turn_off_fn=lambda api: api.set_furnace(False),
+        control=CONTROL_FURNACE,
     ),
     RixensSwitchEntityDescription(
         key="floor_heat",
         translation_key="floor_heat",
         value_fn=lambda data: data.settings.floor_src != 0,  # 0 = disabled, 1 = enabled, 2 = active
-        turn_on_fn=lambda api: api.set_floor_heat(True),
-        turn_off_fn=lambda api: api.set_floor_heat(False),
+        control=CONTROL_FLOOR_HEAT,
     ),
     RixensSwitchEntityDescription(
         key="electric_heat",
         translation_key="electric_heat",
         value_fn=lambda data: data.settings.electric_src != 0,  # 0 = disabled, 1 = enabled, 2 = active
-        turn_on_fn=lambda api: api.set_electric_heat(True),
-        turn_off_fn=lambda api: api.set_electric_heat(False),
+        control=CONTROL_ELECTRIC_HEAT,
     ),
     RixensSwitchEntityDescription(
         key="fan",
         translation_key="fan",
         value_fn=lambda data: data.settings.fan_state,
-        turn_on_fn=lambda api: api.set_fan(True),
-        turn_off_fn=lambda api: api.set_fan(False),
+        control=CONTROL_FAN,
     ),
 )
 
@@ -71,7 +67,7 @@ async def async_setup_entry(
     )
 
 
-class RixensSwitch(CoordinatorEntity[RixensCoordinator], SwitchEntity):
+class RixensSwitch(RixensEntity, SwitchEntity):
     """Representation of a Rixens switch."""
 
     _attr_has_entity_name = True
@@ -99,10 +95,8 @@ class RixensSwitch(CoordinatorEntity[RixensCoordinator], SwitchEntity):
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
-        await self.entity_description.turn_on_fn(self.coordinator.api)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.intents.async_set({self.entity_description.control: True})
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
-        await self.entity_description.turn_off_fn(self.coordinator.api)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.intents.async_set({self.entity_description.control: False})
@@ -0,0 +1,300 @@
+"""Learned thermal model of the heated space and just-in-time pre-heat."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+import math
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .api import RixensData
+from .const import DOMAIN
+from .controls import CONTROL_FURNACE, CONTROL_SETPOINT
+from .derived import SOURCE_OFF, is_heating
+
+if TYPE_CHECKING:
+    from .coordinator import RixensCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 60  # seconds
+
+SEGMENT_SECONDS = 300  # temperature change is fitted over segments of this length
+MAX_POLL_GAP = 60  # seconds without a poll that discard the current segment
+FORGETTING_FACTOR = 0.998  # weight of older segments, about two days of memory
+INITIAL_COVARIANCE = 1000.0
+MAX_TRACE = 3 * INITIAL_COVARIANCE
+MIN_HEATING_SEGMENTS = 6
+MIN_COOLING_SEGMENTS = 6
+
+PREHEAT_MARGIN = 1.2  # predicted warm-up time is stretched by this factor
+FALLBACK_LEAD = 3 * 3600  # seconds before the deadline when no prediction is possible
+MAX_LATE_START = 3600  # seconds after the deadline a missed pre-heat is still started
+
+
+class ThermalModel:
+    """First-order model of the space, fitted online by recursive least squares.
+
+    The rate of temperature change in °C per hour is modelled as
+
+        dT/dt = a + b * T + c * u
+
+    where u is the fraction of time the heater was heating. a + b * T is the
+    loss towards the surroundings (b < 0) and c the heating gain. Each
+    update is a fixed 3x3 computation, and the forgetting factor lets the
+    fit follow seasonal changes of the outside temperature.
+    """
+
+    __slots__ = ("theta", "covariance", "heating_segments", "cooling_segments")
+
+    def __init__(self) -> None:
+        """Initialize an untrained model."""
+        self.theta = [0.0, 0.0, 0.0]
+        self.covariance = [
+            [INITIAL_COVARIANCE if row == col else 0.0 for col in range(3)] for row in range(3)
+        ]
+        self.heating_segments = 0
+        self.cooling_segments = 0
+
+    def update(self, temperature: float, heating: float, rate: float) -> None:
+        """Fit one segment: mean temperature, heating fraction and rate in °C/h."""
+        x = (1.0, temperature, heating)
+        p = self.covariance
+        px = [sum(p[row][col] * x[col] for col in range(3)) for row in range(3)]
+        denominator = FORGETTING_FACTOR + sum(x[row] * px[row] for row in range(3))
+        gain = [value / denominator for value in px]
+        error = rate - sum(self.theta[row] * x[row] for row in range(3))
+        self.theta = [self.theta[row] + gain[row] * error for row in range(3)]
+        # Only forget while the covariance is bounded, so long stretches
+        # without heating can't blow it up
+        forgetting = FORGETTING_FACTOR if p[0][0] + p[1][1] + p[2][2] < MAX_TRACE else 1.0
+        self.covariance = [
+            [(p[row][col] - gain[row] * px[col]) / forgetting for col in range(3)]
+            for row in range(3)
+        ]
+        if heating > 0.5:
+            self.heating_segments += 1
+        else:
+            self.cooling_segments += 1
+
+    @property
+    def trained(self) -> bool:
+        """Return True once enough heating and cooling has been observed.
+
+        A fit that doesn't lose heat or doesn't gain heat from heating is
+        not physical and not used.
+        """
+        _, loss, gain = self.theta
+        return (
+            self.heating_segments >= MIN_HEATING_SEGMENTS
+            and self.cooling_segments >= MIN_COOLING_SEGMENTS
+            and loss < 0
+            and gain > 0
+        )
+
+    def warm_up_time(self, temperature: float, target: float) -> float | None:
+        """Return the seconds of continuous heating to reach a target.
+
+        Returns:
+            0 if already at the target, None if the model is untrained or
+            the target is above the temperature heating can sustain
+        """
+        if temperature >= target:
+            return 0.0
+        if not self.trained:
+            return None
+        offset, loss, gain = self.theta
+        # Temperature approached exponentially while heating continuously
+        equilibrium = -(offset + gain) / loss
+        if target >= equilibrium:
+            return None
+        hours = math.log((equilibrium - temperature) / (equilibrium - target)) / -loss
+        return hours * 3600
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the fitted parameters."""
+        offset, loss, gain = self.theta
+        return {
+            "trained": self.trained,
+            "heating_segments": self.heating_segments,
+            "cooling_segments": self.cooling_segments,
+            "loss_per_hour": round(-loss, 4),
+            "heating_gain": round(gain, 3),
+            "idle_equilibrium": round(-offset / loss, 1) if loss < 0 else None,
+            "heating_equilibrium": round(-(offset + gain) / loss, 1) if loss < 0 else None,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class PreheatPlan:
+    """A target temperature to reach by a deadline."""
+
+    target: float
+    deadline: float  # epoch seconds
+
+
+class RixensThermal:
+    """Learn the thermal model from polls and run a pending pre-heat plan.
+
+    Each poll adds its heating state to the current segment in constant
+    time; the model is only updated when a segment completes. A pre-heat
+    plan starts the heater at the first poll where the predicted warm-up
+    time from the current temperature no longer fits before the deadline.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, coordinator: RixensCoordinator) -> None:
+        """Initialize the thermal tracker."""
+        self.hass = hass
+        self._entry = entry
+        self._coordinator = coordinator
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.thermal"
+        )
+        self.model = ThermalModel()
+        self.plan: PreheatPlan | None = None
+        # Current segment
+        self._segment_start: float | None = None
+        self._segment_temp = 0.0
+        self._heating_seconds = 0.0
+        self._last_poll = 0.0
+        self._last_heating = False
+
+    async def async_load(self) -> None:
+        """Load the persisted model and pre-heat plan.
+
+        Unreadable data is dropped and the model starts untrained.
+        """
+        if (stored := await self._store.async_load()) is None:
+            return
+        try:
+            model = stored["model"]
+            theta = [float(value) for value in model["theta"]]
+            covariance = [[float(value) for value in row] for row in model["covariance"]]
+            heating_segments = int(model["heating_segments"])
+            cooling_segments = int(model["cooling_segments"])
+            if len(theta) != 3 or len(covariance) != 3 or any(len(row) != 3 for row in covariance):
+                raise ValueError("model is not 3-dimensional")
+            plan = PreheatPlan(**plan) if (plan := stored.get("plan")) is not None else None
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.debug("Discarding incompatible stored thermal model: %s", err)
+            return
+        self.model.theta = theta
+        self.model.covariance = covariance
+        self.model.heating_segments = heating_segments
+        self.model.cooling_segments = cooling_segments
+        self.plan = plan
+
+    @callback
+    def async_update(self, timestamp: float, data: RixensData) -> None:
+        """Process a fresh snapshot."""
+        heating = is_heating(data)
+        temperature = data.current_temp
+        if self._segment_start is None or timestamp - self._last_poll > MAX_POLL_GAP:
+            self._start_segment(timestamp, temperature)
+        else:
+            if self._last_heating:
+                self._heating_seconds += timestamp - self._last_poll
+            if (elapsed := timestamp - self._segment_start) >= SEGMENT_SECONDS:
+                self.model.update(
+                    (self._segment_temp + temperature) / 2,
+                    self._heating_seconds / elapsed,
+                    (temperature - self._segment_temp) / elapsed * 3600,
+                )
+                self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+                self._start_segment(timestamp, temperature)
+        self._last_poll = timestamp
+        self._last_heating = heating
+
+        if self.plan is not None:
+            self._check_plan(timestamp, data)
+
+    def _start_segment(self, timestamp: float, temperature: float) -> None:
+        """Begin a new segment at a snapshot."""
+        self._segment_start = timestamp
+        self._segment_temp = temperature
+        self._heating_seconds = 0.0
+
+    def planned_start(self, temperature: float) -> float | None:
+        """Return when the pending plan starts heating from a temperature."""
+        if (plan := self.plan) is None:
+            return None
+        if (warm_up := self.model.warm_up_time(temperature, plan.target)) is None:
+            return plan.deadline - FALLBACK_LEAD
+        return plan.deadline - warm_up * PREHEAT_MARGIN
+
+    def _check_plan(self, timestamp: float, data: RixensData) -> None:
+        """Start the pending plan once its start time has come."""
+        plan = self.plan
+        temperature = data.current_temp
+        if timestamp < self.planned_start(temperature):
+            return
+        self.plan = None
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        if timestamp > plan.deadline + MAX_LATE_START:
+            _LOGGER.warning("Dropping Rixens pre-heat to %s°C, its deadline has passed", plan.target)
+            return
+        _LOGGER.info(
+            "Starting Rixens pre-heat from %s°C to %s°C, %.0f minutes before the deadline",
+            temperature,
+            plan.target,
+            (plan.deadline - timestamp) / 60,
+        )
+        target: dict[str, Any] = {CONTROL_SETPOINT: plan.target}
+        settings = data.settings
+        if settings.furnace_src == SOURCE_OFF and settings.electric_src == SOURCE_OFF:
+            # No controllable heat source enabled; the furnace does the pre-heat
+            target[CONTROL_FURNACE] = True
+        self._entry.async_create_background_task(
+            self.hass,
+            self._coordinator.intents.async_set(target, skip_matching=True),
+            f"{DOMAIN} pre-heat {self._entry.entry_id}",
+        )
+
+    @callback
+    def async_set_plan(self, target: float, deadline: float) -> dict[str, Any]:
+        """Schedule a pre-heat and return its predicted start."""
+        self.plan = PreheatPlan(target, deadline)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        return self.as_dict()
+
+    @callback
+    def async_cancel_plan(self) -> None:
+        """Cancel the pending pre-heat."""
+        self.plan = None
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the model and the pending plan with its predicted start."""
+        result: dict[str, Any] = {"model": self.model.as_dict(), "plan": None}
+        data = self._coordinator.data
+        if (plan := self.plan) is not None:
+            result["plan"] = {"target": plan.target, "deadline": plan.deadline}
+            if data is not None:
+                result["plan"]["start"] = self.planned_start(data.current_temp)
+                result["plan"]["predicted_warm_up"] = self.model.warm_up_time(
+                    data.current_temp, plan.target
+                )
+        return result
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to write to storage."""
+        model = self.model
+        return {
+            "model": {
+                "theta": model.theta,
+                "covariance": model.covariance,
+                "heating_segments": model.heating_segments,
+                "cooling_segments": model.cooling_segments,
+            },
+            "plan": (
+                {"target": self.plan.target, "deadline": self.plan.deadline}
+                if self.plan is not None
+                else None
+            ),
+        }
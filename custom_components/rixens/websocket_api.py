@@ -0,0 +1,84 @@
+"""Websocket commands for the Rixens integration."""
+
+from __future__ import annotations
+
+from operator import attrgetter
+import time
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+import homeassistant.helpers.config_validation as cv
+
+from .api import RixensData
+from .const import ATTR_CONFIG_ENTRY_ID, ATTR_FIELDS, ATTR_INTERVAL
+from .history import HISTORY_FIELDS
+from .services import get_coordinator
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant) -> None:
+    """Register the Rixens websocket commands."""
+    websocket_api.async_register_command(hass, websocket_subscribe_telemetry)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "rixens/subscribe_telemetry",
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_FIELDS): vol.All(
+            cv.ensure_list, vol.Length(min=1), [vol.In(HISTORY_FIELDS)]
+        ),
+        # Minimum seconds between frames; 0 sends every poll
+        vol.Optional(ATTR_INTERVAL, default=0): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=3600)
+        ),
+    }
+)
+@callback
+def websocket_subscribe_telemetry(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Stream selected snapshot fields of each fresh poll to the subscriber.
+
+    Frames go straight to the connection, bypassing entity states, the
+    event bus and the recorder. The first event names the fields; each
+    frame is {"t": epoch seconds, "v": [values in field order]}. A
+    subscription is a coordinator listener that only exists while the
+    client is subscribed, so without subscribers nothing is sent or built.
+    """
+    coordinator = get_coordinator(hass, msg.get(ATTR_CONFIG_ENTRY_ID))
+    fields: list[str] = msg[ATTR_FIELDS]
+    getters = [attrgetter(name) for name in fields]
+    interval: float = msg[ATTR_INTERVAL]
+    msg_id: int = msg["id"]
+    last_data: RixensData | None = None
+    last_sent = 0.0
+
+    @callback
+    def _async_send_frame() -> None:
+        """Send the current snapshot unless it was already sent or is throttled."""
+        nonlocal last_data, last_sent
+        data = coordinator.data
+        # Failed polls keep the previous snapshot; restored ones are not live
+        if data is None or data is last_data or coordinator.stale:
+            return
+        now = time.time()
+        if now - last_sent < interval:
+            return
+        last_data = data
+        last_sent = now
+        connection.send_message(
+            websocket_api.event_message(
+                msg_id, {"t": round(now, 3), "v": [getter(data) for getter in getters]}
+            )
+        )
+
+    connection.subscriptions[msg_id] = coordinator.async_add_listener(_async_send_frame)
+    connection.send_result(msg_id)
+    connection.send_message(websocket_api.event_message(msg_id, {"fields": fields}))
+    _async_send_frame()
@@ -0,0 +1,104 @@
+"""Benchmark the per-poll cost of the Rixens anomaly detector.
+
+Feeds synthetic heater snapshots (burner cycles with noise, a flame-out, a
+coolant stall, a voltage sag and a burner motor stall) through the detector and times windows of
+polls after increasingly long runs. The cost per poll must stay within its
+budget and must not grow with the number of polls seen.
+
+Run from the repository root with Home Assistant installed:
+
+    python scripts/benchmark_anomaly.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+
+from custom_components.rixens.anomaly import RixensAnomalyDetector
+from custom_components.rixens.api import RixensHeaterData
+from custom_components.rixens.const import HEATER_STATE_OFF, HEATER_STATE_RUNNING
+
+WINDOW = 10_000  # polls timed per measurement
+CHECKPOINTS = (0, 100_000, 1_000_000)  # polls fed before each measurement
+MAX_MICROSECONDS_PER_POLL = 50.0
+MAX_GROWTH = 1.5  # slowest window relative to the fastest
+
+
+def snapshots(seed: int) -> list[RixensHeaterData]:
+    """Return one window of synthetic snapshots: a day-like mix of states."""
+    rng = random.Random(seed)
+    result = []
+    for index in range(WINDOW):
+        phase = index % 720  # one hour cycle: 40 minutes running, 20 off
+        running = phase < 480
+        flame = 450.0 + rng.gauss(0, 3) if running else 25.0
+        if running and phase in (200, 201, 202):
+            flame -= 150  # flame-out
+        delta = 6.0 + rng.gauss(0, 0.5) if running else 0.0
+        if running and 300 <= phase < 310:
+            delta += 15  # coolant stall
+        voltage = 13.2 + rng.gauss(0, 0.05) - (1.5 if 600 <= phase < 605 else 0)
+        motor = 3200 + round(rng.gauss(0, 30)) if running else 0
+        if running and 400 <= phase < 405:
+            motor -= 2000  # motor stall
+        result.append(
+            RixensHeaterData(
+                heat_on=running,
+                battery_voltage=voltage,
+                runtime=index,
+                pid_speed=60 if running else 0,
+                flame_temp=flame,
+                inlet_temp=40.0,
+                outlet_temp=40.0 + delta,
+                atmospheric_pressure=1013.0,
+                dosing_pump=2.5 if running else 0.0,
+                burner_motor=motor,
+                heater_state=HEATER_STATE_RUNNING if running else HEATER_STATE_OFF,
+                glow_pin=0,
+                preheat=0,
+            )
+        )
+    return result
+
+
+def main() -> int:
+    """Run the benchmark and compare it with the budget."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-us", type=float, default=MAX_MICROSECONDS_PER_POLL)
+    args = parser.parse_args()
+
+    detector = RixensAnomalyDetector()
+    window = snapshots(seed=1)
+    fed = 0
+    transitions = 0
+    results: list[float] = []
+
+    for checkpoint in CHECKPOINTS:
+        while fed < checkpoint:
+            for heater in window:
+                detector.update(heater)
+            fed += WINDOW
+        start = time.perf_counter()
+        for heater in window:
+            transitions += len(detector.update(heater))
+        elapsed = time.perf_counter() - start
+        fed += WINDOW
+        results.append(elapsed / WINDOW * 1e6)
+        print(f"after {checkpoint:>9,} polls: {results[-1]:.2f} us/poll")
+    print(f"{transitions} anomaly transitions in the timed windows")
+
+    failed = False
+    if max(results) > args.max_us:
+        print(f"FAIL: per-poll cost over budget of {args.max_us:.0f} us")
+        failed = True
+    if max(results) > min(results) * MAX_GROWTH:
+        print("FAIL: per-poll cost grows with the number of polls")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+"""Benchmark event loop lag while many Rixens devices are polled.
+
+Simulates increasing numbers of devices returning a large status payload
+(the example status with a long `<wifi_scan_results>` list) and measures
+how late a 10 ms timer fires on the event loop, once with status parsing
+inline and once with the API client's adaptive executor offload. Polls run
+ten times faster than in Home Assistant to reach a high parse load quickly.
+With offload, the p99 lag must stay within its budget at every device
+count, while inline parsing lets it grow with the number of devices.
+
+Only `aiohttp` is required. Run from the repository root:
+
+    python scripts/benchmark_parse_offload.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from xml.etree import ElementTree
+
+from rixens_probe import EXAMPLE_STATUS, _percentile, load_api
+
+DEVICE_COUNTS = (1, 10, 50)
+POLL_INTERVAL = 0.5  # seconds; shortened from 5s so a run takes seconds
+REQUEST_LATENCY = 0.02  # seconds of simulated network round trip
+RUN_SECONDS = 5.0
+TICK = 0.01  # seconds between lag samples
+MAX_OFFLOADED_LAG_MS = 30.0  # p99 lag budget with offload
+MAX_OFFLOADED_RATIO = 0.6  # offloaded p99 lag relative to inline with the most devices
+
+
+def payload(networks: int) -> bytes:
+    """Return the example status with a scan result list of the given length."""
+    root = ElementTree.parse(EXAMPLE_STATUS).getroot()
+    results = root.find("wifi_scan_results")
+    for index in range(networks):
+        network = ElementTree.SubElement(results, "network")
+        ElementTree.SubElement(network, "ssid").text = f"CAMPGROUND-{index:05d}"
+        ElementTree.SubElement(network, "rssi").text = str(-40 - index % 50)
+        ElementTree.SubElement(network, "security").text = "WPA2"
+        ElementTree.SubElement(network, "channel").text = str(1 + index % 11)
+    return ElementTree.tostring(root)
+
+
+async def measure(api_module, body: bytes, devices: int, offload: bool) -> tuple[list[float], list]:
+    """Poll simulated devices for RUN_SECONDS and sample event loop lag."""
+
+    class StandInApi(api_module.RixensApi):
+        """API client answering from memory after a simulated round trip."""
+
+        async def _request(self, path: str, retry: bool = True) -> bytes:
+            await asyncio.sleep(REQUEST_LATENCY)
+            return body
+
+    apis = [StandInApi(f"device-{index}", parse_offload=offload) for index in range(devices)]
+    loop = asyncio.get_running_loop()
+    end = loop.time() + RUN_SECONDS
+
+    async def poll(api, offset: float) -> None:
+        await asyncio.sleep(offset)
+        while loop.time() < end:
+            await api.get_status()
+            await asyncio.sleep(POLL_INTERVAL)
+
+    lags: list[float] = []
+
+    async def monitor() -> None:
+        while loop.time() < end:
+            start = time.perf_counter()
+            await asyncio.sleep(TICK)
+            lags.append(time.perf_counter() - start - TICK)
+
+    # Spread device polls evenly over the interval, like independent coordinators
+    await asyncio.gather(
+        monitor(),
+        *(poll(api, POLL_INTERVAL * index / devices) for index, api in enumerate(apis)),
+    )
+    return lags, [api.parse_stats for api in apis]
+
+
+async def run(networks: int) -> int:
+    """Run all device counts in both modes and check the offload budget."""
+    api_module = load_api()
+    body = payload(networks)
+    print(f"payload {len(body) / 1024:.0f} KiB, {POLL_INTERVAL:g}s poll interval, {RUN_SECONDS:g}s per run")
+    p99s: dict[tuple[int, bool], float] = {}
+    for devices in DEVICE_COUNTS:
+        for offload in (False, True):
+            lags, stats = await measure(api_module, body, devices, offload)
+            ordered = sorted(lag * 1000 for lag in lags)
+            p99 = _percentile(ordered, 99)
+            parse_ms = sum(item.average for item in stats) / len(stats) * 1000
+            print(
+                f"{devices:3d} devices, {'offload' if offload else 'inline ':7s}: "
+                f"loop lag p50 {_percentile(ordered, 50):6.2f}  p99 {p99:6.2f}  "
+                f"max {ordered[-1]:6.2f} ms; parse {parse_ms:.2f} ms, "
+                f"{sum(item.offloaded for item in stats)}/{sum(item.parses for item in stats)} offloaded, "
+                f"{sum(item.overlong for item in stats)} overlong"
+            )
+            p99s[devices, offload] = p99
+
+    failed = False
+    if (worst := max(p99s[devices, True] for devices in DEVICE_COUNTS)) > MAX_OFFLOADED_LAG_MS:
+        print(f"FAIL: offloaded p99 lag {worst:.2f} ms exceeds {MAX_OFFLOADED_LAG_MS} ms")
+        failed = True
+    most = DEVICE_COUNTS[-1]
+    if p99s[most, True] > p99s[most, False] * MAX_OFFLOADED_RATIO:
+        print(
+            f"FAIL: with {most} devices offloaded p99 lag {p99s[most, True]:.2f} ms "
+            f"is not below {MAX_OFFLOADED_RATIO:g} x inline {p99s[most, False]:.2f} ms"
+        )
+        failed = True
+    if not failed:
+        print("OK")
+    return 1 if failed else 0
+
+
+def main() -> int:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--networks", type=int, default=2000, help="scan results in the payload")
+    args = parser.parse_args()
+    # Overlong parses are counted in the table instead of logged per device
+    logging.basicConfig(level=logging.ERROR)
+    return asyncio.run(run(args.networks))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""Check the import-time budget of the Rixens integration.
+
+Imports the integration package and its config flow, which Home Assistant
+loads with it, in a fresh interpreter after the Home Assistant modules that
+are always loaded by the time an integration is set up, and measures the
+extra import time and number of modules they pull in. Exits non-zero if
+either exceeds its budget. The tests run this check as well.
+
+Run from the repository root with Home Assistant installed:
+
+    python scripts/check_import_budget.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+
+# Modules Home Assistant has already imported before it sets up an integration
+BASELINE_MODULES = (
+    "aiohttp",
+    "voluptuous",
+    "homeassistant.components.websocket_api",
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.aiohttp_client",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.dispatcher",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.update_coordinator",
+)
+
+# Modules Home Assistant imports when it loads the integration
+MODULES = ("custom_components.rixens", "custom_components.rixens.config_flow")
+
+MAX_IMPORT_SECONDS = 0.15
+MAX_NEW_MODULES = 40
+RUNS = 5
+
+_MEASURE = """
+import json, sys, time
+{baseline}
+before = set(sys.modules)
+start = time.perf_counter()
+{modules}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "modules": sorted(set(sys.modules) - before)}}))
+"""
+
+
+def measure() -> tuple[float, list[str]]:
+    """Return the import time and new modules of one cold import."""
+    code = _MEASURE.format(
+        baseline="\n".join(f"import {name}" for name in BASELINE_MODULES),
+        modules="\n".join(f"import {name}" for name in MODULES),
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    result = json.loads(output)
+    return result["seconds"], result["modules"]
+
+
+def main() -> int:
+    """Run the measurement and compare it with the budget."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-seconds", type=float, default=MAX_IMPORT_SECONDS)
+    parser.add_argument("--max-modules", type=int, default=MAX_NEW_MODULES)
+    parser.add_argument("--verbose", action="store_true", help="list imported modules")
+    args = parser.parse_args()
+
+    # The fastest of several runs is the least affected by other load
+    seconds, modules = min(measure() for _ in range(RUNS))
+    print(f"import {', '.join(MODULES)}: {seconds * 1000:.1f} ms, {len(modules)} new modules")
+    if args.verbose:
+        print("\n".join(f"  {name}" for name in modules))
+
+    failed = False
+    if seconds > args.max_seconds:
+        print(f"FAIL: import time over budget of {args.max_seconds * 1000:.0f} ms")
+        failed = True
+    if len(modules) > args.max_modules:
+        print(f"FAIL: {len(modules)} new modules over budget of {args.max_modules}")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
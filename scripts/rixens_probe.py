@@ -0,0 +1,295 @@
+"""Probe and bench a Rixens controller without Home Assistant.
+
+Uses the integration's own API client (only `aiohttp` is required) to poll
+a controller at a fixed rate, print parsed fields or JSON lines and report
+round-trip and parse latency distributions. Single `interface.cgi`
+commands can be sent and timed until the status reflects them. A local
+stand-in serving a status file makes the tool usable without hardware.
+
+Run from the repository root:
+
+    python scripts/rixens_probe.py poll 192.168.1.50 --rate 2 --count 100
+    python scripts/rixens_probe.py poll 192.168.1.50 --fields current_temp,settings.setpoint --json
+    python scripts/rixens_probe.py command 192.168.1.50 1 200
+    python scripts/rixens_probe.py serve --port 8080 --latency 0.05 --apply-delay 1.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import dataclasses
+import importlib.util
+import itertools
+import json
+import logging
+from pathlib import Path
+import sys
+import time
+from types import ModuleType
+from typing import Any
+from xml.etree import ElementTree
+
+import aiohttp
+from aiohttp import web
+
+ROOT = Path(__file__).resolve().parent.parent
+EXAMPLE_STATUS = ROOT / "example_mcs7_status.xml"
+
+# interface.cgi actions: (status field that reflects the command, settings tag)
+ACTIONS = {
+    1: ("settings.setpoint", "setpoint"),
+    2: ("settings.fan_speed", "fanspeed"),
+    4: ("settings.electric_src", "electricsrc"),
+    5: ("settings.furnace_src", "furnacesrc"),
+    8: ("settings.fan_state", "fanstate"),
+    10: ("settings.floor_src", "floorsrc"),
+}
+PERCENTILES = (50, 90, 99)
+
+
+def load_api() -> ModuleType:
+    """Load the API module by path, bypassing the Home Assistant package."""
+    spec = importlib.util.spec_from_file_location(
+        "rixens_api", ROOT / "custom_components" / "rixens" / "api.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def flatten(data: Any, prefix: str = "") -> dict[str, Any]:
+    """Flatten a snapshot into dotted field names, e.g. `heater.flame_temp`."""
+    result: dict[str, Any] = {}
+    for field in dataclasses.fields(data):
+        value = getattr(data, field.name)
+        if dataclasses.is_dataclass(value):
+            result.update(flatten(value, f"{prefix}{field.name}."))
+        elif isinstance(value, tuple):
+            result[f"{prefix}{field.name}"] = list(value)
+        else:
+            result[f"{prefix}{field.name}"] = value
+    return result
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    """Return the q-th percentile of sorted values using linear interpolation."""
+    rank = (len(ordered) - 1) * q / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize(name: str, samples: list[float]) -> str:
+    """Return a one-line latency distribution in milliseconds."""
+    if not samples:
+        return f"{name:<11} no samples"
+    ordered = sorted(ms * 1000 for ms in samples)
+    parts = [f"min {ordered[0]:8.2f}"]
+    parts += [f"p{q} {_percentile(ordered, q):8.2f}" for q in PERCENTILES]
+    parts.append(f"max {ordered[-1]:8.2f}")
+    return f"{name:<11} " + "  ".join(parts) + f"  ms (n={len(ordered)})"
+
+
+class Probe:
+    """Timed access to one controller through the integration's client."""
+
+    def __init__(self, api_module: ModuleType, host: str, port: int) -> None:
+        """Initialize the probe."""
+        self.api_module = api_module
+        self.api = api_module.RixensApi(host, port)
+
+    async def fetch(self) -> tuple[Any, float, float]:
+        """Fetch and parse one status snapshot without retries.
+
+        Returns:
+            The snapshot, the round-trip time and the parse time in seconds
+        """
+        start = time.perf_counter()
+        text = await self.api._request("/status.xml", retry=False)
+        fetched = time.perf_counter()
+        data = self.api._parse_status(text)
+        return data, fetched - start, time.perf_counter() - fetched
+
+    async def send(self, act: int, val: str) -> float:
+        """Send one interface.cgi command and return its round-trip time."""
+        start = time.perf_counter()
+        await self.api._request(f"/interface.cgi?act={act}&val={val}", retry=False)
+        return time.perf_counter() - start
+
+    async def close(self) -> None:
+        """Close the HTTP session."""
+        await self.api.close()
+
+
+async def run_poll(args: argparse.Namespace) -> int:
+    """Poll at a fixed rate and print fields and latency distributions."""
+    api_module = load_api()
+    probe = Probe(api_module, args.host, args.port)
+    fields = args.fields.split(",") if args.fields else None
+    interval = 1 / args.rate
+    round_trips: list[float] = []
+    parses: list[float] = []
+    errors = 0
+    late = 0
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    try:
+        for index in range(args.count) if args.count else itertools.count():
+            try:
+                data, round_trip, parse = await probe.fetch()
+            except api_module.RixensApiError as err:
+                errors += 1
+                print(f"error: {err}", file=sys.stderr)
+            else:
+                round_trips.append(round_trip)
+                parses.append(parse)
+                values = flatten(data)
+                if fields is not None:
+                    values = {name: values.get(name) for name in fields}
+                if args.json:
+                    line = {"t": round(time.time(), 3), "rtt_ms": round(round_trip * 1000, 2)}
+                    print(json.dumps(line | values))
+                elif not args.quiet:
+                    print(f"[{index + 1}] rtt {round_trip * 1000:.1f} ms, parse {parse * 1000:.2f} ms")
+                    for name, value in values.items():
+                        print(f"  {name} = {value}")
+            # Fixed schedule: a slow poll shortens the next wait instead of shifting it
+            next_at = start + (index + 1) * interval
+            if (delay := next_at - loop.time()) > 0:
+                await asyncio.sleep(delay)
+            else:
+                late += 1
+    except asyncio.CancelledError:
+        # Ctrl+C; still report what was measured
+        pass
+    finally:
+        await probe.close()
+
+    polls = len(round_trips) + errors
+    out = sys.stderr if args.json else sys.stdout
+    print(f"{polls} polls at {args.rate:g}/s: {errors} errors, {late} missed the schedule", file=out)
+    print(summarize("round trip", round_trips), file=out)
+    print(summarize("parse", parses), file=out)
+    return 1 if errors == polls else 0
+
+
+async def run_command(args: argparse.Namespace) -> int:
+    """Send one command and time until the status reflects it."""
+    api_module = load_api()
+    probe = Probe(api_module, args.host, args.port)
+    field = args.field or ACTIONS.get(args.act, (None,))[0]
+    if field is None:
+        print(f"Unknown action {args.act}; pass --field to watch", file=sys.stderr)
+        return 2
+    try:
+        before, _, _ = await probe.fetch()
+        old = flatten(before).get(field)
+        round_trip = await probe.send(args.act, args.val)
+        sent = time.perf_counter()
+        print(f"act={args.act} val={args.val} sent in {round_trip * 1000:.1f} ms; watching {field} (was {old})")
+        polls = 0
+        while (elapsed := time.perf_counter() - sent) < args.timeout:
+            data, _, _ = await probe.fetch()
+            polls += 1
+            if (new := flatten(data).get(field)) != old:
+                print(f"{field} = {new} after {elapsed * 1000:.0f} ms ({polls} polls)")
+                return 0
+            await asyncio.sleep(args.interval)
+    except api_module.RixensApiError as err:
+        print(f"error: {err}", file=sys.stderr)
+        return 1
+    finally:
+        await probe.close()
+    print(f"{field} unchanged after {args.timeout:g} s ({polls} polls)")
+    return 1
+
+
+async def run_serve(args: argparse.Namespace) -> int:
+    """Serve a status file as a stand-in controller that applies commands."""
+    root = ElementTree.parse(args.file).getroot()
+    settings = root.find("settings")
+    loop = asyncio.get_running_loop()
+
+    def apply(tag: str, value: str) -> None:
+        if (elem := settings.find(tag)) is not None:
+            elem.text = value
+
+    async def status(_request: web.Request) -> web.Response:
+        await asyncio.sleep(args.latency)
+        return web.Response(text=ElementTree.tostring(root, encoding="unicode"), content_type="text/xml")
+
+    async def interface(request: web.Request) -> web.Response:
+        await asyncio.sleep(args.latency)
+        try:
+            act = int(request.query["act"])
+            val = request.query["val"]
+        except (KeyError, ValueError):
+            raise web.HTTPBadRequest from None
+        if (action := ACTIONS.get(act)) is not None:
+            loop.call_later(args.apply_delay, apply, action[1], val)
+        return web.Response(text="OK")
+
+    app = web.Application()
+    app.router.add_get("/status.xml", status)
+    app.router.add_get("/interface.cgi", interface)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, args.bind, args.port).start()
+    print(f"Serving {args.file} on http://{args.bind}:{args.port}/status.xml")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+    return 0
+
+
+def main() -> int:
+    """Parse arguments and run a subcommand."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--verbose", action="store_true", help="show the API client's log")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    poll = commands.add_parser("poll", help="poll at a fixed rate and report latency")
+    poll.add_argument("host")
+    poll.add_argument("--port", type=int, default=80)
+    poll.add_argument("--rate", type=float, default=1.0, help="polls per second")
+    poll.add_argument("--count", type=int, help="number of polls (default: until Ctrl+C)")
+    poll.add_argument("--fields", help="comma-separated dotted fields, e.g. heater.flame_temp")
+    poll.add_argument("--json", action="store_true", help="print one JSON line per poll")
+    poll.add_argument("--quiet", action="store_true", help="only print the summary")
+
+    command = commands.add_parser("command", help="send one interface.cgi command and time it")
+    command.add_argument("host")
+    command.add_argument("act", type=int, help="action code, e.g. 1 for the setpoint")
+    command.add_argument("val", help="raw value, e.g. 200 for 20.0 °C")
+    command.add_argument("--port", type=int, default=80)
+    command.add_argument("--field", help="dotted field to watch (default: the field of the action)")
+    command.add_argument("--interval", type=float, default=0.2, help="seconds between checks")
+    command.add_argument("--timeout", type=float, default=30.0, help="seconds to wait")
+
+    serve = commands.add_parser("serve", help="run a local stand-in controller")
+    serve.add_argument("--file", type=Path, default=EXAMPLE_STATUS, help="status XML to serve")
+    serve.add_argument("--bind", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8080)
+    serve.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    serve.add_argument("--apply-delay", type=float, default=1.0, help="seconds until a command shows in the status")
+
+    args = parser.parse_args()
+    # Errors are reported per poll; the client's own log only adds noise
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.CRITICAL)
+    if args.command == "poll" and (args.rate <= 0 or (args.count is not None and args.count < 1)):
+        parser.error("--count and --rate must be positive")
+    runner = {"poll": run_poll, "command": run_command, "serve": run_serve}[args.command]
+    try:
+        return asyncio.run(runner(args))
+    except KeyboardInterrupt:
+        return 0
+    except aiohttp.ClientError as err:
+        print(f"error: {err}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,17 @@
+"""Fixtures for Rixens tests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from custom_components.rixens.api import RixensApi, RixensData
+
+EXAMPLE_STATUS = Path(__file__).parents[1] / "example_mcs7_status.xml"
+
+
+@pytest.fixture
+def status() -> RixensData:
+    """Return the snapshot parsed from the example status file."""
+    return RixensApi("rixens.local")._parse_status(EXAMPLE_STATUS.read_bytes())
@@ -0,0 +1,174 @@
+"""Tests for burner cycle tracking."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.rixens.const import DOMAIN, HEATER_STATE_OFF, HEATER_STATE_RUNNING
+from custom_components.rixens.cycles import (
+    PHASE_OFF,
+    PHASE_RUNNING,
+    PHASE_STARTING,
+    PHASE_STOPPING,
+    RixensCycleTracker,
+)
+
+# Any state other than off or running is a transitional one
+HEATER_STATE_TRANSITION = 5
+
+
+@pytest.fixture
+def tracker(hass: HomeAssistant) -> RixensCycleTracker:
+    """Return a tracker that has seen the heater off at t=0."""
+    tracker = RixensCycleTracker(hass, MockConfigEntry(domain=DOMAIN, entry_id="test"))
+    tracker.async_update(0, HEATER_STATE_OFF, 0.0)
+    return tracker
+
+
+def _feed(tracker: RixensCycleTracker, states: list[tuple[float, int, float]]) -> list[bool]:
+    """Feed (timestamp, heater state, fuel used) samples to the tracker."""
+    return [tracker.async_update(*sample) for sample in states]
+
+
+async def test_phases(tracker: RixensCycleTracker) -> None:
+    """Transitional states are starting before running and stopping after it."""
+    assert tracker.phase == PHASE_OFF
+    tracker.async_update(10, HEATER_STATE_TRANSITION, 0.0)
+    assert tracker.phase == PHASE_STARTING
+    tracker.async_update(20, HEATER_STATE_RUNNING, 0.0)
+    assert tracker.phase == PHASE_RUNNING
+    tracker.async_update(30, HEATER_STATE_TRANSITION, 0.0)
+    assert tracker.phase == PHASE_STOPPING
+
+
+async def test_completed_cycle(tracker: RixensCycleTracker) -> None:
+    """A cycle records ignition, run and shutdown time and the fuel used."""
+    completed = _feed(
+        tracker,
+        [
+            (100, HEATER_STATE_TRANSITION, 5.0),
+            (105, HEATER_STATE_TRANSITION, 5.1),
+            (160, HEATER_STATE_RUNNING, 6.0),
+            (1000, HEATER_STATE_TRANSITION, 80.0),
+            (1100, HEATER_STATE_OFF, 81.5),
+        ],
+    )
+
+    assert completed == [False, False, False, False, True]
+    cycle = tracker.recent[-1]
+    assert cycle.started == 100
+    assert cycle.ignition_time == 60
+    assert cycle.run_time == 840
+    assert cycle.shutdown_time == 100
+    assert cycle.fuel_used == 76.5
+    assert not cycle.failed
+    stats = tracker.stats
+    assert (stats.cycles, stats.failed_ignitions, stats.short_cycles) == (1, 0, 0)
+    assert stats.average_run_time == 840
+    assert stats.average_ignition_time == 60
+
+
+async def test_failed_ignition(tracker: RixensCycleTracker) -> None:
+    """A cycle that never reaches running is a failed ignition, not a short cycle."""
+    _feed(tracker, [(100, HEATER_STATE_TRANSITION, 0.0), (250, HEATER_STATE_OFF, 0.4)])
+
+    cycle = tracker.recent[-1]
+    assert cycle.failed
+    assert cycle.ignition_time is None
+    assert cycle.shutdown_time is None
+    assert cycle.run_time == 0
+    stats = tracker.stats
+    assert (stats.cycles, stats.failed_ignitions, stats.short_cycles) == (1, 1, 0)
+    assert stats.average_run_time is None
+
+
+async def test_short_cycle(tracker: RixensCycleTracker) -> None:
+    """A run shorter than ten minutes counts as a short cycle."""
+    _feed(
+        tracker,
+        [
+            (100, HEATER_STATE_TRANSITION, 0.0),
+            (150, HEATER_STATE_RUNNING, 0.0),
+            (450, HEATER_STATE_OFF, 10.0),
+        ],
+    )
+
+    cycle = tracker.recent[-1]
+    assert cycle.run_time == 300
+    assert cycle.shutdown_time == 0
+    assert tracker.stats.short_cycles == 1
+
+
+async def test_return_from_stopping_keeps_first_ignition(tracker: RixensCycleTracker) -> None:
+    """Running again after stopping continues the cycle from its first ignition."""
+    _feed(
+        tracker,
+        [
+            (100, HEATER_STATE_TRANSITION, 0.0),
+            (130, HEATER_STATE_RUNNING, 0.0),
+            (500, HEATER_STATE_TRANSITION, 0.0),
+            (520, HEATER_STATE_RUNNING, 0.0),
+            (1000, HEATER_STATE_TRANSITION, 0.0),
+            (1030, HEATER_STATE_OFF, 0.0),
+        ],
+    )
+
+    assert len(tracker.recent) == 1
+    cycle = tracker.recent[-1]
+    assert cycle.ignition_time == 30
+    assert cycle.run_time == 870
+    assert cycle.shutdown_time == 30
+
+
+async def test_cycle_in_progress_at_start(hass: HomeAssistant) -> None:
+    """A cycle already in progress at the first observation is not recorded."""
+    tracker = RixensCycleTracker(hass, MockConfigEntry(domain=DOMAIN, entry_id="test"))
+    _feed(tracker, [(0, HEATER_STATE_RUNNING, 0.0), (100, HEATER_STATE_OFF, 1.0)])
+
+    assert not tracker.recent
+    assert tracker.stats.cycles == 0
+
+
+async def test_load(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Stored totals are restored and averages recomputed from the recent cycles."""
+    cycle = {
+        "started": 0.0,
+        "ignition_time": 40.0,
+        "run_time": 1200.0,
+        "shutdown_time": 90.0,
+        "fuel_used": 50.0,
+    }
+    hass_storage[f"{DOMAIN}.test.cycles"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.test.cycles",
+        "data": {
+            "stats": {"cycles": 12, "failed_ignitions": 2, "short_cycles": 3},
+            "recent": [cycle, cycle | {"run_time": 600.0}],
+        },
+    }
+    tracker = RixensCycleTracker(hass, MockConfigEntry(domain=DOMAIN, entry_id="test"))
+    await tracker.async_load()
+
+    stats = tracker.stats
+    assert (stats.cycles, stats.failed_ignitions, stats.short_cycles) == (12, 2, 3)
+    assert stats.average_run_time == 900
+    assert stats.last_run_time == 600
+
+
+async def test_load_incompatible(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Unreadable stored cycles are dropped instead of failing setup."""
+    hass_storage[f"{DOMAIN}.test.cycles"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.test.cycles",
+        "data": {"stats": {"cycles": 1}, "recent": [{"started": 0.0}]},
+    }
+    tracker = RixensCycleTracker(hass, MockConfigEntry(domain=DOMAIN, entry_id="test"))
+    await tracker.async_load()
+
+    assert not tracker.recent
+    assert tracker.stats.cycles == 0
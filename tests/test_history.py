@@ -0,0 +1,98 @@
+"""Tests for the in-memory telemetry history."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pytest
+
+from custom_components.rixens.api import RixensData
+from custom_components.rixens.history import HISTORY_FIELDS, RixensHistory
+
+
+def _fill(history: RixensHistory, status: RixensData, count: int) -> None:
+    """Append `count` snapshots at t = 0, 1, ... with current_temp = t."""
+    for index in range(count):
+        history.append(float(index), replace(status, current_temp=float(index)))
+
+
+def test_fields_include_nested_numeric_fields() -> None:
+    """Numeric snapshot fields are recorded under dotted names."""
+    assert "current_temp" in HISTORY_FIELDS
+    assert "heater.outlet_temp" in HISTORY_FIELDS
+    assert "settings.setpoint" in HISTORY_FIELDS
+    assert "version" not in HISTORY_FIELDS
+
+
+def test_ring_buffer_keeps_newest(status: RixensData) -> None:
+    """Appending past capacity overwrites the oldest snapshots in order."""
+    history = RixensHistory(4)
+    _fill(history, status, 6)
+
+    assert len(history) == 4
+    result = history.query(["current_temp"])
+    assert result["count"] == 4
+    assert result["timestamps"] == [2.0, 3.0, 4.0, 5.0]
+    assert result["fields"]["current_temp"]["values"] == [2.0, 3.0, 4.0, 5.0]
+
+
+def test_window_is_inclusive(status: RixensData) -> None:
+    """Start and end select snapshots with start <= timestamp <= end."""
+    history = RixensHistory(10)
+    _fill(history, status, 10)
+
+    assert history.query(["current_temp"], start=3, end=6)["timestamps"] == [3, 4, 5, 6]
+    assert history.query(["current_temp"], start=8)["timestamps"] == [8, 9]
+    assert history.query(["current_temp"], end=1)["timestamps"] == [0, 1]
+    assert history.query(["current_temp"], start=20)["count"] == 0
+
+
+def test_window_after_wraparound(status: RixensData) -> None:
+    """Windows are found by timestamp across the wrap of the buffer."""
+    history = RixensHistory(5)
+    _fill(history, status, 13)
+
+    assert history.query(["current_temp"], start=9.5, end=11)["timestamps"] == [10, 11]
+
+
+def test_aggregates_and_percentiles(status: RixensData) -> None:
+    """Aggregates cover the window; percentiles interpolate linearly."""
+    history = RixensHistory(10)
+    _fill(history, status, 5)
+
+    result = history.query(["current_temp"], percentiles=[95, 50], include_samples=False)
+    entry = result["fields"]["current_temp"]
+    assert "timestamps" not in result
+    assert "values" not in entry
+    assert entry["min"] == 0
+    assert entry["max"] == 4
+    assert entry["mean"] == 2
+    assert entry["percentiles"] == {"p50": 2.0, "p95": pytest.approx(3.8)}
+
+
+def test_empty_window_has_no_aggregates() -> None:
+    """A field without samples in the window has no aggregates."""
+    history = RixensHistory(3)
+    assert history.query(["current_temp"]) == {
+        "count": 0,
+        "fields": {"current_temp": {"values": []}},
+        "timestamps": [],
+    }
+
+
+def test_unknown_field() -> None:
+    """Querying a field that is not recorded raises KeyError."""
+    history = RixensHistory(3)
+    with pytest.raises(KeyError):
+        history.query(["heater.unknown"])
+
+
+def test_clear(status: RixensData) -> None:
+    """Clearing drops all snapshots and the buffer fills again from scratch."""
+    history = RixensHistory(3)
+    _fill(history, status, 3)
+    history.clear()
+    assert len(history) == 0
+
+    history.append(10.0, status)
+    assert history.query(["current_temp"])["timestamps"] == [10.0]
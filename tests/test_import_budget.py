@@ -0,0 +1,34 @@
+"""Tests for the import-time budget of the Rixens integration."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import subprocess
+import sys
+
+from custom_components.rixens.anomaly import RixensAnomalyDetector
+from custom_components.rixens.const import THROTTLED_ENTITY_KEYS
+from custom_components.rixens.sensor import CYCLE_SENSOR_DESCRIPTIONS, SENSOR_DESCRIPTIONS
+
+SCRIPT = Path(__file__).parents[1] / "scripts" / "check_import_budget.py"
+
+
+def test_import_budget() -> None:
+    """The integration and its config flow import within budget."""
+    result = subprocess.run(
+        [sys.executable, str(SCRIPT), "--verbose"],
+        cwd=SCRIPT.parents[1],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+
+
+def test_throttled_keys_cover_entities() -> None:
+    """The keys listed for the config flow match the entity descriptions."""
+    keys = set(THROTTLED_ENTITY_KEYS)
+    assert len(keys) == len(THROTTLED_ENTITY_KEYS)
+    assert {description.key for description in SENSOR_DESCRIPTIONS} <= keys
+    assert {description.key for description in CYCLE_SENSOR_DESCRIPTIONS} <= keys
+    assert set(RixensAnomalyDetector().states) <= keys
@@ -0,0 +1,137 @@
+"""Tests for control diffing and the desired-state intents."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.rixens.api import RixensApiError, RixensData
+from custom_components.rixens.const import DOMAIN, FAN_SPEED_AUTO
+from custom_components.rixens.controls import (
+    CONTROL_ELECTRIC_HEAT,
+    CONTROL_FAN_SPEED,
+    CONTROL_FURNACE,
+    CONTROL_SETPOINT,
+    diff_controls,
+)
+from custom_components.rixens.derived import build_derived_state
+from custom_components.rixens.intent import RixensIntents
+
+# The example status has setpoint 18.0, auto fan, furnace on and electric off
+
+
+def _diff(target: dict[str, Any], status: RixensData) -> list[tuple[str, Any]]:
+    """Return (key, value) of the controls differing from the example status."""
+    writes = diff_controls(target, status, build_derived_state(status, 0.03))
+    return [(control.key, value) for control, value in writes]
+
+
+def test_diff_drops_matching_controls(status: RixensData) -> None:
+    """Controls the snapshot already matches are not written."""
+    assert _diff(
+        {
+            CONTROL_SETPOINT: 18.0,
+            CONTROL_FAN_SPEED: FAN_SPEED_AUTO,
+            CONTROL_FURNACE: True,
+            CONTROL_ELECTRIC_HEAT: False,
+        },
+        status,
+    ) == []
+
+
+def test_diff_in_write_order(status: RixensData) -> None:
+    """Differing controls come in the fixed write order, not the target's."""
+    assert _diff(
+        {CONTROL_ELECTRIC_HEAT: True, CONTROL_FAN_SPEED: 40, CONTROL_SETPOINT: 21.0},
+        status,
+    ) == [(CONTROL_SETPOINT, 21.0), (CONTROL_FAN_SPEED, 40), (CONTROL_ELECTRIC_HEAT, True)]
+
+
+@pytest.fixture
+def coordinator(status: RixensData) -> MagicMock:
+    """Return a coordinator mock holding the example status."""
+    coordinator = MagicMock()
+    coordinator.is_available = True
+    coordinator.stale = False
+    coordinator.data = status
+    coordinator.derived = build_derived_state(status, 0.03)
+    coordinator.api = AsyncMock()
+    coordinator.async_request_refresh = AsyncMock()
+    return coordinator
+
+
+@pytest.fixture
+def intents(hass: HomeAssistant, coordinator: MagicMock) -> RixensIntents:
+    """Return the intents of a device."""
+    entry = MockConfigEntry(domain=DOMAIN, entry_id="test")
+    entry.add_to_hass(hass)
+    return RixensIntents(hass, entry, coordinator)
+
+
+async def test_set_writes_only_differing(intents: RixensIntents, coordinator: MagicMock) -> None:
+    """With skip_matching only differing controls are written, and nothing stays pending."""
+    await intents.async_set(
+        {CONTROL_SETPOINT: 21.0, CONTROL_FURNACE: True}, skip_matching=True
+    )
+
+    coordinator.api.set_temperature.assert_awaited_once_with(21.0)
+    coordinator.api.set_furnace.assert_not_awaited()
+    coordinator.async_request_refresh.assert_awaited_once()
+    assert intents.pending == {}
+
+
+async def test_set_queues_while_unavailable(
+    intents: RixensIntents, coordinator: MagicMock
+) -> None:
+    """Commands for an unreachable device stay pending without a write."""
+    coordinator.is_available = False
+    await intents.async_set({CONTROL_SETPOINT: 21.0})
+    await intents.async_set({CONTROL_SETPOINT: 22.0, CONTROL_FURNACE: False})
+
+    coordinator.api.set_temperature.assert_not_awaited()
+    assert intents.pending == {CONTROL_SETPOINT: 22.0, CONTROL_FURNACE: False}
+
+
+async def test_failed_write_stays_pending(intents: RixensIntents, coordinator: MagicMock) -> None:
+    """A failed write stops the sequence and leaves the rest pending."""
+    coordinator.api.set_temperature.side_effect = RixensApiError("timeout")
+    await intents.async_set({CONTROL_SETPOINT: 21.0, CONTROL_FURNACE: False})
+
+    coordinator.api.set_furnace.assert_not_awaited()
+    coordinator.async_request_refresh.assert_not_awaited()
+    assert intents.pending == {CONTROL_SETPOINT: 21.0, CONTROL_FURNACE: False}
+
+
+async def test_reconcile_drops_matching_and_writes_rest(
+    hass: HomeAssistant, intents: RixensIntents, coordinator: MagicMock
+) -> None:
+    """Reconciling writes only pending controls that differ, once each."""
+    intents.pending = {CONTROL_SETPOINT: 18.0, CONTROL_FURNACE: False}
+
+    intents.async_reconcile()
+    await hass.async_block_till_done()
+    intents.async_reconcile()
+    await hass.async_block_till_done()
+
+    coordinator.api.set_temperature.assert_not_awaited()
+    coordinator.api.set_furnace.assert_awaited_once_with(False)
+    assert intents.pending == {}
+
+
+async def test_load_ignores_unknown_controls(
+    hass: HomeAssistant, hass_storage: dict[str, Any], intents: RixensIntents
+) -> None:
+    """Stored intents for controls that no longer exist are dropped."""
+    hass_storage[f"{DOMAIN}.test.intents"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.test.intents",
+        "data": {"pending": {CONTROL_SETPOINT: 20.0, "unknown": 1}},
+    }
+    await intents.async_load()
+
+    assert intents.pending == {CONTROL_SETPOINT: 20.0}
@@ -0,0 +1,173 @@
+"""Tests for the weekday schedule."""
+
+from __future__ import annotations
+
+from datetime import datetime, time
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from zoneinfo import ZoneInfo
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.rixens.const import CONF_SCHEDULE, DOMAIN, FAN_SPEED_AUTO
+from custom_components.rixens.schedule import (
+    RixensScheduler,
+    next_occurrence,
+    occurrences,
+    parse_schedule,
+)
+
+SCHEDULE = [
+    {"time": "07:00", "setpoint": 21, "fan_speed": "auto"},
+    {"days": ["mon", "tue"], "time": "09:00", "setpoint": 18},
+    {"days": "mon", "time": "08:00", "furnace": "on"},
+    {"time": "22:00", "setpoint": 16, "furnace": False},
+]
+TZ = ZoneInfo("Europe/Amsterdam")
+
+
+def test_parse_groups_by_weekday() -> None:
+    """Entries are validated and sorted by time within each weekday."""
+    schedule = parse_schedule(SCHEDULE)
+
+    monday = schedule[0]
+    assert [transition.at for transition in monday] == [
+        time(7),
+        time(8),
+        time(9),
+        time(22),
+    ]
+    assert monday[0].values == (("setpoint", 21.0), ("fan_speed", FAN_SPEED_AUTO))
+    assert monday[1].values == (("furnace", True),)
+    assert [transition.at for transition in schedule[2]] == [time(7), time(22)]
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        [{"time": "07:00"}],
+        [{"time": "07:00", "setpoint": 50}],
+        [{"time": "07:00", "fan_speed": 5}],
+        [{"days": ["someday"], "time": "07:00", "setpoint": 20}],
+        [{"days": [], "time": "07:00", "setpoint": 20}],
+        [{"time": "25:00", "setpoint": 20}],
+    ],
+)
+def test_parse_invalid(raw: list[dict[str, Any]]) -> None:
+    """Entries without a field or with out-of-range values are rejected."""
+    with pytest.raises(vol.Invalid):
+        parse_schedule(raw)
+
+
+def test_occurrences_window() -> None:
+    """Occurrences after start up to and including end, in order across days."""
+    schedule = parse_schedule(SCHEDULE)
+    start = datetime(2026, 10, 19, 8, 0, tzinfo=TZ)  # Monday
+    end = datetime(2026, 10, 20, 9, 0, tzinfo=TZ)
+
+    assert [when for when, _ in occurrences(schedule, start, end)] == [
+        datetime(2026, 10, 19, 9, 0, tzinfo=TZ),
+        datetime(2026, 10, 19, 22, 0, tzinfo=TZ),
+        datetime(2026, 10, 20, 7, 0, tzinfo=TZ),
+        datetime(2026, 10, 20, 9, 0, tzinfo=TZ),
+    ]
+
+
+def test_occurrences_keep_wall_clock_across_dst() -> None:
+    """Transitions stay at their local time when the UTC offset changes."""
+    schedule = parse_schedule([{"time": "07:00", "setpoint": 20}])
+    start = datetime(2026, 10, 24, 0, 0, tzinfo=TZ)  # DST ends on the 25th
+    end = datetime(2026, 10, 25, 12, 0, tzinfo=TZ)
+
+    times = [when for when, _ in occurrences(schedule, start, end)]
+    assert [when.hour for when in times] == [7, 7]
+    assert [when.utcoffset().total_seconds() / 3600 for when in times] == [2, 1]
+
+
+def test_next_occurrence() -> None:
+    """The next occurrence is found across days, and None for an empty schedule."""
+    schedule = parse_schedule([{"days": "sun", "time": "10:00", "setpoint": 20}])
+    after = datetime(2026, 10, 19, 12, 0, tzinfo=TZ)
+
+    assert next_occurrence(schedule, after) == datetime(2026, 10, 25, 10, 0, tzinfo=TZ)
+    assert next_occurrence(parse_schedule([]), after) is None
+
+
+async def _start_scheduler(
+    hass: HomeAssistant, hass_storage: dict[str, Any], last_run: datetime
+) -> tuple[RixensScheduler, AsyncMock]:
+    """Start a scheduler that last ran at `last_run`, returning it and its intents mock."""
+    entry = MockConfigEntry(domain=DOMAIN, entry_id="test", options={CONF_SCHEDULE: SCHEDULE})
+    entry.add_to_hass(hass)
+    hass_storage[f"{DOMAIN}.test.schedule"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.test.schedule",
+        "data": {"last_run": last_run.isoformat()},
+    }
+    coordinator = MagicMock()
+    coordinator.intents.async_set = AsyncMock()
+    scheduler = RixensScheduler(hass, entry, coordinator)
+    await scheduler.async_load()
+    scheduler.async_start()
+    await hass.async_block_till_done()
+    return scheduler, coordinator.intents.async_set
+
+
+async def test_catch_up_collapses_transitions(
+    hass: HomeAssistant, hass_storage: dict[str, Any], freezer: FrozenDateTimeFactory
+) -> None:
+    """Missed transitions are applied once, with the latest value of each field."""
+    await hass.config.async_set_time_zone("Europe/Amsterdam")
+    freezer.move_to(datetime(2026, 10, 19, 10, 0, tzinfo=TZ))
+
+    scheduler, async_set = await _start_scheduler(
+        hass, hass_storage, datetime(2026, 10, 19, 6, 0, tzinfo=TZ)
+    )
+
+    async_set.assert_awaited_once_with(
+        {"setpoint": 18.0, "fan_speed": FAN_SPEED_AUTO, "furnace": True}, skip_matching=True
+    )
+    assert scheduler.next_transition == datetime(2026, 10, 19, 22, 0, tzinfo=TZ)
+    scheduler.async_stop()
+
+
+async def test_nothing_missed(
+    hass: HomeAssistant, hass_storage: dict[str, Any], freezer: FrozenDateTimeFactory
+) -> None:
+    """Without a transition since the last run nothing is written."""
+    await hass.config.async_set_time_zone("Europe/Amsterdam")
+    freezer.move_to(datetime(2026, 10, 19, 10, 0, tzinfo=TZ))
+
+    scheduler, async_set = await _start_scheduler(
+        hass, hass_storage, datetime(2026, 10, 19, 9, 30, tzinfo=TZ)
+    )
+
+    async_set.assert_not_awaited()
+    scheduler.async_stop()
+
+
+async def test_timer_applies_next_transition(
+    hass: HomeAssistant, hass_storage: dict[str, Any], freezer: FrozenDateTimeFactory
+) -> None:
+    """The single timer fires at the next transition and arms the one after."""
+    await hass.config.async_set_time_zone("Europe/Amsterdam")
+    freezer.move_to(datetime(2026, 10, 19, 10, 0, tzinfo=TZ))
+    scheduler, async_set = await _start_scheduler(
+        hass, hass_storage, datetime(2026, 10, 19, 9, 30, tzinfo=TZ)
+    )
+
+    freezer.move_to(datetime(2026, 10, 19, 22, 0, 1, tzinfo=TZ))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    async_set.assert_awaited_once_with({"setpoint": 16.0, "furnace": False}, skip_matching=True)
+    assert scheduler.next_transition == datetime(2026, 10, 20, 7, 0, tzinfo=TZ)
+    scheduler.async_stop()
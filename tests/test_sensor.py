@@ -0,0 +1,113 @@
+"""Tests for the deadband filtering of noisy sensors."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.rixens.api import RixensData
+from custom_components.rixens.const import (
+    CONF_DEADBAND,
+    CONF_MAX_SILENT_INTERVAL,
+    CONF_PRECISION,
+    DEFAULT_MAX_SILENT_INTERVAL,
+)
+from custom_components.rixens.sensor import SENSOR_DESCRIPTIONS, RixensSensor
+
+DESCRIPTIONS = {description.key: description for description in SENSOR_DESCRIPTIONS}
+
+
+def _sensor(status: RixensData, key: str, options: dict[str, Any] | None = None) -> RixensSensor:
+    """Return a sensor on a coordinator mock holding the example status."""
+    coordinator = MagicMock()
+    coordinator.data = status
+    coordinator.stale = False
+    coordinator.last_update_success = True
+    coordinator.config_entry.entry_id = "test"
+    coordinator.config_entry.options = options or {}
+    return RixensSensor(coordinator, DESCRIPTIONS[key])
+
+
+def _update(sensor: RixensSensor, **heater: Any) -> bool:
+    """Replace heater fields in the coordinator data and check for a publish."""
+    data = sensor.coordinator.data
+    sensor.coordinator.data = replace(data, heater=replace(data.heater, **heater))
+    return sensor._should_publish()
+
+
+@pytest.fixture
+def flame(status: RixensData) -> RixensSensor:
+    """Return the flame temperature sensor at 100.0 °C (deadband 2 °C or 1%)."""
+    data = replace(status, heater=replace(status.heater, flame_temp=100.0))
+    return _sensor(data, "flame_temperature")
+
+
+def test_changes_within_deadband_are_held(flame: RixensSensor) -> None:
+    """Small changes keep the published value."""
+    assert not _update(flame, flame_temp=101.5)
+    assert not _update(flame, flame_temp=98.1)
+    assert flame.native_value == 100.0
+
+
+def test_change_at_deadband_is_published(flame: RixensSensor) -> None:
+    """A change of at least the deadband publishes the new value."""
+    assert _update(flame, flame_temp=102.0)
+    assert flame.native_value == 102.0
+    # Measured against the newly published value
+    assert not _update(flame, flame_temp=103.5)
+
+
+def test_relative_deadband_for_large_values(status: RixensData) -> None:
+    """The relative deadband applies when it exceeds the absolute one."""
+    motor = _sensor(
+        replace(status, heater=replace(status.heater, burner_motor=5000)), "burner_motor"
+    )
+
+    # 2% of 5000 RPM is 100 RPM, above the 50 RPM absolute deadband
+    assert not _update(motor, burner_motor=5090)
+    assert _update(motor, burner_motor=5100)
+
+
+def test_silent_interval_forces_publish(flame: RixensSensor) -> None:
+    """A value unchanged for the maximum silent interval is published again."""
+    assert not _update(flame, flame_temp=100.5)
+    flame._published_at -= DEFAULT_MAX_SILENT_INTERVAL
+    assert _update(flame, flame_temp=100.5)
+    assert flame.native_value == 100.5
+
+
+def test_stale_change_is_published(flame: RixensSensor) -> None:
+    """A change of the stale flag publishes even an unchanged value."""
+    flame.coordinator.stale = True
+    assert _update(flame, flame_temp=100.0)
+    assert not _update(flame, flame_temp=100.0)
+
+
+def test_options_override_defaults(status: RixensData) -> None:
+    """Deadband, precision and silent interval come from the options when set."""
+    sensor = _sensor(
+        replace(status, heater=replace(status.heater, flame_temp=100.04)),
+        "flame_temperature",
+        {
+            f"flame_temperature_{CONF_DEADBAND}": 10.0,
+            f"flame_temperature_{CONF_PRECISION}": 0,
+            CONF_MAX_SILENT_INTERVAL: 60,
+        },
+    )
+
+    assert sensor.native_value == 100
+    assert sensor.suggested_display_precision == 0
+    assert not _update(sensor, flame_temp=109.0)
+    assert _update(sensor, flame_temp=110.4)
+    assert sensor.native_value == 110
+
+
+def test_sensors_without_deadband_follow_every_update(status: RixensData) -> None:
+    """Sensors without a deadband always show the latest value."""
+    sensor = _sensor(status, "outlet_temperature")
+    sensor.coordinator.data = replace(status, heater=replace(status.heater, outlet_temp=55.5))
+
+    assert sensor.native_value == 55.5
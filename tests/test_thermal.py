@@ -0,0 +1,99 @@
+"""Tests for the recursive least squares thermal model."""
+
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from custom_components.rixens.thermal import (
+    MAX_TRACE,
+    MIN_COOLING_SEGMENTS,
+    MIN_HEATING_SEGMENTS,
+    ThermalModel,
+)
+
+# dT/dt = OFFSET + LOSS * T + GAIN * u in °C per hour: 10 °C idle, 40 °C heating
+OFFSET, LOSS, GAIN = 1.0, -0.1, 3.0
+
+
+def _rate(temperature: float, heating: float) -> float:
+    """Return the true rate of change of the simulated space."""
+    return OFFSET + LOSS * temperature + GAIN * heating
+
+
+def _trained_model() -> ThermalModel:
+    """Return a model fitted to noise-free segments of the simulated space."""
+    rng = random.Random(1)
+    model = ThermalModel()
+    for index in range(200):
+        temperature = rng.uniform(5, 30)
+        heating = 1.0 if index % 2 else 0.0
+        model.update(temperature, heating, _rate(temperature, heating))
+    return model
+
+
+def test_recovers_parameters() -> None:
+    """The fit converges to the parameters of the simulated space."""
+    model = _trained_model()
+
+    assert model.theta == pytest.approx([OFFSET, LOSS, GAIN], abs=1e-3)
+    assert model.trained
+    info = model.as_dict()
+    assert info["idle_equilibrium"] == 10.0
+    assert info["heating_equilibrium"] == 40.0
+
+
+def test_follows_a_change() -> None:
+    """Forgetting lets the fit follow a change of the surroundings."""
+    model = _trained_model()
+    rng = random.Random(2)
+    for index in range(3000):
+        temperature = rng.uniform(5, 30)
+        heating = 1.0 if index % 2 else 0.0
+        # Colder outside: the idle equilibrium drops to 0 °C
+        model.update(temperature, heating, _rate(temperature, heating) - OFFSET)
+
+    assert model.theta == pytest.approx([0.0, LOSS, GAIN], abs=1e-2)
+
+
+def test_needs_heating_and_cooling_segments() -> None:
+    """A model is only trained after enough segments of both kinds."""
+    model = ThermalModel()
+    for _ in range(MIN_COOLING_SEGMENTS + 10):
+        model.update(20.0, 0.0, _rate(20.0, 0.0))
+    for _ in range(MIN_HEATING_SEGMENTS - 1):
+        model.update(20.0, 1.0, _rate(20.0, 1.0))
+    assert not model.trained
+    assert model.warm_up_time(15.0, 20.0) is None
+
+
+def test_unphysical_fit_is_not_trained() -> None:
+    """A fit that gains heat when idle or loses it when heating is not used."""
+    model = _trained_model()
+    model.theta = [OFFSET, 0.05, GAIN]
+    assert not model.trained
+    model.theta = [OFFSET, LOSS, -1.0]
+    assert not model.trained
+
+
+def test_covariance_stays_bounded_without_heating() -> None:
+    """A long idle stretch does not blow up the covariance."""
+    model = _trained_model()
+    for _ in range(20_000):
+        model.update(10.0, 0.0, 0.0)
+
+    p = model.covariance
+    assert p[0][0] + p[1][1] + p[2][2] < 2 * MAX_TRACE
+
+
+def test_warm_up_time() -> None:
+    """Warm-up time follows the exponential approach to the heating equilibrium."""
+    model = _trained_model()
+
+    hours = math.log((40 - 10) / (40 - 20)) / 0.1
+    assert model.warm_up_time(10.0, 20.0) == pytest.approx(hours * 3600, rel=1e-3)
+    assert model.warm_up_time(21.0, 20.0) == 0
+    # Heating can't sustain more than the heating equilibrium
+    assert model.warm_up_time(10.0, 45.0) is None